@@ -3,13 +3,17 @@ const path = require('path');
 
 const data = JSON.parse(fs.readFileSync(path.join(__dirname, 'public/agg_data/plant_monthly_aggregated.json'), 'utf8'));
 
+// 발전소/기업 키는 엔티티 ID이므로 표시 이름은 entities.json에서 찾는다
+const entities = JSON.parse(fs.readFileSync(path.join(__dirname, 'public/agg_data/entities.json'), 'utf8'));
+const nameOf = id => (entities[id] ? entities[id].name : id);
+
 console.log('=== Plant Monthly Aggregated Data ===\n');
 
 console.log('Solar plants:');
 Object.keys(data.solar).forEach(plant => {
   const months = Object.keys(data.solar[plant]);
   const total = Object.values(data.solar[plant]).reduce((a, b) => a + b, 0);
-  console.log(`  ${plant}: ${months.length} months, Total: ${total.toFixed(2)} GWh`);
+  console.log(`  ${nameOf(plant)}: ${months.length} months, Total: ${total.toFixed(2)} GWh`);
   if (months.length === 12) {
     console.log(`    Months: All 12 months present ✓`);
   } else {
@@ -21,7 +25,7 @@ console.log('\nWind plants:');
 Object.keys(data.wind).forEach(plant => {
   const months = Object.keys(data.wind[plant]);
   const total = Object.values(data.wind[plant]).reduce((a, b) => a + b, 0);
-  console.log(`  ${plant}: ${months.length} months, Total: ${total.toFixed(2)} GWh`);
+  console.log(`  ${nameOf(plant)}: ${months.length} months, Total: ${total.toFixed(2)} GWh`);
   if (months.length === 12) {
     console.log(`    Months: All 12 months present ✓`);
   } else {
@@ -1,40 +1,23 @@
-import csv
-from datetime import datetime, timedelta
-import random
+import os
+import sys
 
-# 2024년 1월 데이터 생성
-start_date = datetime(2024, 1, 1)
-end_date = datetime(2024, 1, 31, 23, 0)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from synthetic_data import make_rng, time_index, solar_series, wind_series, write_series_csv
 
-# 태양광 발전소 3 데이터
-with open('public/sample_data/solar_plant3.csv', 'w', newline='') as f:
-    writer = csv.writer(f)
-    writer.writerow(['datetime', 'type', 'plant_name', 'value'])
-    
-    current_date = start_date
-    while current_date <= end_date:
-        hour = current_date.hour
-        # 태양광은 낮 시간대에만 발전
-        if 6 <= hour <= 18:
-            value = random.uniform(120, 450) * 1000000  # kWh
-        else:
-            value = 0
-        writer.writerow([current_date.strftime('%Y-%m-%d %H:%M'), 'solar', 'solar_plant3', value])
-        current_date += timedelta(hours=1)
+# 2024년 1월 데이터 생성 (시드 고정으로 재현 가능)
+# 대규모 데이터셋은 scripts/generate_loadtest_data.py 프리셋 사용
+index = time_index('2024-01-01 00:00', '2024-01-31 23:00')
+rng = make_rng(seed=43)
 
-# 풍력 발전소 3 데이터
-with open('public/sample_data/wind_plant3.csv', 'w', newline='') as f:
-    writer = csv.writer(f)
-    writer.writerow(['datetime', 'type', 'plant_name', 'value'])
-    
-    current_date = start_date
-    while current_date <= end_date:
-        # 풍력은 24시간 발전 가능
-        value = random.uniform(140, 580) * 1000000
-        writer.writerow([current_date.strftime('%Y-%m-%d %H:%M'), 'wind', 'wind_plant3', value])
-        current_date += timedelta(hours=1)
+# 태양광 발전소 3 데이터 (낮 시간대에만 발전, kWh)
+write_series_csv('public/sample_data/solar_plant3.csv', index, 'solar', 'solar_plant3',
+                 solar_series(index, rng, 120, 450))
+
+# 풍력 발전소 3 데이터 (24시간 발전 가능)
+write_series_csv('public/sample_data/wind_plant3.csv', index, 'wind', 'wind_plant3',
+                 wind_series(index, rng, 140, 580))
 
 print("추가 발전소 데이터 생성 완료!")
 print("생성된 파일:")
 print("- public/sample_data/solar_plant3.csv")
-print("- public/sample_data/wind_plant3.csv")
\ No newline at end of file
+print("- public/sample_data/wind_plant3.csv")
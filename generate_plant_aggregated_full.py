@@ -1,5 +1,13 @@
 import json
+import os
 import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from partitions import month_keys
+
+# 가장 최근 연도 파티션의 데이터 기간에 속한 월 ("YYYY-MM")
+MONTH_KEYS = month_keys()
 
 def generate_plant_monthly_full_year():
     """발전소별 12개월 전체 월별 집계"""
@@ -18,8 +26,8 @@ def generate_plant_monthly_full_year():
     # 태양광 발전소별 12개월 데이터
     for plant in solar_plants:
         monthly_data["solar"][plant] = {}
-        for month in range(1, 13):
-            month_key = f"2024-{month:02d}"
+        for month_key in MONTH_KEYS:
+            month = int(month_key[5:])
             # 계절별 발전량 변화 반영
             if month in [12, 1, 2]:  # 겨울
                 base_value = random.uniform(2000, 3500)
@@ -34,16 +42,13 @@ def generate_plant_monthly_full_year():
     # 풍력 발전소별 12개월 데이터
     for plant in wind_plants:
         monthly_data["wind"][plant] = {}
-        for month in range(1, 13):
-            month_key = f"2024-{month:02d}"
+        for month_key in MONTH_KEYS:
             # 풍력은 계절 변화가 적음
             base_value = random.uniform(4000, 6500)
             monthly_data["wind"][plant][month_key] = base_value
     
     # 월별 총 공급량 및 RE100 달성률
-    for month in range(1, 13):
-        month_key = f"2024-{month:02d}"
-        
+    for month_key in MONTH_KEYS:
         # 총 태양광
         total_solar = sum(monthly_data["solar"][plant][month_key] for plant in solar_plants)
         # 총 풍력
@@ -74,8 +79,7 @@ def generate_plant_monthly_full_year():
     monthly_data["solar"]["total"] = {}
     monthly_data["wind"]["total"] = {}
     
-    for month in range(1, 13):
-        month_key = f"2024-{month:02d}"
+    for month_key in MONTH_KEYS:
         monthly_data["solar"]["total"][month_key] = sum(monthly_data["solar"][plant][month_key] for plant in solar_plants)
         monthly_data["wind"]["total"][month_key] = sum(monthly_data["wind"][plant][month_key] for plant in wind_plants)
     
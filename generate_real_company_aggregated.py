@@ -1,18 +1,21 @@
-import csv
 import json
+import os
 import random
+import sys
 from collections import defaultdict
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+from aggregation_engine import integrated_csv
+from entity_registry import entity_keys
+from partitions import month_keys
+from rollup_cube import RollupCube, build_weekly_data
+from streaming_reader import collect_companies
+
 def get_actual_companies():
-    """실제 CSV 파일에서 기업명 추출"""
-    companies = set()
+    """가장 최근 연도 파티션 CSV에서 기업명 추출 (청크 단위 스트리밍, type/plant_name 컬럼만 읽음)"""
     try:
-        with open('public/sample_data/sample_data_integrated_2024_integrated.csv', 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if row['type'] == 'demand' and row['plant_name']:
-                    companies.add(row['plant_name'].strip())
-    except:
+        companies = collect_companies(integrated_csv)
+    except Exception:
         # 파일이 없으면 기본 기업명 사용
         companies = {'LSMnM', 'LS엘앤에프배터리솔루션', 'OCI', 'YH에너지', '건설기계연구원', 
                     '군산시수산가공단지', '군산시자동차수출복합센터', '군산자동차무역센터', '네모이엔지', '다스코'}
@@ -27,7 +30,8 @@ def generate_company_hourly_aggregated():
     
     hourly_company_data = {}
     
-    for company in companies:
+    # 기업 키는 엔티티 레지스트리 ID
+    for company in filter(None, entity_keys('demand', companies)):
         hourly_company_data[company] = {}
         for hour in range(24):
             if 9 <= hour <= 18:  # 업무 시간
@@ -48,70 +52,48 @@ def generate_company_monthly_aggregated():
     
     monthly_company_data = {}
     
-    for company in companies:
+    for company in filter(None, entity_keys('demand', companies)):
         monthly_company_data[company] = {}
-        for month in range(1, 13):
-            month_key = f"2024-{month:02d}"
+        for month_key in month_keys():
             monthly_company_data[company][month_key] = random.uniform(1500, 4000)  # GWh
     
     return monthly_company_data
 
 def generate_weekly_data_full_year():
-    """12개월 전체 주차별 데이터 생성"""
-    weekly_data = {}
-    
-    months = [
-        ("1월", 31), ("2월", 29), ("3월", 31), ("4월", 30), ("5월", 31), ("6월", 30),
-        ("7월", 31), ("8월", 31), ("9월", 30), ("10월", 31), ("11월", 30), ("12월", 31)
-    ]
-    
-    for month_name, days in months:
-        weekly_data[month_name] = []
-        
-        # 각 월의 주차 계산 (간단히 7일씩 묶어서 계산)
-        week_num = 1
-        start_day = 1
-        
-        while start_day <= days:
-            end_day = min(start_day + 6, days)
-            week_label = f"{month_name} {week_num}주차"
-            start_date = f"2024-{months.index((month_name, days)) + 1:02d}-{start_day:02d}"
-            end_date = f"2024-{months.index((month_name, days)) + 1:02d}-{end_day:02d}"
-            
-            weekly_data[month_name].append({
-                "week": week_num,
-                "label": week_label,
-                "start": start_date,
-                "end": end_date
-            })
-            
-            start_day += 7
-            week_num += 1
-    
-    return weekly_data
+    """12개월 전체 주차별 데이터 생성 (통합 CSV가 있으면 롤업 큐브로 주차별 합계 포함, 연도는 데이터 기준)"""
+    try:
+        cube = RollupCube.from_csv(integrated_csv)
+    except FileNotFoundError:
+        cube = None
+    return build_weekly_data(cube)
+
+def main():
+    print("실제 기업명으로 집계 데이터 재생성 중...")
+
+    # 12개월 전체 주차별 데이터
+    weekly_data = generate_weekly_data_full_year()
+    with open('public/agg_data/weekly_data.json', 'w', encoding='utf-8') as f:
+        json.dump(weekly_data, f, ensure_ascii=False, indent=2)
+    print("12개월 전체 주차별 데이터 재생성 완료")
 
-print("실제 기업명으로 집계 데이터 재생성 중...")
+    # 기업별 시간대별 집계
+    hourly_company_data = generate_company_hourly_aggregated()
+    with open('public/agg_data/company_hourly_aggregated.json', 'w', encoding='utf-8') as f:
+        json.dump(hourly_company_data, f, ensure_ascii=False, indent=2)
+    print("기업별 시간대별 집계 데이터 재생성 완료")
 
-# 12개월 전체 주차별 데이터
-weekly_data = generate_weekly_data_full_year()
-with open('public/agg_data/weekly_data.json', 'w', encoding='utf-8') as f:
-    json.dump(weekly_data, f, ensure_ascii=False, indent=2)
-print("12개월 전체 주차별 데이터 재생성 완료")
+    # 기업별 월별 집계
+    monthly_company_data = generate_company_monthly_aggregated()
+    with open('public/agg_data/company_monthly_aggregated.json', 'w', encoding='utf-8') as f:
+        json.dump(monthly_company_data, f, ensure_ascii=False, indent=2)
+    print("기업별 월별 집계 데이터 재생성 완료")
 
-# 기업별 시간대별 집계
-hourly_company_data = generate_company_hourly_aggregated()
-with open('public/agg_data/company_hourly_aggregated.json', 'w', encoding='utf-8') as f:
-    json.dump(hourly_company_data, f, ensure_ascii=False, indent=2)
-print("기업별 시간대별 집계 데이터 재생성 완료")
+    print("\n실제 기업명 및 12개월 전체로 집계 데이터 재생성 완료!")
+    print("수정된 파일:")
+    print("- public/agg_data/weekly_data.json (12개월 전체)")
+    print("- public/agg_data/company_hourly_aggregated.json (실제 73개 기업)")
+    print("- public/agg_data/company_monthly_aggregated.json (실제 73개 기업, 12개월 전체)")
 
-# 기업별 월별 집계
-monthly_company_data = generate_company_monthly_aggregated()
-with open('public/agg_data/company_monthly_aggregated.json', 'w', encoding='utf-8') as f:
-    json.dump(monthly_company_data, f, ensure_ascii=False, indent=2)
-print("기업별 월별 집계 데이터 재생성 완료")
 
-print("\n실제 기업명 및 12개월 전체로 집계 데이터 재생성 완료!")
-print("수정된 파일:")
-print("- public/agg_data/weekly_data.json (12개월 전체)")
-print("- public/agg_data/company_hourly_aggregated.json (실제 73개 기업)")
-print("- public/agg_data/company_monthly_aggregated.json (실제 73개 기업, 12개월 전체)")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
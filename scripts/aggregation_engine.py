@@ -0,0 +1,259 @@
+"""통합 CSV 단일 패스 집계 엔진
+
+(type, plant_name, month, hour) 4개 키로 한 번만 groupby 하여 셀 단위 합계/개수를
+만들고, 월별/기업별 월별/발전소별 시간대별/요약 통계를 모두 이 결과에서 파생한다.
+발전소나 기업마다 전체 DataFrame을 다시 필터링하지 않는다.
+
+셀 집계는 원본 CSV의 plant_name 값을 그대로 쓰고, 산출물의 발전소/기업 키는
+엔티티 레지스트리(entity_registry.py)의 ID 문자열로 바꿔 저장한다.
+"""
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from csv_cache import load_csv
+from dense_format import write_dense
+from entity_registry import entity_keys
+from partitions import default_partition
+from pipeline_metrics import stage
+
+# 프로젝트 루트 설정
+project_root = Path(__file__).resolve().parent.parent
+sample_data_dir = project_root / "public" / "sample_data"
+agg_data_dir = project_root / "public" / "agg_data"
+# 기본 통합 CSV는 가장 최근 연도 파티션 (partitions.py)
+integrated_csv = default_partition(sample_data_dir)
+
+# kWh -> GWh 변환 계수
+KWH_PER_GWH = 1_000_000
+
+# 셀 집계 키 (발전소/기업 구분 없이 plant_name 컬럼 사용)
+GROUP_KEYS = ['type', 'plant_name', 'month', 'hour']
+SUPPLY_TYPES = ['solar', 'wind']
+
+# 산출물 이름 -> 원본 값 기준 agg_data 파일명
+ORIGINAL_OUTPUT_FILES = {
+    'monthly_aggregated': "monthly_aggregated_original.json",
+    'company_monthly_aggregated': "company_monthly_aggregated_original.json",
+    'plant_hourly_aggregated': "plant_hourly_aggregated_original.json",
+    'summary_stats': "summary_stats_original.json",
+}
+
+
+def load_integrated(csv_file=integrated_csv, use_cache=True):
+    """통합 CSV 파일 로드 (컬럼형 캐시 사용, datetime 인덱스)"""
+    return load_csv(csv_file, use_cache=use_cache)
+
+
+def _datetime_values(df):
+    """datetime 컬럼 또는 DatetimeIndex를 Series로 반환"""
+    if 'datetime' in df.columns:
+        return df['datetime']
+    return df.index.to_series(index=df.index)
+
+
+def aggregate_cells(df):
+    """(type, plant_name, month, hour) 셀별 GWh 합계와 개수를 한 번의 groupby로 계산"""
+    with stage('aggregate') as info:
+        info['rows'] = len(df)
+        return _aggregate_cells(df)
+
+
+def _aggregate_cells(df):
+    dt = _datetime_values(df)
+    # 월 키는 정수(YYYYMM)로 묶은 뒤 결과 셀에서만 문자열로 변환 (행 단위 strftime 회피)
+    month_id = (dt.dt.year * 100 + dt.dt.month).rename('month')
+    hour = dt.dt.hour.rename('hour')
+    value_gwh = df['value'].astype('float64') / KWH_PER_GWH
+
+    cells = (
+        value_gwh
+        .groupby([df['type'], df['plant_name'], month_id, hour], observed=True, sort=False)
+        .agg(['sum', 'count'])
+        .reset_index()
+    )
+    cells.columns = GROUP_KEYS + ['sum', 'count']
+    cells['type'] = cells['type'].astype(str)
+    cells['plant_name'] = cells['plant_name'].astype(str).str.strip()
+    month_labels = {m: f"{m // 100}-{m % 100:02d}" for m in cells['month'].unique()}
+    cells['month'] = cells['month'].map(month_labels)
+    return cells
+
+
+def merge_cells(*cell_frames):
+    """여러 셀 집계 결과를 합계/개수 기준으로 병합"""
+    frames = [c for c in cell_frames if c is not None and len(c) > 0]
+    if not frames:
+        return pd.DataFrame(columns=GROUP_KEYS + ['sum', 'count'])
+    merged = pd.concat(frames, ignore_index=True)
+    return merged.groupby(GROUP_KEYS, sort=False, as_index=False)[['sum', 'count']].sum()
+
+
+def _monthly_series(cells):
+    """(type, plant_name, month) 월별 합계 Series"""
+    return cells.groupby(['type', 'plant_name', 'month'], sort=False)['sum'].sum()
+
+
+def _entity_dict(series, energy_type):
+    """(원본 이름, key) 2단 인덱스 Series를 {엔티티 ID: {key: value}} 로 변환
+
+    엔티티는 원본 데이터에 처음 나온 순서, 월/시간 키는 정렬 순서를 따른다.
+    레지스트리에 없는 엔티티는 빠진다 (합계에는 포함).
+    """
+    groups = list(series.groupby(level=0, sort=False))
+    keys = entity_keys(energy_type, [name for name, _ in groups])
+    return {
+        key: values.droplevel(0).sort_index().to_dict()
+        for key, (_, values) in zip(keys, groups)
+        if key is not None
+    }
+
+
+def build_monthly_aggregated(cells):
+    """월별 집계 (monthly_aggregated.json)"""
+    monthly = _monthly_series(cells)
+    monthly_agg = {
+        'solar': {},
+        'wind': {},
+        'demand': {}
+    }
+    types = monthly.index.get_level_values('type')
+
+    for energy_type in SUPPLY_TYPES:
+        if energy_type not in types:
+            continue
+        plant_monthly = monthly.loc[energy_type]
+        # 발전소별 월별 합계 + 전체 합계
+        monthly_agg[energy_type] = _entity_dict(plant_monthly, energy_type)
+        monthly_agg[energy_type]['total'] = plant_monthly.groupby(level='month').sum().to_dict()
+
+    # 수요 데이터 (전체 기업 합계)
+    if 'demand' in types:
+        monthly_agg['demand'] = monthly.loc['demand'].groupby(level='month').sum().to_dict()
+
+    return monthly_agg
+
+
+def build_company_monthly(cells):
+    """기업별 월별 집계 (company_monthly_aggregated.json)"""
+    monthly = _monthly_series(cells)
+    if 'demand' not in monthly.index.get_level_values('type'):
+        return {}
+    return _entity_dict(monthly.loc['demand'], 'demand')
+
+
+def build_plant_hourly(cells):
+    """발전소별 시간대별 평균 (plant_hourly_aggregated.json)
+
+    평균은 셀 합계/개수로부터 계산하므로 원본 행 단위 평균과 동일하다.
+    """
+    plant_hourly = {
+        'solar': {},
+        'wind': {}
+    }
+    supply = cells[cells['type'].isin(SUPPLY_TYPES)]
+    hourly = supply.groupby(['type', 'plant_name', 'hour'], sort=False)[['sum', 'count']].sum()
+    hourly_avg = hourly['sum'] / hourly['count']
+
+    for energy_type in SUPPLY_TYPES:
+        if energy_type in hourly_avg.index.get_level_values('type'):
+            plant_hourly[energy_type] = _entity_dict(hourly_avg.loc[energy_type], energy_type)
+    return plant_hourly
+
+
+def build_company_hourly(cells):
+    """기업별 시간대별 평균 전력사용량 (company_hourly_aggregated.json)"""
+    demand = cells[cells['type'] == 'demand']
+    hourly = demand.groupby(['plant_name', 'hour'], sort=False)[['sum', 'count']].sum()
+    return _entity_dict(hourly['sum'] / hourly['count'], 'demand')
+
+
+def annual_totals(monthly_agg):
+    """월별 집계에서 연간 태양광/풍력/수요 합계 계산"""
+    total_solar = sum(sum(plant.values())
+                      for name, plant in monthly_agg['solar'].items()
+                      if name != 'total')
+    total_wind = sum(sum(plant.values())
+                     for name, plant in monthly_agg['wind'].items()
+                     if name != 'total')
+    total_demand = sum(monthly_agg['demand'].values())
+    return total_solar, total_wind, total_demand
+
+
+def build_summary_stats(monthly_agg, note="Original values from integrated CSV (no 10% adjustment)"):
+    """요약 통계 (summary_stats.json)"""
+    total_solar, total_wind, total_demand = annual_totals(monthly_agg)
+    total_supply = total_solar + total_wind
+    re100_rate = (total_supply / total_demand * 100) if total_demand > 0 else 0
+
+    return {
+        "annual_totals": {
+            "solar": round(total_solar, 2),
+            "wind": round(total_wind, 2),
+            "supply": round(total_supply, 2),
+            "demand": round(total_demand, 2),
+            "re100_rate": round(re100_rate, 2)
+        },
+        "note": note
+    }
+
+
+def build_plant_capacity(monthly_agg, capacities):
+    """발전소별 설비용량과 연간 발전량 (plant_capacity.json)
+
+    capacities: {엔티티 ID: 설비용량(GW)}
+    """
+    plant_capacity = {}
+    for energy_type in SUPPLY_TYPES:
+        plant_capacity[energy_type] = {
+            plant: {
+                "capacity_gw": capacities.get(plant),
+                "generation_gwh": round(sum(values.values()), 2)
+            }
+            for plant, values in monthly_agg.get(energy_type, {}).items()
+            if plant != 'total'
+        }
+    return plant_capacity
+
+
+def build_outputs(cells):
+    """셀 집계 결과 하나에서 모든 집계 산출물 생성"""
+    monthly_agg = build_monthly_aggregated(cells)
+    return {
+        'monthly_aggregated': monthly_agg,
+        'company_monthly_aggregated': build_company_monthly(cells),
+        'plant_hourly_aggregated': build_plant_hourly(cells),
+        'company_hourly_aggregated': build_company_hourly(cells),
+        'summary_stats': build_summary_stats(monthly_agg),
+    }
+
+
+def write_json(data, output_file, dense=True):
+    """집계 결과를 JSON 파일로 저장 (행렬 형태면 dense 바이너리/압축본도 함께 저장)"""
+    output_file = Path(output_file)
+    with stage('serialize', output_file.name) as info:
+        payload = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        info['bytes'] = len(payload)
+    with stage('write', output_file.name) as info:
+        output_file.write_bytes(payload)
+        info['bytes'] = len(payload)
+    if dense:
+        write_dense(data, output_file)
+
+
+def year_output_dir(year, output_dir=agg_data_dir):
+    """연도 파티션별 집계 산출물 폴더 (agg_data/<연도>)"""
+    return Path(output_dir) / str(year)
+
+
+def write_outputs(outputs, output_dir=agg_data_dir, file_names=ORIGINAL_OUTPUT_FILES):
+    """build_outputs 결과를 agg_data 파일로 저장하고 저장된 경로 목록 반환"""
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    written = []
+    for name, file_name in file_names.items():
+        if name in outputs:
+            output_file = Path(output_dir) / file_name
+            write_json(outputs[name], output_file)
+            written.append(output_file)
+    return written
@@ -0,0 +1,281 @@
+"""집계 경로 벤치마크
+
+부하 테스트 데이터셋(generate_loadtest_data 프리셋)을 크기별로 만들어 두고
+월별 / 기업별 월별 / 발전소별 시간대별 / 요약 통계 / 10% 조정(시나리오) 경로를
+각각 새 프로세스에서 실행하여 실행 시간, CPU 시간, 초당 처리 행 수, 최대 RSS를 측정한다.
+모든 경로가 같은 통합 CSV 스트리밍 적재를 거치므로 적재 시간(load_s)과 경로별 집계
+시간(wall_s)을 따로 기록한다. 결과는 JSON 이력 파일에 누적되고, 직전 실행과 비교해
+적재나 경로가 느려졌거나 측정에 실패하면 종료 코드 1로 끝난다 (--no-fail로 끔).
+
+사용 예:
+    python scripts/benchmark_aggregation.py                    # small, medium
+    python scripts/benchmark_aggregation.py --datasets small medium large --repeat 3
+"""
+import argparse
+import json
+import multiprocessing
+import platform
+import queue as queue_module
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from aggregation_engine import (
+    project_root, build_monthly_aggregated, build_company_monthly,
+    build_plant_hourly, build_summary_stats, merge_cells,
+)
+from generate_loadtest_data import DEFAULT_START_YEAR, PRESETS, default_output_root, generate
+from partitions import partition_file
+from pipeline_metrics import format_mb, peak_rss_mb
+from streaming_reader import aggregate_stream
+
+history_file = project_root / "benchmarks" / "aggregation_history.json"
+
+# 직전 실행보다 이 비율 이상 느려지면 회귀로 표시
+REGRESSION_THRESHOLD = 0.20
+# 측정 잡음으로 회귀가 나지 않도록, 늘어난 시간이 이보다 짧으면 회귀로 보지 않음
+REGRESSION_MIN_SECONDS = 0.1
+# 경로 하나의 최대 실행 시간 (넘으면 자식 프로세스를 종료하고 실패로 기록)
+CASE_TIMEOUT_SECONDS = 1800
+
+
+def _load_cells(csv_files):
+    """연도 파티션들을 스트리밍 집계해 셀 집계와 총 행 수 반환"""
+    aggregators = [aggregate_stream(csv_file) for csv_file in csv_files]
+    return merge_cells(*(a.result() for a in aggregators)), sum(a.rows for a in aggregators)
+
+
+def _case_monthly(cells):
+    build_monthly_aggregated(cells)
+
+
+def _case_company_monthly(cells):
+    build_company_monthly(cells)
+
+
+def _case_plant_hourly(cells):
+    build_plant_hourly(cells)
+
+
+def _case_summary_stats(cells):
+    build_summary_stats(build_monthly_aggregated(cells))
+
+
+def _case_adjustment_10pct(cells):
+    """10% 조정 경로 ('10pct' 시나리오를 기준 집계에 메모리에서 적용)"""
+    from scenarios import SCENARIOS, apply_company_monthly, apply_entities, apply_monthly
+
+    definition = SCENARIOS['10pct']
+    company_monthly = build_company_monthly(cells)
+    monthly = apply_monthly(build_monthly_aggregated(cells), definition, company_monthly)
+    apply_company_monthly(company_monthly, definition)
+    apply_entities(build_plant_hourly(cells), definition)
+    build_summary_stats(monthly)
+
+
+CASES = {
+    'monthly': _case_monthly,
+    'company_monthly': _case_company_monthly,
+    'plant_hourly': _case_plant_hourly,
+    'summary_stats': _case_summary_stats,
+    'adjustment_10pct': _case_adjustment_10pct,
+}
+
+
+def _run_case(case, csv_files, queue):
+    """자식 프로세스에서 공통 적재와 경로 하나를 각각 측정해 전달"""
+    import contextlib
+    import io
+    from entity_registry import registry_file, use_registry
+
+    # 부하 테스트 엔티티는 데이터셋 폴더의 레지스트리에 두고 public/sample_data 레지스트리는 건드리지 않음
+    use_registry(Path(csv_files[0]).parent / registry_file.name)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        load_started = time.perf_counter()
+        cells, rows = _load_cells(csv_files)
+        wall_started = time.perf_counter()
+        cpu_started = time.process_time()
+        CASES[case](cells)
+    queue.put({
+        'load_s': wall_started - load_started,
+        'wall_s': time.perf_counter() - wall_started,
+        'cpu_s': time.process_time() - cpu_started,
+        'rows': rows,
+        'peak_rss_mb': peak_rss_mb(),
+    })
+
+
+def _max_rss(samples):
+    """반복 측정의 최대 RSS (MB, 측정할 수 없는 플랫폼이면 None)"""
+    values = [s['peak_rss_mb'] for s in samples if s['peak_rss_mb'] is not None]
+    return round(max(values), 1) if values else None
+
+
+def measure(case, csv_files, timeout=CASE_TIMEOUT_SECONDS):
+    """새 프로세스에서 측정 (프로세스별 최대 RSS를 분리하기 위함)
+
+    자식 프로세스가 결과 없이 끝나거나(메모리 부족, 예외) 제한 시간을 넘기면
+    기다리지 않고 {'error': ...} 를 반환한다.
+    """
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_run_case, args=(case, [str(p) for p in csv_files], queue))
+    process.start()
+    deadline = time.monotonic() + timeout
+    result = None
+    while result is None:
+        try:
+            result = queue.get(timeout=max(0.01, min(1.0, deadline - time.monotonic())))
+        except queue_module.Empty:
+            if not process.is_alive():
+                # 종료 직전에 넣은 결과가 있을 수 있으므로 한 번 더 확인
+                try:
+                    result = queue.get(timeout=1.0)
+                except queue_module.Empty:
+                    process.join()
+                    return {'error': f"자식 프로세스가 결과 없이 종료됨 (exitcode {process.exitcode})"}
+            elif time.monotonic() > deadline:
+                process.terminate()
+                process.join()
+                return {'error': f"제한 시간 {timeout}s 초과"}
+    process.join()
+    return result
+
+
+def ensure_dataset(preset):
+    """프리셋 데이터셋이 없으면 생성하고 연도별 통합 CSV 파티션 경로 목록 반환"""
+    output_dir = default_output_root / preset
+    years = range(DEFAULT_START_YEAR, DEFAULT_START_YEAR + PRESETS[preset]['years'])
+    partitions = [partition_file(year, output_dir) for year in years]
+    if not all(path.exists() for path in partitions):
+        print(f"데이터셋 생성 중: {preset}")
+        generate(output_dir, **PRESETS[preset])
+    return partitions
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path=history_file):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def save_history(history, path=history_file):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, ensure_ascii=False, indent=2)
+
+
+def _previous_results(history):
+    """(dataset, case)별 직전 실행 결과 (적재/경로 시간을 나눠 기록한 실행만)"""
+    previous = {}
+    for run in history:
+        for result in run['results']:
+            if not result.get('error') and 'load_s' in result:
+                previous[(result['dataset'], result['case'])] = result
+    return previous
+
+
+def compare(result, before, threshold=REGRESSION_THRESHOLD, min_seconds=REGRESSION_MIN_SECONDS):
+    """직전 결과 대비 적재/경로 시간 변화 (비교 문자열, 회귀 여부)"""
+    if not before:
+        return "", False
+    notes, regressed = [], False
+    for field, label in [('wall_s', '경로'), ('load_s', '적재')]:
+        if before.get(field):
+            change = result[field] / before[field] - 1
+            notes.append(f"{label} {change:+.1%}")
+            regressed |= change > threshold and result[field] - before[field] > min_seconds
+    return ", ".join(notes) + (" [REGRESSION]" if regressed else ""), regressed
+
+
+def run_benchmarks(datasets, cases, repeat=1, timeout=CASE_TIMEOUT_SECONDS):
+    results = []
+    for dataset in datasets:
+        csv_files = ensure_dataset(dataset)
+        for case in cases:
+            samples = [measure(case, csv_files, timeout) for _ in range(repeat)]
+            failed = next((s for s in samples if 'error' in s), None)
+            if failed:
+                results.append({'dataset': dataset, 'case': case, 'error': failed['error']})
+                continue
+            load = statistics.median(s['load_s'] for s in samples)
+            wall = statistics.median(s['wall_s'] for s in samples)
+            rows = samples[0]['rows']
+            results.append({
+                'dataset': dataset,
+                'case': case,
+                'rows': rows,
+                'load_s': round(load, 4),
+                'wall_s': round(wall, 4),
+                'cpu_s': round(statistics.median(s['cpu_s'] for s in samples), 4),
+                # 초당 처리 행 수는 적재를 포함한 전체 경로 기준
+                'rows_per_s': round(rows / (load + wall)) if load + wall > 0 else None,
+                'peak_rss_mb': _max_rss(samples),
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="집계 경로 벤치마크")
+    parser.add_argument('--datasets', nargs='+', default=['small', 'medium'], choices=sorted(PRESETS))
+    parser.add_argument('--cases', nargs='+', default=list(CASES), choices=list(CASES))
+    parser.add_argument('--repeat', type=int, default=1, help="경로별 반복 횟수 (중앙값 기록)")
+    parser.add_argument('--history', default=str(history_file), help="결과 이력 JSON 파일")
+    parser.add_argument('--no-save', action='store_true', help="이력 파일에 기록하지 않음")
+    parser.add_argument('--timeout', type=float, default=CASE_TIMEOUT_SECONDS, help="경로별 최대 실행 시간 (초)")
+    parser.add_argument('--no-fail', action='store_true', help="실패나 회귀가 있어도 종료 코드 0")
+    args = parser.parse_args()
+
+    history_path = Path(args.history)
+    history = load_history(history_path)
+    previous = _previous_results(history)
+
+    results = run_benchmarks(args.datasets, args.cases, args.repeat, args.timeout)
+
+    print(f"{'dataset':<8} {'case':<18} {'rows':>12} {'load(s)':>9} {'path(s)':>9} {'rows/s':>12} {'RSS':>10}  비교")
+    regressions = 0
+    failures = 0
+    for result in results:
+        if result.get('error'):
+            print(f"{result['dataset']:<8} {result['case']:<18} [FAIL] {result['error']}")
+            failures += 1
+            continue
+        note, regressed = compare(result, previous.get((result['dataset'], result['case'])))
+        regressions += regressed
+        print(f"{result['dataset']:<8} {result['case']:<18} {result['rows']:>12,} {result['load_s']:>9.3f} "
+              f"{result['wall_s']:>9.3f} {result['rows_per_s'] or 0:>12,} {format_mb(result['peak_rss_mb']):>10}  {note}")
+
+    if not args.no_save:
+        history.append({
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'git_commit': _git_commit(),
+            'python': platform.python_version(),
+            'results': results,
+        })
+        save_history(history, history_path)
+        print(f"\n[OK] 결과 기록: {history_path}")
+
+    if failures:
+        print(f"[FAIL] {failures}개 경로가 측정에 실패했습니다.")
+    if regressions:
+        print(f"[FAIL] {regressions}개 경로가 직전 실행보다 {REGRESSION_THRESHOLD:.0%} 이상 느려졌습니다.")
+    if (failures or regressions) and not args.no_fail:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
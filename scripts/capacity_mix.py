@@ -0,0 +1,174 @@
+"""발전소 설비용량 조합 최적화 (RE100 목표 대비 파레토 전선)
+
+발전소별 시간별 발전량을 현재 설비용량으로 나눈 정규화 프로파일(GW당 GWh)을 만들고,
+후보 용량 조합 [후보 x 발전소] 행렬과 프로파일 [발전소 x 시간]의 행렬 곱 한 번으로
+모든 후보의 시간별 공급을 계산한다. 후보마다 총 설비용량, 연간(볼륨) RE100,
+시간 단위 매칭 RE100을 구하고, 용량은 작고 두 RE100은 높은 비지배 조합(파레토 전선)과
+목표 RE100별 최소 용량 조합을 public/agg_data/capacity_mix_pareto.json으로 저장한다.
+
+CSV를 다시 쓰지 않고 용량만 바꿔 보므로 수천 개 조합도 몇 초 안에 평가된다.
+
+사용 예:
+    python scripts/capacity_mix.py
+    python scripts/capacity_mix.py --candidates 20000 --max-factor 4 --seed 7
+"""
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+
+from aggregation_engine import agg_data_dir, integrated_csv, SUPPLY_TYPES, write_json
+from hourly_matching import load_hourly_matrix
+from plant_registry import capacities
+
+output_file = agg_data_dir / "capacity_mix_pareto.json"
+
+DEFAULT_CANDIDATES = 5000
+# 발전소별 후보 용량 범위: 0 ~ 현재 용량 x MAX_FACTOR
+DEFAULT_MAX_FACTOR = 3.0
+DEFAULT_SEED = 0
+TARGET_RATES = [80, 90, 95, 99]
+
+# 한 번에 계산할 후보 수 ([후보 x 시간] 배열 메모리 상한)
+CANDIDATE_CHUNK = 512
+
+
+def normalized_profiles(matrix, capacities):
+    """설비용량이 있는 발전소의 GW당 시간별 발전량 프로파일
+
+    capacities: {엔티티 ID: GW}
+    (발전소 타입 목록, 엔티티 ID 목록, 현재 용량 배열 GW, 프로파일 [발전소 x 시간] GWh/GW) 반환
+    """
+    keys = matrix.keys()
+    # 레지스트리에 없는 발전소는 entity_keys가 이미 경고했으므로 조용히 제외
+    supply = [i for i, t in enumerate(matrix.types) if t in SUPPLY_TYPES and keys[i] is not None]
+    rows = [i for i in supply if capacities.get(keys[i])]
+    missing = [matrix.names[i] for i in supply if not capacities.get(keys[i])]
+    if missing:
+        print(f"[WARNING] 설비용량 정보가 없어 제외된 발전소: {', '.join(missing)}")
+    capacity = np.array([capacities[keys[i]] for i in rows], dtype='float64')
+    profiles = matrix.values[rows] / capacity[:, None]
+    return [str(matrix.types[i]) for i in rows], [keys[i] for i in rows], capacity, profiles
+
+
+def sample_mixes(capacity, n, max_factor=DEFAULT_MAX_FACTOR, seed=DEFAULT_SEED):
+    """후보 용량 조합 [후보 x 발전소] (현재 조합, 현재 조합의 균일 배율, 무작위 조합)"""
+    rng = np.random.default_rng(seed)
+    n_scaled = min(n // 10, 100)
+    scaled = np.linspace(0, max_factor, n_scaled)[:, None] * capacity
+    random = rng.uniform(0, max_factor, (max(n - n_scaled - 1, 0), len(capacity))) * capacity
+    return np.vstack([capacity[None, :], scaled, random])
+
+
+def _rate(numerator, denominator):
+    """RE100 % (100 상한)"""
+    return np.minimum(numerator / denominator * 100, 100) if denominator > 0 else np.zeros_like(numerator)
+
+
+def evaluate_mixes(profiles, demand, mixes, chunk=CANDIDATE_CHUNK):
+    """후보별 연간 RE100, 시간 단위 매칭 RE100 (%)"""
+    total_demand = float(demand.sum())
+    supply_total = np.empty(len(mixes))
+    matched_total = np.empty(len(mixes))
+    for i in range(0, len(mixes), chunk):
+        supply = mixes[i:i + chunk] @ profiles
+        supply_total[i:i + chunk] = supply.sum(axis=1)
+        matched_total[i:i + chunk] = np.minimum(supply, demand).sum(axis=1)
+    return _rate(supply_total, total_demand), _rate(matched_total, total_demand)
+
+
+def pareto_front(capacity, *scores):
+    """총 용량은 최소, 점수는 최대인 비지배 후보 위치 (용량 오름차순)"""
+    costs = np.column_stack([capacity] + [-np.asarray(s) for s in scores])
+    order = np.lexsort(costs.T[::-1])
+    efficient = np.ones(len(costs), dtype=bool)
+    for i in order:
+        if not efficient[i]:
+            continue
+        dominated = np.all(costs >= costs[i], axis=1) & np.any(costs > costs[i], axis=1)
+        efficient &= ~dominated
+    return order[efficient[order]]
+
+
+def build_capacity_mix(types, keys, capacity, profiles, demand, mixes):
+    """capacity_mix_pareto.json 구조"""
+    annual, matched = evaluate_mixes(profiles, demand, mixes)
+    total = mixes.sum(axis=1)
+    front = pareto_front(total, annual, matched)
+
+    def describe(i):
+        return {
+            'total_capacity_gw': float(total[i]),
+            'capacity_gw': dict(zip(keys, mixes[i].tolist())),
+            'annual_re100_rate': float(annual[i]),
+            'matched_re100_rate': float(matched[i]),
+        }
+
+    capacity_for_target = {}
+    for key, rates in [('annual', annual), ('matched', matched)]:
+        capacity_for_target[key] = {}
+        for target in TARGET_RATES:
+            reached = np.flatnonzero(rates >= target)
+            capacity_for_target[key][str(target)] = (
+                describe(reached[np.argmin(total[reached])]) if len(reached) else None
+            )
+
+    return {
+        'assumptions': {
+            'capacity_unit': 'GW',
+            'candidates': int(len(mixes)),
+            'profile': 'hourly generation / current capacity (GWh per GW)',
+        },
+        'plants': [
+            {'type': t, 'id': k, 'capacity_gw': float(c), 'capacity_factor': float(p.mean())}
+            for t, k, c, p in zip(types, keys, capacity, profiles)
+        ],
+        'current': describe(0),
+        'pareto_front': [describe(i) for i in front],
+        'capacity_for_target': capacity_for_target,
+    }
+
+
+def build_capacity_mix_pareto(csv_file=integrated_csv, n=DEFAULT_CANDIDATES,
+                              max_factor=DEFAULT_MAX_FACTOR, seed=DEFAULT_SEED):
+    """통합 CSV와 현재 설비용량으로 기본 후보 조합을 평가"""
+    matrix = load_hourly_matrix(csv_file)
+    types, keys, capacity, profiles = normalized_profiles(matrix, capacities())
+    result = build_capacity_mix(types, keys, capacity, profiles, matrix.total(['demand']),
+                                sample_mixes(capacity, n, max_factor, seed))
+    result['assumptions'].update({'max_factor': max_factor, 'seed': seed})
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="설비용량 조합 RE100 파레토 전선")
+    parser.add_argument('--csv', default=integrated_csv, help="통합 CSV 파일")
+    parser.add_argument('--output', default=str(output_file), help="결과 JSON 파일")
+    parser.add_argument('--candidates', type=int, default=DEFAULT_CANDIDATES, help="후보 조합 수")
+    parser.add_argument('--max-factor', type=float, default=DEFAULT_MAX_FACTOR,
+                        help="발전소별 최대 용량 = 현재 용량 x 배수")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="무작위 후보 시드")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    result = build_capacity_mix_pareto(args.csv, args.candidates, args.max_factor, args.seed)
+    elapsed = time.perf_counter() - started
+    write_json(result, Path(args.output))
+
+    current = result['current']
+    print(f"[OK] 후보 {result['assumptions']['candidates']:,}개 평가 ({elapsed:.2f}s), "
+          f"파레토 전선 {len(result['pareto_front'])}개")
+    print(f"  현재: {current['total_capacity_gw']:.2f} GW -> 연간 {current['annual_re100_rate']:.2f}%, "
+          f"매칭 {current['matched_re100_rate']:.2f}%")
+    for target, mix in result['capacity_for_target']['matched'].items():
+        if mix is None:
+            print(f"  매칭 {target}%: 후보 범위에서 도달 불가")
+        else:
+            print(f"  매칭 {target}%: 최소 {mix['total_capacity_gw']:.2f} GW "
+                  f"(연간 {mix['annual_re100_rate']:.2f}%)")
+    print(f"  저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""기업 선택(부분집합)별 수요 합계 서비스
+
+기업별 시간별/월별 수요 행렬을 한 번 만들어 두고, 임의의 기업 조합 합계를
+선택된 행에 대한 벡터 합 한 번으로 계산한다. 전체/미리 정의된 그룹 합계는 미리
+계산하고, 그 밖의 조합은 정렬된 기업 목록을 키로 LRU 캐시에 보관한다.
+절반 이상을 선택한 경우에는 전체 합계에서 나머지 기업 합계를 빼서 계산한다.
+
+--publish 로 기업별 시간별 수요 행렬을 agg_data의 dense 파일
+(company_demand_hourly.dense.bin)로 내보낸다. 월별 행렬은
+company_monthly_aggregated_original.json(.dense.bin)과 같다.
+
+사용 예:
+    python scripts/company_subsets.py --companies OCI LSMnM
+    python scripts/company_subsets.py --publish
+"""
+import argparse
+import functools
+
+import numpy as np
+
+from aggregation_engine import agg_data_dir, integrated_csv
+from dense_format import write_dense_matrix
+from entity_registry import entity_keys
+from hourly_matching import load_hourly_matrix
+
+hourly_output_file = agg_data_dir / "company_demand_hourly.json"
+
+ALL_COMPANIES = '전체'
+DEFAULT_CACHE_SIZE = 256
+
+
+class CompanySubsetService:
+    """기업 부분집합 수요 합계 (시간별, 월별 GWh)"""
+
+    def __init__(self, companies, index, hourly, groups=None, cache_size=DEFAULT_CACHE_SIZE):
+        self.companies = list(companies)
+        self.index = index
+        self.hourly = np.asarray(hourly, dtype='float64')
+        self._rows = {name: i for i, name in enumerate(self.companies)}
+
+        month_codes = index.year.to_numpy() * 100 + index.month.to_numpy()
+        self._month_starts = np.concatenate([[0], np.flatnonzero(np.diff(month_codes)) + 1])
+        self.months = index[self._month_starts].strftime('%Y-%m').tolist()
+        self.monthly = np.add.reduceat(self.hourly, self._month_starts, axis=1)
+
+        self._all = self.hourly.sum(axis=0)
+        self._groups = {}
+        self.groups = {}
+        for name, members in {ALL_COMPANIES: self.companies, **(groups or {})}.items():
+            key = self.key(members)
+            self.groups[name] = key
+            self._groups[key] = self._sum(key)
+        self._cached_sum = functools.lru_cache(maxsize=cache_size)(self._sum)
+
+    @classmethod
+    def from_csv(cls, csv_file=integrated_csv, groups=None, cache_size=DEFAULT_CACHE_SIZE):
+        matrix = load_hourly_matrix(csv_file)
+        demand = matrix.rows(['demand'])
+        names = [name for name, row in zip(matrix.names, demand) if row]
+        return cls(names, matrix.index, matrix.values[demand], groups, cache_size)
+
+    def key(self, companies):
+        """정렬된 기업 튜플 (캐시 키). 알 수 없는 기업이면 KeyError"""
+        key = tuple(sorted(set(companies)))
+        unknown = [name for name in key if name not in self._rows]
+        if unknown:
+            raise KeyError(f"알 수 없는 기업: {', '.join(unknown)}")
+        return key
+
+    def _sum(self, key):
+        """선택 행 합계 (절반 이상 선택 시 전체 - 나머지)"""
+        if len(key) * 2 > len(self.companies):
+            selected = set(key)
+            rest = [self._rows[name] for name in self.companies if name not in selected]
+            return self._all - self.hourly[rest].sum(axis=0)
+        return self.hourly[[self._rows[name] for name in key]].sum(axis=0)
+
+    def hourly_total(self, companies=None):
+        """선택 기업 시간별 수요 합계 (None 또는 빈 목록이면 전체)"""
+        key = self.key(companies) if companies else self.groups[ALL_COMPANIES]
+        if key in self._groups:
+            return self._groups[key]
+        return self._cached_sum(key)
+
+    def monthly_total(self, companies=None):
+        """선택 기업 월별 수요 합계 {월: GWh}"""
+        values = np.add.reduceat(self.hourly_total(companies), self._month_starts)
+        return dict(zip(self.months, values.tolist()))
+
+    def cache_info(self):
+        return self._cached_sum.cache_info()
+
+    def publish(self, output_file=hourly_output_file):
+        """기업별 시간별 수요 행렬을 dense 파일로 저장 (행 키는 엔티티 ID)"""
+        hours = self.index.strftime('%Y-%m-%d %H:%M').tolist()
+        keys = entity_keys('demand', self.companies)
+        rows = [i for i, key in enumerate(keys) if key is not None]
+        return write_dense_matrix([[keys[i]] for i in rows], hours, self.hourly[rows], output_file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기업 부분집합 수요 합계")
+    parser.add_argument('--csv', default=integrated_csv, help="통합 CSV 파일")
+    parser.add_argument('--companies', nargs='+', help="합계를 볼 기업 목록 (기본: 전체)")
+    parser.add_argument('--publish', action='store_true', help="기업별 시간별 행렬을 agg_data에 저장")
+    args = parser.parse_args()
+
+    service = CompanySubsetService.from_csv(args.csv)
+    print(f"기업 {len(service.companies)}개 x {len(service.index):,}시간")
+
+    if args.publish:
+        for path in service.publish():
+            print(f"[OK] 저장: {path} ({path.stat().st_size:,}B)")
+
+    monthly = service.monthly_total(args.companies)
+    label = ", ".join(args.companies) if args.companies else ALL_COMPANIES
+    print(f"{label} 월별 수요 (GWh):")
+    for month, value in monthly.items():
+        print(f"  {month}: {value:,.3f}")
+    print(f"  합계: {sum(monthly.values()):,.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+"""시간별 CSV 컬럼형 캐시
+
+solar_plant*.csv / wind_plant*.csv / 통합 수요 CSV를 한 번만 파싱하여
+datetime64 인덱스, category 타입(type, plant_name), float32 value 로 구성된
+컬럼형 파일(Parquet, pyarrow가 없으면 pickle)로 저장한다.
+원본 파일의 mtime/크기가 같으면 바로 캐시를 사용하고, mtime만 바뀐 경우에는
+내용 해시를 비교해 실제로 변경된 경우에만 다시 파싱한다.
+"""
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from partitions import require_partition
+from pipeline_metrics import stage
+from warm_cache import cached, file_signature
+
+try:
+    import pyarrow  # noqa: F401
+    CACHE_FORMAT = 'parquet'
+except ImportError:
+    CACHE_FORMAT = 'pickle'
+
+# 프로젝트 루트 설정
+project_root = Path(__file__).resolve().parent.parent
+cache_dir = project_root / ".cache" / "csv"
+
+# 캐시 파일 구조가 바뀌면 올려서 기존 캐시를 무효화
+CACHE_VERSION = 1
+DATETIME_FORMAT = '%Y-%m-%d %H:%M'
+CSV_DTYPES = {'type': 'category', 'plant_name': 'category', 'value': 'float32'}
+
+# 경로별 잠금 (re100_agg 스레드 풀에서 같은 CSV를 동시에 요청해도 한 번만 파싱)
+_path_locks = {}
+_path_locks_guard = threading.Lock()
+
+
+def file_hash(path):
+    """파일 내용 해시 (blake2b)"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _cache_paths(csv_path):
+    """원본 경로별 캐시 데이터/메타 파일 경로"""
+    key = hashlib.blake2b(str(csv_path).encode('utf-8'), digest_size=8).hexdigest()
+    stem = f"{csv_path.stem}-{key}"
+    suffix = '.parquet' if CACHE_FORMAT == 'parquet' else '.pkl'
+    return cache_dir / f"{stem}{suffix}", cache_dir / f"{stem}.meta.json"
+
+
+def unique_tmp_path(path):
+    """프로세스/스레드마다 다른 임시 파일 경로 (동시 쓰기가 서로의 임시 파일을 옮기지 않도록)"""
+    return path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+
+
+def path_lock(path):
+    """경로별 스레드 잠금 (캐시 파일을 만드는 구간을 경로마다 하나씩만 실행)"""
+    with _path_locks_guard:
+        return _path_locks.setdefault(Path(path), threading.Lock())
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_meta(meta_path, meta):
+    tmp_path = unique_tmp_path(meta_path)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+
+
+def parse_csv(csv_path):
+    """CSV를 타입이 지정된 DataFrame(datetime 인덱스)으로 파싱"""
+    with stage('parse') as info:
+        df = pd.read_csv(csv_path, dtype=CSV_DTYPES)
+        try:
+            df['datetime'] = pd.to_datetime(df['datetime'], format=DATETIME_FORMAT)
+        except ValueError:
+            # 초 단위 등 다른 형식이 섞여 있으면 형식 추론으로 재시도
+            df['datetime'] = pd.to_datetime(df['datetime'])
+        info['rows'] = len(df)
+        return df.set_index('datetime')
+
+
+def _write_frame(df, data_path):
+    tmp_path = unique_tmp_path(data_path)
+    with stage('write') as info:
+        if CACHE_FORMAT == 'parquet':
+            df.to_parquet(tmp_path)
+        else:
+            df.to_pickle(tmp_path)
+        os.replace(tmp_path, data_path)
+        info['rows'] = len(df)
+
+
+def _read_frame(data_path):
+    with stage('load') as info:
+        if CACHE_FORMAT == 'parquet':
+            df = pd.read_parquet(data_path)
+        else:
+            df = pd.read_pickle(data_path)
+        info['rows'] = len(df)
+        return df
+
+
+def load_csv(csv_path, use_cache=True):
+    """캐시를 거쳐 CSV 로드 (datetime 인덱스, type/plant_name category, value float32)"""
+    csv_path = require_partition(csv_path).resolve()
+    if not use_cache:
+        return parse_csv(csv_path)
+    # 장기 실행 프로세스(warm_cache 활성화)에서는 원본이 같으면 메모리의 DataFrame을 재사용.
+    # Copy-on-Write 얕은 복사라 호출자가 수정해도 캐시에는 반영되지 않는다.
+    frame = cached('csv', csv_path, file_signature(csv_path), lambda: _load_cached(csv_path))
+    return frame.copy(deep=False)
+
+
+def _load_cached(csv_path):
+    with path_lock(csv_path):
+        return _load_or_parse(csv_path)
+
+
+def _load_or_parse(csv_path):
+    data_path, meta_path = _cache_paths(csv_path)
+    stat = csv_path.stat()
+    meta = _read_meta(meta_path)
+
+    if meta and meta.get('version') == CACHE_VERSION and meta.get('format') == CACHE_FORMAT \
+            and data_path.exists():
+        if meta['mtime_ns'] == stat.st_mtime_ns and meta['size'] == stat.st_size:
+            return _read_frame(data_path)
+        # mtime만 바뀌고 내용이 같으면 메타만 갱신
+        if meta['size'] == stat.st_size and meta['hash'] == file_hash(csv_path):
+            meta['mtime_ns'] = stat.st_mtime_ns
+            _write_meta(meta_path, meta)
+            return _read_frame(data_path)
+
+    df = parse_csv(csv_path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _write_frame(df, data_path)
+    _write_meta(meta_path, {
+        'version': CACHE_VERSION,
+        'format': CACHE_FORMAT,
+        'source': str(csv_path),
+        'mtime_ns': stat.st_mtime_ns,
+        'size': stat.st_size,
+        'hash': file_hash(csv_path),
+        'rows': len(df),
+    })
+    return df
+
+
+def clear_cache():
+    """모든 캐시 파일 삭제"""
+    if cache_dir.exists():
+        for path in cache_dir.iterdir():
+            path.unlink()
+
+
+if __name__ == "__main__":
+    import sys
+
+    # 인자로 받은 CSV(없으면 sample_data 전체)를 미리 캐시에 적재
+    sample_data_dir = project_root / "public" / "sample_data"
+    targets = sys.argv[1:] or sorted(
+        list(sample_data_dir.glob("*_plant*.csv")) + list(sample_data_dir.glob("sample_data_integrated_*.csv"))
+    )
+    for target in targets:
+        frame = load_csv(target)
+        print(f"[OK] 캐시 적재: {Path(target).name} ({len(frame):,}행, {CACHE_FORMAT})")
@@ -0,0 +1,155 @@
+"""원본 데이터 폴더 변경 감시
+
+public/sample_data의 CSV가 새로 쓰이거나 교체되면 변경된 파일 경로 묶음을 돌려준다.
+Linux에서는 inotify(ctypes, 표준 라이브러리만 사용)로 쓰기가 끝난 시점(IN_CLOSE_WRITE)과
+교체(IN_MOVED_TO, os.replace)를 받고, inotify를 쓸 수 없으면 mtime/크기 폴링으로 대신한다.
+파일 복사나 분할처럼 이벤트가 연달아 오는 경우는 debounce 초 동안 조용해질 때까지 모아서
+한 묶음으로 넘기고, 이벤트가 계속 와도 max_delay 초가 지나면 그때까지 모은 묶음을 넘긴다.
+
+변경 파일을 산출물로 연결하는 일은 re100_agg.py --watch 가 한다.
+"""
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from pathlib import Path
+
+from aggregation_engine import sample_data_dir
+
+# 마지막 이벤트 뒤 이 시간 동안 조용하면 묶음 확정
+DEBOUNCE_SECONDS = 1.0
+# 이벤트가 계속 와도 이 시간이 지나면 묶음 확정
+MAX_DELAY_SECONDS = 10.0
+POLL_INTERVAL_SECONDS = 1.0
+WATCH_SUFFIXES = ('.csv',)
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def _watched(path):
+    """감시 대상 파일 (숨김 파일, 임시 파일 제외)"""
+    return not path.name.startswith('.') and path.suffix in WATCH_SUFFIXES
+
+
+def _scan(directory):
+    """감시 대상 파일 {경로: (mtime_ns, 크기)}"""
+    snapshot = {}
+    for path in directory.iterdir():
+        if _watched(path):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+class InotifyWatcher:
+    """inotify로 폴더 하나의 쓰기 완료/교체 이벤트 감시 (Linux)"""
+
+    def __init__(self, directory=sample_data_dir):
+        self.directory = Path(directory)
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+        if libc.inotify_add_watch(self.fd, str(self.directory).encode(), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            errno = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(errno, f"inotify_add_watch 실패: {self.directory}")
+
+    def _events(self):
+        """대기 중인 이벤트의 변경 파일 (큐 넘침이면 감시 대상 전체)"""
+        changed = set()
+        try:
+            data = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b'\0').decode('utf-8', 'replace')
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                changed.update(_scan(self.directory))
+            elif name and _watched(self.directory / name):
+                changed.add(self.directory / name)
+        return changed
+
+    def read(self, timeout=None):
+        """변경 파일 집합 (timeout 초 안에 없으면 빈 집합, None이면 계속 대기)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            ready, _, _ = select.select([self.fd], [], [], remaining)
+            if ready:
+                changed = self._events()
+                if changed:
+                    return changed
+            elif deadline is not None:
+                return set()
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """mtime/크기 비교로 폴더 하나 감시 (inotify를 쓸 수 없을 때)"""
+
+    def __init__(self, directory=sample_data_dir, interval=POLL_INTERVAL_SECONDS):
+        self.directory = Path(directory)
+        self.interval = interval
+        self.snapshot = _scan(self.directory)
+
+    def read(self, timeout=None):
+        """변경 파일 집합 (timeout 초 안에 없으면 빈 집합, None이면 계속 대기)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = _scan(self.directory)
+            changed = {path for path, sig in snapshot.items() if self.snapshot.get(path) != sig}
+            self.snapshot = snapshot
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            wait = self.interval if deadline is None else min(self.interval, deadline - time.monotonic())
+            time.sleep(max(0.0, wait))
+
+    def close(self):
+        pass
+
+
+def open_watcher(directory=sample_data_dir, polling=False):
+    """inotify 감시자 (사용할 수 없으면 폴링 감시자)"""
+    if not polling:
+        try:
+            return InotifyWatcher(directory)
+        except (OSError, AttributeError) as e:
+            print(f"[WARNING] inotify 사용 불가, 폴링으로 감시: {e}")
+    return PollingWatcher(directory)
+
+
+def batches(directory=sample_data_dir, debounce=DEBOUNCE_SECONDS, max_delay=MAX_DELAY_SECONDS, polling=False):
+    """변경 파일 묶음을 debounce해서 차례로 반환하는 제너레이터 (끝나지 않음)"""
+    watcher = open_watcher(directory, polling)
+    try:
+        while True:
+            changed = watcher.read()
+            first = time.monotonic()
+            while True:
+                remaining = min(debounce, max_delay - (time.monotonic() - first))
+                if remaining <= 0:
+                    break
+                more = watcher.read(remaining)
+                if not more:
+                    break
+                changed |= more
+            yield changed
+    finally:
+        watcher.close()
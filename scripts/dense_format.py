@@ -0,0 +1,197 @@
+"""agg_data 산출물의 조밀(dense) 바이너리 인코딩
+
+{그룹: {엔티티: {월/시간: 값}}} 형태의 중첩 JSON을 행 경로 목록 + 축 키 목록 +
+float32 행렬로 바꿔 저장한다. 엔티티마다 반복되던 월/시간 문자열 키가 한 번만 기록되고,
+브라우저에서는 Float32Array로 바로 읽을 수 있다. gzip(항상) / brotli(설치된 경우)로
+미리 압축한 파일도 함께 만든다.
+
+파일 구조 (리틀 엔디언):
+    0..3    매직 b"R1DA"
+    4..7    헤더 길이 N (uint32)
+    8..     UTF-8 JSON 헤더 {"version", "axis", "rows", "shape"} (공백 없음)
+    ...     4바이트 정렬용 공백 패딩
+    ...     float32 값 (rows x axis, 행 우선). 값이 없는 셀은 NaN
+
+사용 예:
+    python scripts/dense_format.py                       # agg_data의 모든 JSON 변환
+    python scripts/dense_format.py public/agg_data/company_hourly_aggregated.json
+"""
+import argparse
+import gzip
+import json
+import struct
+import time
+from numbers import Real
+from pathlib import Path
+
+import numpy as np
+
+from pipeline_metrics import stage
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MAGIC = b"R1DA"
+FORMAT_VERSION = 1
+DENSE_SUFFIX = ".dense.bin"
+
+agg_data_dir = Path(__file__).resolve().parent.parent / "public" / "agg_data"
+
+
+def _is_leaf(value):
+    return (
+        isinstance(value, dict) and value
+        and all(isinstance(v, Real) and not isinstance(v, bool) for v in value.values())
+    )
+
+
+def flatten(data, path=()):
+    """중첩 dict를 (경로, {축 키: 값}) 목록으로 변환. 행렬 형태가 아니면 None"""
+    if _is_leaf(data):
+        return [(list(path), data)]
+    if not isinstance(data, dict) or not data:
+        return None
+    rows = []
+    for key, value in data.items():
+        children = flatten(value, path + (key,))
+        if children is None:
+            return None
+        rows.extend(children)
+    return rows
+
+
+def encode(data):
+    """중첩 dict를 dense 바이너리로 인코딩. 행렬 형태가 아니면 None"""
+    rows = flatten(data)
+    if rows is None:
+        return None
+
+    axis = list(dict.fromkeys(key for _, leaf in rows for key in leaf))
+    position = {key: i for i, key in enumerate(axis)}
+    matrix = np.full((len(rows), len(axis)), np.nan, dtype='<f4')
+    for r, (_, leaf) in enumerate(rows):
+        for key, value in leaf.items():
+            matrix[r, position[key]] = value
+    return encode_matrix([path for path, _ in rows], axis, matrix)
+
+
+def encode_matrix(rows, axis, matrix):
+    """행 경로 목록 + 축 키 목록 + [행 x 축] 배열을 dense 바이너리로 인코딩"""
+    matrix = np.ascontiguousarray(matrix, dtype='<f4')
+    header = json.dumps({
+        'version': FORMAT_VERSION,
+        'axis': list(axis),
+        'rows': [list(path) for path in rows],
+        'shape': list(matrix.shape),
+    }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    header += b' ' * (-(8 + len(header)) % 4)
+    return MAGIC + struct.pack('<I', len(header)) + header + matrix.tobytes()
+
+
+def decode(raw):
+    """dense 바이너리를 원래의 중첩 dict로 복원 (NaN 셀은 생략)"""
+    if raw[:4] != MAGIC:
+        raise ValueError("dense 형식이 아닙니다")
+    header_len = struct.unpack('<I', raw[4:8])[0]
+    header = json.loads(raw[8:8 + header_len].decode('utf-8'))
+    n_rows, n_cols = header['shape']
+    matrix = np.frombuffer(raw, dtype='<f4', count=n_rows * n_cols, offset=8 + header_len)
+    matrix = matrix.reshape(n_rows, n_cols)
+
+    data = {}
+    for path, values in zip(header['rows'], matrix.tolist()):
+        leaf = {key: value for key, value in zip(header['axis'], values) if value == value}
+        if not path:
+            return leaf
+        node = data
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = leaf
+    return data
+
+
+def dense_path(json_file):
+    json_file = Path(json_file)
+    return json_file.with_name(json_file.stem + DENSE_SUFFIX)
+
+
+def _dense_files(output_file):
+    """dense 파일과 압축본 경로 (.bin, .gz, .br)"""
+    return [output_file, output_file.with_name(output_file.name + '.gz'),
+            output_file.with_name(output_file.name + '.br')]
+
+
+def _remove_stale(output_file, keep=()):
+    for path in _dense_files(output_file):
+        if path not in keep and path.exists():
+            path.unlink()
+
+
+def write_dense(data, json_file):
+    """JSON 산출물 옆에 dense 파일과 압축본(.gz, .br)을 저장하고 경로 목록 반환
+
+    행렬 형태가 아니거나 비어 있으면 이전 실행이 남긴 dense 파일을 지우고 빈 목록을 반환한다.
+    """
+    with stage('serialize', Path(json_file).name):
+        raw = encode(data)
+    if raw is None:
+        _remove_stale(dense_path(json_file))
+        return []
+    return _write_payloads(raw, dense_path(json_file), Path(json_file).name)
+
+
+def write_dense_matrix(rows, axis, matrix, json_file):
+    """JSON 없이 행렬을 바로 dense 파일(+압축본)로 저장 (JSON으로 쓰기엔 큰 산출물용)"""
+    with stage('serialize', Path(json_file).name):
+        raw = encode_matrix(rows, axis, matrix)
+    return _write_payloads(raw, dense_path(json_file), Path(json_file).name)
+
+
+def _write_payloads(raw, output_file, target=None):
+    # 압축은 직렬화 단계, 파일 쓰기는 쓰기 단계로 측정
+    bin_file, gz_file, br_file = _dense_files(output_file)
+    with stage('serialize', target) as info:
+        outputs = [(bin_file, raw), (gz_file, gzip.compress(raw, 9, mtime=0))]
+        if brotli is not None:
+            outputs.append((br_file, brotli.compress(raw, quality=11)))
+        info['bytes'] = sum(len(payload) for _, payload in outputs)
+    with stage('write', target) as info:
+        for path, payload in outputs:
+            with open(path, 'wb') as f:
+                f.write(payload)
+        info['bytes'] = sum(len(payload) for _, payload in outputs)
+    # brotli 없이 다시 쓰면 이전 .br이 남지 않도록 삭제
+    _remove_stale(output_file, keep=[path for path, _ in outputs])
+    return [path for path, _ in outputs]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="agg_data JSON을 dense 바이너리로 변환")
+    parser.add_argument('files', nargs='*', help="변환할 JSON 파일 (기본: agg_data 전체)")
+    args = parser.parse_args()
+
+    files = [Path(f) for f in args.files] or sorted(agg_data_dir.glob("*.json"))
+    for json_file in files:
+        with open(json_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        written = write_dense(data, json_file)
+        if not written:
+            print(f"[SKIP] 행렬 형태가 아님: {json_file.name}")
+            continue
+
+        started = time.perf_counter()
+        json.loads(json_file.read_bytes())
+        json_parse = time.perf_counter() - started
+        started = time.perf_counter()
+        decode(written[0].read_bytes())
+        dense_parse = time.perf_counter() - started
+
+        sizes = ", ".join(f"{p.name.split(DENSE_SUFFIX)[-1] or '.bin'} {p.stat().st_size:,}B" for p in written)
+        print(f"[OK] {json_file.name}: JSON {json_file.stat().st_size:,}B -> {sizes} "
+              f"(파싱 {json_parse * 1000:.2f}ms -> {dense_parse * 1000:.2f}ms)")
+
+
+if __name__ == "__main__":
+    main()
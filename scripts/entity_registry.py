@@ -0,0 +1,329 @@
+"""발전소/기업 엔티티 레지스트리 (정수 ID)
+
+public/sample_data/entities.csv에 엔티티마다 변하지 않는 정수 ID, 타입, 표시 이름(name),
+원본 CSV 행의 plant_name 값(data_name)을 한 번만 기록한다. agg_data 산출물은 엔티티를
+ID 문자열("1", "2", ...)로 키를 두고, 표시 이름은 agg_data/entities.json 한 곳에서만
+찾는다. 이름 변경은 name 칸 하나와 entities.json만 고치며 집계/원본 파일은 건드리지 않는다.
+
+집계는 레지스트리를 고치지 않는다. 원본 데이터에 레지스트리에 없는 엔티티가 있으면 경고하고
+엔티티별 산출물에서 빼며(합계에는 포함), validate_data의 entities_registered 항목이 실패한다.
+새 엔티티는 --register(또는 --migrate)로만 다음 ID에 등록한다. ID는 재사용하지 않는다.
+등록/이름 변경은 .cache/ 아래 잠금 파일을 flock으로 잡고 레지스트리를 다시 읽은 뒤 쓰므로,
+상주 프로세스와 CLI가 동시에 등록해도 ID가 겹치지 않는다.
+
+사용 예:
+    python scripts/entity_registry.py                                # 레지스트리 출력
+    python scripts/entity_registry.py --rename 육상태양광=육상태양광A  # 표시 이름 변경
+    python scripts/entity_registry.py --register                    # 통합 CSV의 미등록 엔티티 등록
+    python scripts/entity_registry.py --register demand=기업A        # 지정한 엔티티 등록
+    python scripts/entity_registry.py --migrate                     # 이름 키 agg_data를 ID 키로 변환
+"""
+import argparse
+import contextlib
+import csv
+import json
+import os
+import threading
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 스레드 잠금만 사용
+    fcntl = None
+
+# aggregation_engine이 이 모듈을 사용하므로 경로를 직접 설정
+project_root = Path(__file__).resolve().parent.parent
+sample_data_dir = project_root / "public" / "sample_data"
+agg_data_dir = project_root / "public" / "agg_data"
+registry_file = sample_data_dir / "entities.csv"
+# 잠금 파일은 웹으로 제공되는 sample_data가 아닌 캐시 폴더에 둔다
+lock_dir = project_root / ".cache"
+entities_output_file = agg_data_dir / "entities.json"
+
+ENTITY_FIELDS = ['id', 'type', 'name', 'data_name']
+
+# 엔티티 키를 두는 agg_data 산출물 -> 엔티티 단계 (None: 최상위, 문자열: 해당 타입 아래)
+ENTITY_KEYED_OUTPUTS = {
+    "monthly_aggregated_original.json": ['solar', 'wind'],
+    "company_monthly_aggregated_original.json": [None],
+    "plant_hourly_aggregated_original.json": ['solar', 'wind'],
+    "company_hourly_aggregated.json": [None],
+    "plant_capacity.json": ['solar', 'wind'],
+    "plant_monthly_aggregated.json": ['solar', 'wind'],
+}
+# 엔티티가 아닌 예약 키
+RESERVED_KEYS = {'total'}
+
+_lock = threading.Lock()
+_cache = {'mtime_ns': None, 'entries': []}
+# 이미 경고한 미등록 (타입, 원본 이름)
+_warned = set()
+
+
+def load_entities(path=None):
+    """entities.csv 전체 행 (id는 int)"""
+    path = path or registry_file
+    if not Path(path).exists():
+        return []
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        return [
+            {'id': int(row['id']), 'type': row['type'].strip(), 'name': row['name'].strip(),
+             'data_name': row['data_name'].strip()}
+            for row in csv.DictReader(f)
+        ]
+
+
+def save_entities(entries, path=None):
+    path = path or registry_file
+    tmp_path = Path(path).with_suffix('.tmp')
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=ENTITY_FIELDS, lineterminator='\n')
+        writer.writeheader()
+        for entry in sorted(entries, key=lambda e: e['id']):
+            writer.writerow({key: entry[key] for key in ENTITY_FIELDS})
+    os.replace(tmp_path, path)
+
+
+def use_registry(path):
+    """이 프로세스의 기본 레지스트리 파일 변경 (부하 테스트 데이터셋처럼 다른 폴더의 데이터를 집계할 때)"""
+    global registry_file
+    registry_file = Path(path)
+    _cache.update(mtime_ns=None, entries=[])
+
+
+@contextlib.contextmanager
+def _registry_lock(path=None):
+    """레지스트리 읽기-수정-쓰기 구간 잠금 (스레드 간 _lock + 프로세스 간 flock)"""
+    path = path or registry_file
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    with _lock, open(lock_dir / f"{Path(path).name}.lock", 'a') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _entries(path=None):
+    """파일이 바뀌었을 때만 다시 읽는 레지스트리 (기본 경로만 캐시)"""
+    path = path or registry_file
+    if Path(path) != registry_file:
+        return load_entities(path)
+    mtime_ns = registry_file.stat().st_mtime_ns if registry_file.exists() else None
+    if _cache['mtime_ns'] != mtime_ns:
+        _cache.update(mtime_ns=mtime_ns, entries=load_entities())
+    return _cache['entries']
+
+
+def register(energy_type, data_names, path=None):
+    """(타입, 원본 이름) 목록의 ID 문자열 목록 (레지스트리에 없는 엔티티는 다음 ID로 등록)"""
+    data_names = [str(name).strip() for name in data_names]
+    with _lock:
+        keys = {(e['type'], e['data_name']): str(e['id']) for e in _entries(path)}
+    missing = list(dict.fromkeys(n for n in data_names if (energy_type, n) not in keys))
+    if missing:
+        with _registry_lock(path):
+            # 다른 프로세스가 먼저 등록했을 수 있으므로 잠금 안에서 파일을 다시 읽음
+            entries = load_entities(path)
+            keys.update(((e['type'], e['data_name']), str(e['id'])) for e in entries)
+            missing = [n for n in missing if (energy_type, n) not in keys]
+            if missing:
+                next_id = max((e['id'] for e in entries), default=0) + 1
+                for offset, name in enumerate(missing):
+                    entries.append({'id': next_id + offset, 'type': energy_type, 'name': name, 'data_name': name})
+                    keys[(energy_type, name)] = str(next_id + offset)
+                save_entities(entries, path)
+    return [keys[(energy_type, name)] for name in data_names]
+
+
+def entity_keys(energy_type, data_names, path=None):
+    """(타입, 원본 이름) 목록의 ID 문자열 목록 (등록하지 않음, 미등록 엔티티는 경고 후 None)"""
+    keys = lookup_keys(energy_type, data_names, path)
+    missing = [str(name).strip() for name, key in zip(data_names, keys)
+               if key is None and (energy_type, str(name).strip()) not in _warned]
+    if missing:
+        missing = list(dict.fromkeys(missing))
+        _warned.update((energy_type, name) for name in missing)
+        print(f"[WARNING] 레지스트리에 없는 {energy_type} 엔티티 {len(missing)}개는 엔티티별 산출물에서 제외: "
+              f"{', '.join(missing)} (python scripts/entity_registry.py --register 로 등록)")
+    return keys
+
+
+def lookup_keys(energy_type, data_names, path=None):
+    """(타입, 원본 이름) 목록의 ID 문자열 목록 (등록하지 않음, 레지스트리에 없으면 None)"""
+    keys = {(e['type'], e['data_name']): str(e['id']) for e in _entries(path)}
+    return [keys.get((energy_type, str(name).strip())) for name in data_names]
+
+
+def entity_key(energy_type, data_name):
+    """(타입, 원본 이름)의 ID 문자열 (없으면 등록)"""
+    return register(energy_type, [data_name])[0]
+
+
+def row_keys(types, names, quiet=False):
+    """행렬 행별 (타입, 원본 이름)의 ID 문자열 목록 (예약 이름 'total' 행은 그대로)
+
+    등록되지 않은 행은 None으로 둔다. quiet=True 이면 미등록 경고를 출력하지 않는다.
+    """
+    find = lookup_keys if quiet else entity_keys
+    keys = [str(name) for name in names]
+    rows_by_type = {}
+    for i, (energy_type, name) in enumerate(zip(types, names)):
+        if name not in RESERVED_KEYS:
+            rows_by_type.setdefault(str(energy_type), []).append(i)
+    for energy_type, rows in rows_by_type.items():
+        for i, key in zip(rows, find(energy_type, [names[i] for i in rows])):
+            keys[i] = key
+    return keys
+
+
+def display_names(path=None):
+    """{ID 문자열: 표시 이름}"""
+    return {str(e['id']): e['name'] for e in _entries(path)}
+
+
+def resolve(name, energy_type=None, path=None):
+    """ID, 표시 이름, 원본 이름 중 하나로 엔티티 찾기"""
+    name = str(name).strip()
+    entries = [e for e in _entries(path) if energy_type is None or e['type'] == energy_type]
+    for field in ['id', 'name', 'data_name']:
+        matches = [e for e in entries if str(e[field]) == name]
+        if len(matches) == 1:
+            return matches[0]
+        if len(matches) > 1:
+            raise KeyError(f"엔티티 이름이 중복됨: {name}")
+    raise KeyError(f"레지스트리에 없는 엔티티: {name}")
+
+
+def rename(name, new_name, path=None):
+    """표시 이름만 변경 (집계 파일은 그대로) 하고 변경된 엔티티 반환"""
+    with _registry_lock(path):
+        entries = load_entities(path)
+        entry = resolve(name, path=path)
+        if any(e['name'] == new_name and e['id'] != entry['id'] for e in entries):
+            raise ValueError(f"이미 사용 중인 이름: {new_name}")
+        for e in entries:
+            if e['id'] == entry['id']:
+                e['name'] = new_name
+                entry = e
+        save_entities(entries, path)
+    return entry
+
+
+def build_entities(path=None):
+    """entities.json 구조 {ID: {type, name, data_name}}"""
+    return {str(e['id']): {'type': e['type'], 'name': e['name'], 'data_name': e['data_name']}
+            for e in _entries(path)}
+
+
+def rekey(data, levels, key_of):
+    """산출물 구조의 엔티티 단계 키를 key_of(타입, 키)로 변환 (예약 키는 그대로)"""
+    data = dict(data)
+    for level in levels:
+        entities = data if level is None else data.get(level)
+        if not isinstance(entities, dict):
+            continue
+        rekeyed = {
+            key if key in RESERVED_KEYS else key_of(level or 'demand', key): value
+            for key, value in entities.items()
+        }
+        if level is None:
+            return rekeyed
+        data[level] = rekeyed
+    return data
+
+
+def migrate(output_dir=agg_data_dir):
+    """이름을 키로 쓰던 agg_data 산출물을 ID 키로 변환하고 변환한 파일명 목록 반환"""
+    from aggregation_engine import write_json
+    from parallel_plants import load_plant_list
+
+    stems = {Path(e['filename']).stem: e['plant_name'] for e in load_plant_list()}
+    known = {str(e['id']) for e in _entries()}
+    written = []
+    for name, levels in ENTITY_KEYED_OUTPUTS.items():
+        output_file = Path(output_dir) / name
+        if not output_file.exists():
+            continue
+        with open(output_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        def key_of(energy_type, key):
+            if key in known:
+                return key
+            return entity_key(energy_type, stems.get(key, key))
+
+        rekeyed = rekey(data, levels, key_of)
+        if rekeyed != data:
+            write_json(rekeyed, output_file)
+            written.append(name)
+    write_entities(Path(output_dir) / entities_output_file.name)
+    return written
+
+
+def unregistered(csv_files=None):
+    """통합 CSV 파티션에 있지만 레지스트리에 없는 {타입: [원본 이름]}"""
+    from csv_cache import load_csv
+    from partitions import integrated_partitions
+
+    found = {}
+    for csv_file in csv_files or integrated_partitions().values():
+        pairs = load_csv(csv_file)[['type', 'plant_name']].drop_duplicates()
+        for energy_type, name in pairs.itertuples(index=False):
+            found.setdefault(str(energy_type), {})[str(name).strip()] = None
+    known = {(e['type'], e['data_name']) for e in _entries()}
+    missing = {t: [n for n in names if n not in RESERVED_KEYS and (t, n) not in known]
+               for t, names in found.items()}
+    return {t: names for t, names in missing.items() if names}
+
+
+def write_entities(output_file=entities_output_file):
+    from aggregation_engine import write_json
+    write_json(build_entities(), output_file, dense=False)
+    return output_file
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔티티 레지스트리 조회/이름 변경")
+    parser.add_argument('--rename', nargs='+', metavar='이름=새이름', help="표시 이름 변경")
+    parser.add_argument('--migrate', action='store_true', help="이름 키 agg_data 산출물을 ID 키로 변환")
+    parser.add_argument('--register', nargs='*', metavar='타입=이름',
+                        help="새 엔티티 등록 (이름을 주지 않으면 통합 CSV의 미등록 엔티티 전체)")
+    args = parser.parse_args()
+
+    if args.register is not None:
+        if args.register:
+            names = {}
+            for item in args.register:
+                energy_type, _, name = item.partition('=')
+                names.setdefault(energy_type.strip(), []).append(name.strip())
+        else:
+            names = unregistered()
+        before = {str(e['id']) for e in _entries()}
+        for energy_type, data_names in names.items():
+            for name, key in zip(data_names, register(energy_type, data_names)):
+                print(f"[{'OK' if key not in before else 'SKIP'}] {key}: {energy_type} {name}")
+        if not names:
+            print("[SKIP] 등록할 새 엔티티 없음")
+        print(f"[OK] 저장: {write_entities()}")
+
+    if args.migrate:
+        for name in migrate():
+            print(f"[OK] ID 키로 변환: {name}")
+
+    if args.rename:
+        for item in args.rename:
+            name, _, new_name = item.partition('=')
+            entry = rename(name.strip(), new_name.strip())
+            print(f"[OK] {entry['id']}: {name.strip()} -> {entry['name']}")
+        print(f"[OK] 저장: {write_entities()}")
+
+    print(f"{'ID':>5}  {'타입':<8}{'표시 이름':<20}원본 이름")
+    for e in _entries():
+        print(f"{e['id']:>5}  {e['type']:<8}{e['name']:<20}{e['data_name']}")
+
+
+if __name__ == "__main__":
+    main()
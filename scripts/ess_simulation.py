@@ -0,0 +1,193 @@
+"""ESS(배터리) 충방전 시뮬레이션 및 용량 스윕
+
+hourly_matching의 시간별 공급/수요 시계열로 충전 상태(SoC)를 따라가며
+잉여 전력은 충전하고 부족 시간에는 방전하는 규칙 기반 운전을 시뮬레이션한다.
+여러 (용량, 출력) 시나리오를 한 번에 배열로 계산하고(시간 루프 1회),
+시나리오가 많으면 묶음으로 나눠 프로세스 풀에서 실행한다.
+
+결과는 용량 -> 매칭 RE100 곡선(public/agg_data/ess_capacity_curve.json)으로 저장한다.
+
+사용 예:
+    python scripts/ess_simulation.py
+    python scripts/ess_simulation.py --durations 2 4 --max-capacity 50 --steps 101 --workers 4
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from aggregation_engine import agg_data_dir, integrated_csv, SUPPLY_TYPES, write_json
+from hourly_matching import load_hourly_matrix, match
+
+output_file = agg_data_dir / "ess_capacity_curve.json"
+
+# 기본 가정: 왕복 효율 90%, 초기 SoC 0, 출력 = 용량 / 지속시간
+ROUND_TRIP_EFFICIENCY = 0.90
+DEFAULT_DURATIONS = [1, 2, 4, 8]
+DEFAULT_STEPS = 41
+TARGET_RATES = [80, 90, 95, 99]
+
+# 프로세스 하나에 넘기는 최소 시나리오 수 (이보다 적으면 단일 프로세스로 계산)
+MIN_SCENARIOS_PER_WORKER = 256
+
+
+def simulate(supply, demand, capacity, power, efficiency=ROUND_TRIP_EFFICIENCY, initial_soc=0.0):
+    """시나리오 배열(capacity, power: GWh, GW)에 대해 충방전을 동시에 시뮬레이션
+
+    시간마다 잉여(공급 - 수요)를 출력/잔여 용량 한도까지 충전하고,
+    부족분을 출력/저장량 한도까지 방전한다. 시나리오별 총 방전량(GWh)과
+    총 충전량(GWh, 계통 기준) 반환.
+    """
+    capacity = np.asarray(capacity, dtype='float64')
+    power = np.asarray(power, dtype='float64')
+    eta = np.sqrt(efficiency)
+
+    net = supply - demand
+    soc = np.full(capacity.shape, initial_soc) * capacity
+    charged = np.zeros(capacity.shape)
+    discharged = np.zeros(capacity.shape)
+    headroom = np.empty(capacity.shape)
+
+    for value in net.tolist():
+        if value > 0:
+            np.subtract(capacity, soc, out=headroom)
+            step = np.minimum(np.minimum(power, headroom / eta), value)
+            soc += step * eta
+            charged += step
+        elif value < 0:
+            step = np.minimum(np.minimum(power, soc * eta), -value)
+            soc -= step / eta
+            discharged += step
+    return discharged, charged
+
+
+def _simulate_chunk(args):
+    return simulate(*args)
+
+
+def sweep(supply, demand, capacity, power, efficiency=ROUND_TRIP_EFFICIENCY, max_workers=None):
+    """시나리오가 많으면 묶음으로 나눠 프로세스 풀에서 시뮬레이션 (결과 순서 유지)"""
+    capacity = np.asarray(capacity, dtype='float64')
+    power = np.asarray(power, dtype='float64')
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(capacity) // MIN_SCENARIOS_PER_WORKER)
+    if max_workers <= 1:
+        return simulate(supply, demand, capacity, power, efficiency)
+
+    chunks = np.array_split(np.arange(len(capacity)), max_workers)
+    tasks = [(supply, demand, capacity[c], power[c], efficiency) for c in chunks]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_simulate_chunk, tasks))
+    return (np.concatenate([r[0] for r in results]),
+            np.concatenate([r[1] for r in results]))
+
+
+def capacity_grid(external, max_capacity=None, steps=DEFAULT_STEPS):
+    """용량 후보 (기본 상한: 하루 외부 전력 최대값)"""
+    if max_capacity is None:
+        days = len(external) // 24
+        daily = external[:days * 24].reshape(days, 24).sum(axis=1) if days else external
+        max_capacity = float(daily.max()) if len(daily) else 0.0
+    return np.linspace(0, max_capacity, steps)
+
+
+def build_capacity_curve(supply, demand, capacities, durations=DEFAULT_DURATIONS,
+                         efficiency=ROUND_TRIP_EFFICIENCY, max_workers=None):
+    """지속시간별 용량 -> 매칭 RE100 곡선 (ess_capacity_curve.json 구조)"""
+    hourly = match(supply, demand)
+    total_demand = float(demand.sum())
+    base_matched = float(hourly['matched'].sum())
+
+    # 전체 (지속시간 x 용량) 조합을 한 번에 시뮬레이션
+    grid_capacity = np.tile(capacities, len(durations))
+    grid_power = grid_capacity / np.repeat(np.asarray(durations, dtype='float64'), len(capacities))
+    discharged, charged = sweep(supply, demand, grid_capacity, grid_power, efficiency, max_workers)
+
+    rates = (base_matched + discharged) / total_demand * 100 if total_demand > 0 else np.zeros_like(discharged)
+    rates = rates.reshape(len(durations), len(capacities))
+    discharged = discharged.reshape(len(durations), len(capacities))
+
+    labels = [f"{c:.3f}" for c in capacities]
+    curve = {}
+    discharge = {}
+    capacity_for_target = {}
+    for duration, row, energy in zip(durations, rates, discharged):
+        key = f"{duration}h"
+        curve[key] = dict(zip(labels, row.tolist()))
+        discharge[key] = dict(zip(labels, energy.tolist()))
+        capacity_for_target[key] = {
+            str(target): (float(capacities[np.argmax(row >= target)]) if (row >= target).any() else None)
+            for target in TARGET_RATES
+        }
+
+    return {
+        'assumptions': {
+            'round_trip_efficiency': efficiency,
+            'initial_soc': 0.0,
+            'durations_h': list(durations),
+            'capacity_unit': 'GWh',
+        },
+        'baseline': {
+            'supply': float(supply.sum()),
+            'demand': total_demand,
+            'matched': base_matched,
+            'surplus': float(hourly['surplus'].sum()),
+            'matched_re100_rate': base_matched / total_demand * 100 if total_demand > 0 else 0.0,
+        },
+        'matched_re100_rate': curve,
+        'discharged_gwh': discharge,
+        'capacity_for_target': capacity_for_target,
+    }
+
+
+def load_hourly_series(csv_file=integrated_csv):
+    """통합 CSV에서 시간별 총 공급/수요 시계열(GWh)"""
+    matrix = load_hourly_matrix(csv_file)
+    return matrix.total(SUPPLY_TYPES), matrix.total(['demand'])
+
+
+def build_ess_curve(csv_file=integrated_csv, durations=DEFAULT_DURATIONS, max_capacity=None,
+                    steps=DEFAULT_STEPS, efficiency=ROUND_TRIP_EFFICIENCY, max_workers=None):
+    """통합 CSV에서 기본 용량 구간으로 곡선 생성"""
+    supply, demand = load_hourly_series(csv_file)
+    capacities = capacity_grid(match(supply, demand)['external'], max_capacity, steps)
+    return build_capacity_curve(supply, demand, capacities, durations, efficiency, max_workers)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ESS 충방전 시뮬레이션 및 용량 스윕")
+    parser.add_argument('--csv', default=integrated_csv, help="통합 CSV 파일")
+    parser.add_argument('--output', default=str(output_file), help="결과 JSON 파일")
+    parser.add_argument('--durations', nargs='+', type=float, default=DEFAULT_DURATIONS,
+                        help="지속시간(시간) 목록, 출력 = 용량 / 지속시간")
+    parser.add_argument('--max-capacity', type=float, help="최대 용량 GWh (기본: 하루 외부 전력 최대값)")
+    parser.add_argument('--steps', type=int, default=DEFAULT_STEPS, help="용량 구간 수")
+    parser.add_argument('--efficiency', type=float, default=ROUND_TRIP_EFFICIENCY, help="왕복 효율")
+    parser.add_argument('--workers', type=int, help="프로세스 수 (기본: CPU 수)")
+    args = parser.parse_args()
+
+    supply, demand = load_hourly_series(args.csv)
+    hourly = match(supply, demand)
+    capacities = capacity_grid(hourly['external'], args.max_capacity, args.steps)
+    durations = [int(d) if d == int(d) else d for d in args.durations]
+
+    started = time.perf_counter()
+    curve = build_capacity_curve(supply, demand, capacities, durations, args.efficiency, args.workers)
+    elapsed = time.perf_counter() - started
+    write_json(curve, Path(args.output))
+
+    print(f"[OK] ESS 스윕 완료: 시나리오 {len(capacities) * len(durations):,}개 x "
+          f"{len(supply):,}시간 ({elapsed:.2f}s)")
+    print(f"  ESS 없음: {curve['baseline']['matched_re100_rate']:.2f}%")
+    for key, row in curve['matched_re100_rate'].items():
+        best_label = list(row)[-1]
+        print(f"  {key}: 최대 용량 {float(best_label):,.1f} GWh -> {row[best_label]:.2f}%")
+    print(f"  저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""부하 테스트용 대규모 데이터셋 생성
+
+발전소 N개 x 기업 M개 x Y년 규모의 발전소별 CSV, entities.csv, plant_list.csv, 연도별 통합 CSV
+파티션을 public/sample_data와 같은 형식으로 생성한다. 크기는 프리셋(small/medium/large)으로
+고르고 필요하면 개별 값을 옵션으로 덮어쓴다.
+
+엔티티마다 시계열을 하나씩 만들어 바로 기록하므로 메모리 사용량은 엔티티 하나의
+시계열 크기로 제한된다. 통합 CSV 파티션의 행은 엔티티 순서로 기록된다.
+
+사용 예:
+    python scripts/generate_loadtest_data.py medium
+    python scripts/generate_loadtest_data.py large --freq 15min --output-dir /data/loadtest
+"""
+import argparse
+import csv
+import time
+from pathlib import Path
+
+import numpy as np
+
+from aggregation_engine import project_root
+from entity_registry import registry_file, save_entities
+from partitions import partition_file
+from plant_registry import REGISTRY_FIELDS
+from synthetic_data import (
+    CSV_HEADER, DATETIME_FORMAT, DEFAULT_SEED, entity_rngs, time_index,
+    solar_shape, wind_shape, demand_shape,
+)
+
+# 프리셋: 발전소 수, 기업 수, 연도 수, 시간 해상도
+PRESETS = {
+    'small': {'plants': 6, 'companies': 10, 'years': 1, 'freq': 'h'},
+    'medium': {'plants': 50, 'companies': 73, 'years': 2, 'freq': 'h'},
+    'large': {'plants': 500, 'companies': 200, 'years': 3, 'freq': 'h'},
+}
+FREQS = {'h': 'h', '1h': 'h', '15min': '15min'}
+
+# 태양광 비율 및 설비용량 범위 (kW)
+SOLAR_SHARE = 0.5
+SOLAR_CAPACITY_KW = (10_000, 300_000)
+WIND_CAPACITY_KW = (20_000, 500_000)
+COMPANY_BASE_KW = (1_000, 50_000)
+KW_PER_GW = 1_000_000
+DEFAULT_START_YEAR = 2024
+
+default_output_root = project_root / ".cache" / "loadtest"
+
+
+def build_entities(plants, companies, seed=DEFAULT_SEED):
+    """발전소/기업 목록과 설비용량 결정 (엔티티 ID는 목록 순서대로 1부터)"""
+    rng = np.random.default_rng(seed)
+    n_solar = int(round(plants * SOLAR_SHARE))
+    entities = []
+    for i in range(plants):
+        if i < n_solar:
+            entities.append({'type': 'solar', 'plant_name': f"태양광{i + 1:03d}",
+                             'filename': f"solar_plant{i + 1}.csv",
+                             'capacity_kw': rng.uniform(*SOLAR_CAPACITY_KW)})
+        else:
+            j = i - n_solar + 1
+            entities.append({'type': 'wind', 'plant_name': f"풍력{j:03d}",
+                             'filename': f"wind_plant{j}.csv",
+                             'capacity_kw': rng.uniform(*WIND_CAPACITY_KW)})
+    for i in range(companies):
+        entities.append({'type': 'demand', 'plant_name': f"기업{i + 1:03d}",
+                         'filename': None, 'capacity_kw': rng.uniform(*COMPANY_BASE_KW)})
+    for entity_id, entity in enumerate(entities, start=1):
+        entity['id'] = entity_id
+    return entities
+
+
+def _series(entity, index, rng):
+    if entity['type'] == 'solar':
+        return solar_shape(index, rng, entity['capacity_kw'])
+    if entity['type'] == 'wind':
+        return wind_shape(index, rng, entity['capacity_kw'])
+    return demand_shape(index, rng, entity['capacity_kw'])
+
+
+def _write_rows(f, timestamps, entity, values):
+    lines = [
+        f"{ts},{entity['type']},{entity['plant_name']},{value:.3f}\n"
+        for ts, value in zip(timestamps, values.tolist())
+    ]
+    f.writelines(lines)
+
+
+def generate(output_dir, plants, companies, years, freq='h', start_year=DEFAULT_START_YEAR, seed=DEFAULT_SEED):
+    """데이터셋 생성 후 (총 행 수, {연도: 통합 CSV 파티션 경로}) 반환"""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    end_year = start_year + years - 1
+    index = time_index(f"{start_year}-01-01 00:00", f"{end_year}-12-31 23:59", freq=FREQS[freq])
+    timestamps = index.strftime(DATETIME_FORMAT).tolist()
+
+    entities = build_entities(plants, companies, seed)
+    rngs = entity_rngs(seed, len(entities))
+    # 연도별 파티션 행 구간 [start, end)
+    year_values = index.year.to_numpy()
+    year_ranges = {year: (int(np.searchsorted(year_values, year)), int(np.searchsorted(year_values, year, 'right')))
+                   for year in range(start_year, end_year + 1)}
+    integrated_files = {year: partition_file(year, output_dir) for year in year_ranges}
+
+    save_entities([{'id': e['id'], 'type': e['type'], 'name': e['plant_name'], 'data_name': e['plant_name']}
+                   for e in entities], output_dir / registry_file.name)
+    with open(output_dir / "plant_list.csv", 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(REGISTRY_FIELDS)
+        for entity in entities:
+            if entity['filename']:
+                # 원본 데이터가 현재 설비용량 그대로이므로 배율 1
+                capacity_gw = round(entity['capacity_kw'] / KW_PER_GW, 6)
+                writer.writerow([entity['id'], entity['filename'], capacity_gw, capacity_gw])
+
+    total_rows = 0
+    header = ','.join(CSV_HEADER) + '\n'
+    partitions = {year: open(path, 'w', encoding='utf-8') for year, path in integrated_files.items()}
+    try:
+        for f in partitions.values():
+            f.write(header)
+        for entity, rng in zip(entities, rngs):
+            values = _series(entity, index, rng)
+            for year, (start, end) in year_ranges.items():
+                _write_rows(partitions[year], timestamps[start:end], entity, values[start:end])
+            total_rows += len(values)
+            if entity['filename']:
+                with open(output_dir / entity['filename'], 'w', encoding='utf-8') as f:
+                    f.write(header)
+                    _write_rows(f, timestamps, entity, values)
+                total_rows += len(values)
+    finally:
+        for f in partitions.values():
+            f.close()
+
+    return total_rows, integrated_files
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트용 데이터셋 생성")
+    parser.add_argument('preset', choices=sorted(PRESETS), help="데이터셋 크기 프리셋")
+    parser.add_argument('--plants', type=int, help="발전소 수")
+    parser.add_argument('--companies', type=int, help="기업 수")
+    parser.add_argument('--years', type=int, help="연도 수")
+    parser.add_argument('--freq', choices=sorted(FREQS), help="시간 해상도 (h, 15min)")
+    parser.add_argument('--start-year', type=int, default=DEFAULT_START_YEAR, help="시작 연도")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="난수 시드")
+    parser.add_argument('--output-dir', help="출력 폴더 (기본: .cache/loadtest/<preset>)")
+    args = parser.parse_args()
+
+    config = dict(PRESETS[args.preset])
+    for key in ('plants', 'companies', 'years', 'freq'):
+        if getattr(args, key) is not None:
+            config[key] = getattr(args, key)
+    output_dir = Path(args.output_dir) if args.output_dir else default_output_root / args.preset
+
+    print(f"부하 테스트 데이터 생성: {args.preset} "
+          f"(발전소 {config['plants']}개, 기업 {config['companies']}개, "
+          f"{config['years']}년, {config['freq']})")
+    started = time.perf_counter()
+    total_rows, integrated_files = generate(output_dir, start_year=args.start_year, seed=args.seed, **config)
+    elapsed = time.perf_counter() - started
+
+    print(f"[OK] {total_rows:,}행 생성 ({elapsed:.1f}s)")
+    print(f"  - {output_dir / registry_file.name}")
+    print(f"  - {output_dir / 'plant_list.csv'}")
+    for integrated_file in integrated_files.values():
+        print(f"  - {integrated_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+"""시간 단위(24/7) RE100 매칭 엔진
+
+월/연 합계의 공급/수요 비율(볼륨 기준 RE100)은 공급이 모자란 시간을 다른 시간의
+잉여로 덮어 버린다. 여기서는 모든 발전소/기업 시계열을 공통 시간 인덱스의
+[엔티티 x 시간] 행렬로 정렬한 뒤, 시간마다 매칭량 = min(공급, 수요),
+외부 전력 = 수요 - 매칭량, 잉여 = 공급 - 매칭량을 계산하고
+시간대별/일별/월별 매칭 RE100을 한 번의 벡터 연산으로 집계한다.
+
+기업별 매칭은 매 시간 공급을 수요 비율로 배분한 값(매칭량 x 기업 수요 / 전체 수요)이다.
+
+사용 예:
+    python scripts/hourly_matching.py
+    python scripts/hourly_matching.py --csv .cache/loadtest/medium/sample_data_integrated_2024_integrated.csv
+"""
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from aggregation_engine import (
+    agg_data_dir, integrated_csv, KWH_PER_GWH, SUPPLY_TYPES, write_json,
+)
+from entity_registry import registry_file, row_keys
+from parallel_plants import plant_list_file
+from partitions import require_partition
+from plant_registry import scale_matrix
+from timeseries_store import open_store
+from warm_cache import cached, file_signature
+
+output_file = agg_data_dir / "hourly_matching.json"
+
+NS_PER_HOUR = 3_600_000_000_000
+
+
+class HourlyMatrix:
+    """공통 시간 인덱스에 정렬된 [엔티티 x 시간] GWh 행렬"""
+
+    def __init__(self, index, types, names, values):
+        self.index = index
+        self.types = np.asarray(types)
+        self.names = list(names)
+        self.values = values
+
+    def rows(self, types):
+        return np.isin(self.types, types)
+
+    def copy(self):
+        return HourlyMatrix(self.index, self.types, self.names, self.values.copy())
+
+    def keys(self):
+        """행별 엔티티 ID 문자열"""
+        return row_keys(self.types.tolist(), self.names)
+
+    def total(self, types):
+        """해당 타입 엔티티 합계 시계열"""
+        return self.values[self.rows(types)].sum(axis=0)
+
+
+def _nanoseconds(values):
+    """datetime 값을 ns 정수 배열로 변환 (pandas 버전별 기본 해상도 차이 무시)"""
+    return np.asarray(values, dtype='datetime64[ns]').astype('int64')
+
+
+def build_hourly_matrix(df):
+    """datetime 인덱스 DataFrame을 시간 단위 행렬로 변환 (15분 등 세부 간격은 시간별 합계)"""
+    stamps = _nanoseconds(df.index if isinstance(df.index, pd.DatetimeIndex) else df['datetime'])
+    start = stamps.min() // NS_PER_HOUR
+    hour_pos = stamps // NS_PER_HOUR - start
+    n_hours = int(hour_pos.max()) + 1
+
+    # 엔티티 번호는 (type, plant_name) 첫 등장 순서, 이름이 없는 행(-1)은 제외
+    entity = df.groupby(['type', 'plant_name'], observed=True, sort=False).ngroup().to_numpy()
+    valid = entity >= 0
+    entity, hour_pos = entity[valid], hour_pos[valid]
+    n_entities = int(entity.max()) + 1 if len(entity) else 0
+    _, first_rows = np.unique(entity, return_index=True)
+    first_rows = np.flatnonzero(valid)[first_rows]
+
+    weights = df['value'].to_numpy(dtype='float64')[valid] / KWH_PER_GWH
+    flat = np.bincount(entity * n_hours + hour_pos, weights=weights, minlength=n_entities * n_hours)
+
+    index = pd.DatetimeIndex((np.arange(start, start + n_hours) * NS_PER_HOUR).astype('datetime64[ns]'))
+    return HourlyMatrix(
+        index,
+        [str(t) for t in df['type'].to_numpy()[first_rows]],
+        [str(n).strip() for n in df['plant_name'].to_numpy()[first_rows]],
+        flat.reshape(n_entities, n_hours),
+    )
+
+
+def load_hourly_matrix(csv_file=integrated_csv):
+    """메모리 맵 저장소를 거쳐 통합 CSV의 시간 단위 행렬 로드 (원본이 같으면 파싱 없음)
+
+    레지스트리의 발전소별 설비용량 배율을 적용한다. 장기 실행 프로세스(warm_cache 활성화)에서는
+    원본과 레지스트리가 같으면 메모리의 행렬 복사본을 돌려준다.
+    """
+    csv_file = require_partition(csv_file).resolve()
+    matrix = cached('hourly', csv_file, file_signature(csv_file, plant_list_file, registry_file),
+                    lambda: scale_matrix(HourlyMatrix(*open_store(csv_file).hourly())))
+    return matrix.copy()
+
+
+def match(supply, demand):
+    """시간별 매칭량 / 외부 전력 / 잉여 (배열 모양 그대로)"""
+    matched = np.minimum(supply, demand)
+    return {
+        'supply': supply,
+        'demand': demand,
+        'matched': matched,
+        'external': demand - matched,
+        'surplus': supply - matched,
+    }
+
+
+def _rate(numerator, denominator):
+    """비율(%) 계산, 수요가 0이면 0"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator > 0, np.minimum(numerator / denominator * 100, 100), 0.0)
+
+
+def period_sums(codes, arrays):
+    """정렬된 기간 코드별로 마지막 축을 합산 (np.add.reduceat), (라벨 위치, 합계) 반환"""
+    starts = np.concatenate([[0], np.flatnonzero(np.diff(codes)) + 1])
+    return starts, {key: np.add.reduceat(values, starts, axis=-1) for key, values in arrays.items()}
+
+
+def hourly_matching(matrix):
+    """전체 매칭 계산 결과 (시간별 배열과 일/월/시간대 집계)"""
+    hourly = match(matrix.total(SUPPLY_TYPES), matrix.total(['demand']))
+
+    index = matrix.index
+    month_codes = index.year.to_numpy() * 100 + index.month.to_numpy()
+    day_codes = _nanoseconds(index) // (24 * NS_PER_HOUR)
+    month_starts, monthly = period_sums(month_codes, hourly)
+    day_starts, daily = period_sums(day_codes, hourly)
+
+    hour_of_day = index.hour.to_numpy()
+    profile = {
+        key: np.bincount(hour_of_day, weights=values, minlength=24)
+        for key, values in hourly.items()
+    }
+
+    # 기업별 매칭량 = 시간별 매칭량 x 기업 수요 비중
+    demand_rows = matrix.rows(['demand'])
+    company_demand = matrix.values[demand_rows]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        share = np.where(hourly['demand'] > 0, company_demand / hourly['demand'], 0.0)
+    _, company_monthly = period_sums(month_codes, {
+        'demand': company_demand,
+        'matched': share * hourly['matched'],
+    })
+
+    return {
+        'index': index,
+        'hourly': hourly,
+        'monthly_labels': index[month_starts].strftime('%Y-%m').tolist(),
+        'monthly': monthly,
+        'daily_labels': index[day_starts].strftime('%Y-%m-%d').tolist(),
+        'daily': daily,
+        'hour_of_day': profile,
+        'companies': [key for key, row in zip(matrix.keys(), demand_rows) if row],
+        'company_monthly': company_monthly,
+    }
+
+
+def _period_dict(labels, sums):
+    """{지표: {기간: 값}} 형태로 변환하고 매칭/볼륨 기준 RE100(%) 추가"""
+    data = {key: dict(zip(labels, values.tolist())) for key, values in sums.items()}
+    data['matched_re100_rate'] = dict(zip(labels, _rate(sums['matched'], sums['demand']).tolist()))
+    data['volumetric_re100_rate'] = dict(zip(labels, _rate(sums['supply'], sums['demand']).tolist()))
+    return data
+
+
+def build_matching_output(result):
+    """hourly_matching.json 구조로 변환"""
+    hourly = result['hourly']
+    totals = {key: float(values.sum()) for key, values in hourly.items()}
+    demand_hours = hourly['demand'] > 0
+
+    summary = dict(totals)
+    summary['matched_re100_rate'] = float(_rate(totals['matched'], totals['demand']))
+    summary['volumetric_re100_rate'] = float(_rate(totals['supply'], totals['demand']))
+    summary['hours'] = int(len(result['index']))
+    summary['fully_matched_hours'] = int((demand_hours & (hourly['external'] <= 0)).sum())
+    summary['unmatched_hours'] = int((demand_hours & (hourly['matched'] <= 0)).sum())
+
+    company_rates = _rate(result['company_monthly']['matched'], result['company_monthly']['demand'])
+    return {
+        'summary': summary,
+        'monthly': _period_dict(result['monthly_labels'], result['monthly']),
+        'daily': _period_dict(result['daily_labels'], result['daily']),
+        'hour_of_day': _period_dict(list(range(24)), result['hour_of_day']),
+        'company_monthly_matched_re100_rate': {
+            company: dict(zip(result['monthly_labels'], rates.tolist()))
+            for company, rates in zip(result['companies'], company_rates)
+            if company is not None
+        },
+    }
+
+
+def build_hourly_matching(csv_file=integrated_csv):
+    """통합 CSV에서 매칭 결과(JSON 구조) 생성"""
+    return build_matching_output(hourly_matching(load_hourly_matrix(csv_file)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시간 단위(24/7) RE100 매칭 집계")
+    parser.add_argument('--csv', default=integrated_csv, help="통합 CSV 파일")
+    parser.add_argument('--output', default=str(output_file), help="결과 JSON 파일")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    matrix = load_hourly_matrix(args.csv)
+    output = build_matching_output(hourly_matching(matrix))
+    elapsed = time.perf_counter() - started
+    write_json(output, Path(args.output))
+
+    summary = output['summary']
+    print(f"[OK] 시간 단위 매칭 완료: 엔티티 {len(matrix.names)}개 x {summary['hours']:,}시간 ({elapsed:.2f}s)")
+    print(f"  매칭 RE100: {summary['matched_re100_rate']:.2f}% "
+          f"(볼륨 기준 {summary['volumetric_re100_rate']:.2f}%)")
+    print(f"  외부 전력: {summary['external']:,.2f} GWh, 잉여: {summary['surplus']:,.2f} GWh")
+    print(f"  저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""통합 CSV 증분 재집계
+
+(type, plant_name, month, hour) 셀별 합계/개수를 상태 파일에 보관하고,
+통합 CSV에 새로 추가된 행만 읽어 해당 월의 셀에 더한다.
+월별 합계는 셀 합계의 합, 시간대별 평균은 셀 합계/개수의 비율로 다시 계산하므로
+1년치 원본을 다시 읽지 않아도 전체 재집계와 같은 결과가 나온다.
+
+파일이 뒤에 덧붙여진 것이 아니라 새로 쓰여진 경우(크기 감소, 마지막 처리 구간 변경)는
+자동으로 전체 재집계로 전환한다.
+
+상태는 연도 파티션(partitions.py) 파일마다 따로 두므로 한 연도를 재집계할 때
+다른 연도의 원본이나 상태는 읽지 않는다.
+"""
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pandas as pd
+
+from aggregation_engine import (
+    project_root, integrated_csv, agg_data_dir, GROUP_KEYS,
+    merge_cells, build_outputs, write_outputs, year_output_dir,
+)
+from partitions import partition_file, integrated_partitions, require_partition
+from plant_registry import scale_cells
+from streaming_reader import aggregate_range, last_line_end
+
+state_dir = project_root / ".cache" / "aggregation_state"
+
+STATE_VERSION = 1
+# 처리한 위치 직전 구간의 해시로 파일이 다시 쓰였는지 확인
+ANCHOR_BYTES = 4096
+
+
+def _anchor_hash(f, offset):
+    start = max(0, offset - ANCHOR_BYTES)
+    f.seek(start)
+    return hashlib.blake2b(f.read(offset - start), digest_size=16).hexdigest()
+
+
+def state_path(csv_file):
+    """원본 파일별 상태 파일 경로"""
+    csv_file = Path(csv_file).resolve()
+    key = hashlib.blake2b(str(csv_file).encode('utf-8'), digest_size=8).hexdigest()
+    return state_dir / f"{csv_file.stem}-{key}.json"
+
+
+def load_state(path):
+    """상태 파일 로드 (없거나 형식이 다르면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if state.get('version') != STATE_VERSION:
+        return None
+    state['cells'] = pd.DataFrame(state['cells'], columns=GROUP_KEYS + ['sum', 'count'])
+    return state
+
+
+def save_state(state, path):
+    """셀 집계 상태를 JSON으로 저장"""
+    cells = state['cells']
+    payload = dict(state)
+    payload['cells'] = {column: cells[column].tolist() for column in cells.columns}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(payload, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _state_is_valid(state, csv_file, f, size):
+    return (
+        state is not None
+        and state['source'] == str(csv_file)
+        and state['offset'] <= size
+        and state['anchor'] == _anchor_hash(f, state['offset'])
+    )
+
+
+def update(csv_file=integrated_csv, path=None, full=False):
+    """새로 추가된 행만 반영하여 셀 상태 갱신
+
+    반환값: (셀 집계, 변경된 월 목록, 전체 재집계 여부)
+    """
+    csv_file = require_partition(csv_file).resolve()
+    path = path or state_path(csv_file)
+    state = None if full else load_state(path)
+    size = csv_file.stat().st_size
+
+    # 미완성 마지막 행은 다음 실행으로 넘김
+    offset = last_line_end(csv_file)
+
+    with open(csv_file, 'rb') as f:
+        header = f.readline()
+        if _state_is_valid(state, csv_file, f, size):
+            rebuilt = False
+            start = state['offset']
+            base_cells = state['cells']
+        else:
+            rebuilt = True
+            start = len(header)
+            base_cells = None
+        anchor = _anchor_hash(f, offset)
+
+    # 새 구간은 청크 단위로 읽어 메모리 사용량을 제한
+    new_cells = aggregate_range(csv_file, start, offset).cells
+    touched_months = []
+    if new_cells is not None:
+        touched_months = sorted(new_cells['month'].unique())
+    cells = merge_cells(base_cells, new_cells)
+
+    save_state({
+        'version': STATE_VERSION,
+        'source': str(csv_file),
+        'offset': offset,
+        'anchor': anchor,
+        'cells': cells,
+    }, path)
+    return cells, touched_months, rebuilt
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통합 CSV 증분 재집계")
+    parser.add_argument('--csv', default=None, help="통합 CSV 경로 (기본: 가장 최근 연도 파티션)")
+    parser.add_argument('--year', type=int, help="재집계할 연도 파티션")
+    parser.add_argument('--output-dir', default=None,
+                        help="집계 파일 저장 폴더 (기본: agg_data, --year 지정 시 agg_data/<연도>)")
+    parser.add_argument('--full', action='store_true', help="상태를 무시하고 전체 재집계")
+    args = parser.parse_args()
+
+    if args.year is not None and args.year not in integrated_partitions():
+        parser.error(f"연도 파티션 없음: {partition_file(args.year).name}")
+    csv_file = Path(args.csv) if args.csv else partition_file(args.year) if args.year else integrated_csv
+    cells, touched_months, rebuilt = update(csv_file, full=args.full)
+
+    if not rebuilt and not touched_months:
+        print("[SKIP] 새로 추가된 행이 없습니다.")
+        return
+
+    output_dir = args.output_dir or (year_output_dir(args.year) if args.year else agg_data_dir)
+    # 상태는 원본 그대로의 셀이므로 다른 산출물과 같이 설비용량 배율(plant_list.csv)을 적용
+    outputs = build_outputs(scale_cells(cells))
+    written = write_outputs(outputs, output_dir)
+
+    if rebuilt:
+        print(f"[OK] 전체 재집계 완료 ({len(cells):,}개 셀)")
+    else:
+        print(f"[OK] 증분 재집계 완료: {', '.join(touched_months)}")
+    for output_file in written:
+        print(f"  - {output_file.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""발전소별 CSV 병렬 로드 및 집계
+
+plant_list.csv의 발전소 파일은 서로 독립적이므로 프로세스 풀에서 파일당 작업 하나로
+나누어 읽고 집계한다. 각 작업은 원본 행 대신 월별 합계와 시간대별 합계/개수만 돌려주고,
+병합은 plant_list.csv 순서대로 수행하므로 실행마다 결과가 같다.
+"""
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from aggregation_engine import sample_data_dir, KWH_PER_GWH
+from csv_cache import load_csv
+from entity_registry import load_entities, registry_file
+from warm_cache import enabled as warm_cache_enabled
+
+plant_list_file = sample_data_dir / "plant_list.csv"
+
+
+def load_plant_list(path=plant_list_file):
+    """plant_list.csv 읽기 (파일명이 없는 행은 제외)
+
+    타입과 이름은 같은 폴더의 엔티티 레지스트리(entities.csv)에서 가져온다. plant_name은 원본 CSV 행의
+    이름(data_name), name은 표시 이름이다.
+    """
+    entities = {e['id']: e for e in load_entities(Path(path).parent / registry_file.name)}
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        entries = []
+        for row in csv.DictReader(f):
+            if not (row.get('filename') and row['filename'].strip()):
+                continue
+            entity = entities[int(row['id'])]
+            entries.append({'id': entity['id'], 'plant_name': entity['data_name'], 'name': entity['name'],
+                            'type': entity['type'], 'filename': row['filename'].strip()})
+        return entries
+
+
+def process_plant_file(entry, data_dir=sample_data_dir):
+    """발전소 파일 하나를 읽어 월별/시간대별 부분 집계 반환 (작업 프로세스에서 실행)"""
+    plant_file = Path(data_dir) / entry['filename']
+    result = dict(entry, exists=plant_file.exists())
+    if not result['exists']:
+        return result
+
+    df = load_csv(plant_file)
+    values = df['value'].astype('float64')
+    monthly = values.groupby(df.index.to_period('M')).sum() / KWH_PER_GWH
+    hourly = (values / KWH_PER_GWH).groupby(df.index.hour).agg(['sum', 'count'])
+    hourly = hourly.reindex(range(24), fill_value=0)
+
+    result.update(
+        rows=len(df),
+        total_kwh=float(values.sum()),
+        total_gwh=float(values.sum()) / KWH_PER_GWH,
+        monthly={str(period): float(value) for period, value in monthly.items()},
+        hourly_sum=[float(v) for v in hourly['sum']],
+        hourly_count=[int(v) for v in hourly['count']],
+    )
+    return result
+
+
+def _process(args):
+    return process_plant_file(*args)
+
+
+def process_plants(entries, data_dir=sample_data_dir, max_workers=None):
+    """발전소 파일들을 프로세스 풀로 병렬 처리 (결과는 입력 순서 유지)
+
+    메모리 캐시(warm_cache)가 켜진 장기 실행 프로세스에서는 기본적으로 같은 프로세스에서
+    처리해 이미 읽은 발전소 파일을 재사용한다.
+    """
+    entries = list(entries)
+    if max_workers is None:
+        max_workers = 1 if warm_cache_enabled() else min(len(entries), os.cpu_count() or 1)
+    tasks = [(entry, data_dir) for entry in entries]
+    if max_workers <= 1 or len(entries) <= 1:
+        return [_process(task) for task in tasks]
+
+    # 발전소가 많을 때 작업 전달 오버헤드를 줄이기 위해 묶어서 전달
+    chunksize = max(1, len(tasks) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_process, tasks, chunksize=chunksize))
+
+
+def merge_partials(results):
+    """발전소별 부분 집계를 타입별로 병합 (plant_list 순서대로 더해 결과 고정)"""
+    merged = {}
+    for result in results:
+        if not result.get('exists'):
+            continue
+        bucket = merged.setdefault(result['type'], {
+            'total_gwh': 0.0,
+            'monthly': {},
+            'hourly_sum': [0.0] * 24,
+            'hourly_count': [0] * 24,
+        })
+        bucket['total_gwh'] += result['total_gwh']
+        for month, value in result['monthly'].items():
+            bucket['monthly'][month] = bucket['monthly'].get(month, 0.0) + value
+        for hour in range(24):
+            bucket['hourly_sum'][hour] += result['hourly_sum'][hour]
+            bucket['hourly_count'][hour] += result['hourly_count'][hour]
+
+    for bucket in merged.values():
+        bucket['monthly'] = dict(sorted(bucket['monthly'].items()))
+    return merged
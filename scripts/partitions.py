@@ -0,0 +1,211 @@
+"""통합 수요 CSV 연도 파티션
+
+통합 CSV는 연도마다 public/sample_data/sample_data_integrated_<연도>_integrated.csv
+파일 하나로 나누어 둔다. 한 연도의 재집계나 조회는 그 연도 파일만 읽으므로 이력이
+여러 해로 늘어나도 비용은 연도 하나 크기로 유지된다. 연도와 월 달력은 코드에 고정하지
+않고 존재하는 파티션 파일과 각 파일의 첫/마지막 행 시각에서 구한다.
+
+통합 CSV는 git에 없으므로 새로 받은 저장소에는 파티션이 없다. 이때 기본 파티션은 None이고,
+통합 CSV를 읽으려는 곳에서는 NoPartitionError(FileNotFoundError)가 난다.
+
+사용 예:
+    python scripts/partitions.py                          # 파티션 목록과 데이터 기간
+    python scripts/partitions.py --split history.csv      # 여러 해가 섞인 CSV를 연도별로 분할
+"""
+import argparse
+import os
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# aggregation_engine이 이 모듈을 사용하므로 경로를 직접 설정
+project_root = Path(__file__).resolve().parent.parent
+sample_data_dir = project_root / "public" / "sample_data"
+
+PARTITION_PATTERN = re.compile(r"^sample_data_integrated_(\d{4})_integrated\.csv$")
+# 마지막 행을 찾을 때 파일 끝에서 읽는 크기
+TAIL_BYTES = 1 << 16
+
+
+class NoPartitionError(FileNotFoundError):
+    """통합 CSV 연도 파티션이 하나도 없음"""
+
+    def __init__(self, data_dir=sample_data_dir):
+        super().__init__(f"통합 CSV 파티션 없음: {Path(data_dir) / 'sample_data_integrated_<연도>_integrated.csv'} "
+                         f"(python scripts/partitions.py --split <통합 CSV> 로 생성)")
+
+
+def partition_file(year, data_dir=sample_data_dir):
+    """연도 파티션 파일 경로 (없어도 경로는 반환)"""
+    return Path(data_dir) / f"sample_data_integrated_{int(year)}_integrated.csv"
+
+
+def integrated_partitions(data_dir=sample_data_dir):
+    """존재하는 연도 파티션 {연도: 경로} (연도 순)"""
+    found = {}
+    data_dir = Path(data_dir)
+    if data_dir.exists():
+        for path in data_dir.iterdir():
+            match = PARTITION_PATTERN.match(path.name)
+            if match and path.is_file():
+                found[int(match.group(1))] = path
+    return dict(sorted(found.items()))
+
+
+def latest_year(data_dir=sample_data_dir):
+    """가장 최근 파티션 연도 (파티션이 없으면 None)"""
+    years = list(integrated_partitions(data_dir))
+    return years[-1] if years else None
+
+
+def default_partition(data_dir=sample_data_dir):
+    """기본 통합 CSV (가장 최근 연도 파티션, 파티션이 없으면 None)"""
+    year = latest_year(data_dir)
+    return None if year is None else partition_file(year, data_dir)
+
+
+def require_partition(csv_file, data_dir=sample_data_dir):
+    """통합 CSV 경로 (기본 파티션이 None이면 NoPartitionError)"""
+    if csv_file is None:
+        raise NoPartitionError(data_dir)
+    return Path(csv_file)
+
+
+def _timestamp(line):
+    field = line.split(b',', 1)[0].strip().strip(b'"').decode('utf-8')
+    return datetime.fromisoformat(field)
+
+
+def data_span(csv_file):
+    """파일의 첫 행과 마지막 완결 행 시각 (파일 전체를 읽지 않음, 데이터가 없으면 None)"""
+    size = os.path.getsize(csv_file)
+    with open(csv_file, 'rb') as f:
+        f.readline()
+        first_line = f.readline()
+        if not first_line.strip():
+            return None
+        f.seek(max(0, size - TAIL_BYTES))
+        tail = f.read()
+    # 미완성 마지막 행은 제외
+    lines = tail.split(b'\n')[:-1] if not tail.endswith(b'\n') else tail.split(b'\n')
+    last_line = next((line for line in reversed(lines) if line.strip()), first_line)
+    return _timestamp(first_line), _timestamp(last_line)
+
+
+def month_keys(year=None, data_dir=sample_data_dir):
+    """연도 파티션의 데이터 기간에 속한 월 키 ("YYYY-MM", 해당 연도 파일이 없으면 12개월)
+
+    year를 주지 않으면 가장 최근 파티션 연도이며, 파티션이 하나도 없으면 NoPartitionError.
+    """
+    year = latest_year(data_dir) if year is None else int(year)
+    if year is None:
+        raise NoPartitionError(data_dir)
+    first_month, last_month = 1, 12
+    path = integrated_partitions(data_dir).get(year)
+    span = data_span(path) if path is not None else None
+    if span is not None:
+        first, last = span
+        first_month = first.month if first.year == year else 1
+        last_month = last.month if last.year == year else 12
+    return [f"{year}-{month:02d}" for month in range(first_month, last_month + 1)]
+
+
+def partitions_for(start=None, end=None, years=None, data_dir=sample_data_dir):
+    """연도 목록 또는 [start, end) 기간에 걸친 파티션만 {연도: 경로}로 반환 (파티션 가지치기)"""
+    partitions = integrated_partitions(data_dir)
+    if years is not None:
+        years = {int(year) for year in years}
+        partitions = {year: path for year, path in partitions.items() if year in years}
+    if start is not None:
+        first_year = datetime.fromisoformat(str(start)).year
+        partitions = {year: path for year, path in partitions.items() if year >= first_year}
+    if end is not None:
+        end = datetime.fromisoformat(str(end))
+        # 끝 시각은 제외이므로 1월 1일 0시로 끝나면 그 해는 포함하지 않음
+        last_year = end.year - 1 if end == datetime(end.year, 1, 1) else end.year
+        partitions = {year: path for year, path in partitions.items() if year <= last_year}
+    return partitions
+
+
+def split_by_year(csv_file, data_dir=sample_data_dir, overwrite=False):
+    """여러 해가 섞인 통합 CSV를 연도 파티션 파일로 분할하고 {연도: 행 수} 반환
+
+    행을 한 줄씩 연도별 임시 파일로 옮기므로 메모리 사용량은 파일 크기와 무관하다.
+    이미 있는 파티션은 overwrite=True 일 때만 교체한다.
+    """
+    outputs = {}
+    rows = {}
+
+    def tmp_path(year):
+        return partition_file(year, data_dir).with_suffix('.csv.tmp')
+
+    try:
+        with open(csv_file, 'rb') as f:
+            header = f.readline()
+            for line in f:
+                if not line.strip():
+                    continue
+                # datetime 컬럼 앞 4자리가 연도
+                year = int(line.lstrip(b'"')[:4])
+                out = outputs.get(year)
+                if out is None:
+                    out = outputs[year] = open(tmp_path(year), 'wb')
+                    out.write(header)
+                    rows[year] = 0
+                out.write(line if line.endswith(b'\n') else line + b'\n')
+                rows[year] += 1
+    finally:
+        for out in outputs.values():
+            out.close()
+
+    existing = sorted(year for year in outputs if partition_file(year, data_dir).exists())
+    if existing and not overwrite:
+        for year in outputs:
+            tmp_path(year).unlink()
+        raise FileExistsError(f"이미 있는 파티션: {', '.join(map(str, existing))} (--overwrite로 교체)")
+    for year in outputs:
+        os.replace(tmp_path(year), partition_file(year, data_dir))
+    return dict(sorted(rows.items()))
+
+
+def build_partitions(data_dir=sample_data_dir):
+    """파티션 목록 {연도: {file, start, end, months}}"""
+    partitions = {}
+    for year, path in integrated_partitions(data_dir).items():
+        span = data_span(path)
+        partitions[str(year)] = {
+            'file': path.name,
+            'start': span[0].isoformat(sep=' ', timespec='minutes') if span else None,
+            'end': span[1].isoformat(sep=' ', timespec='minutes') if span else None,
+            'months': month_keys(year, data_dir),
+        }
+    return partitions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="통합 CSV 연도 파티션 조회/분할")
+    parser.add_argument('--split', help="여러 해가 섞인 통합 CSV를 연도 파티션으로 분할")
+    parser.add_argument('--overwrite', action='store_true', help="이미 있는 파티션도 교체")
+    parser.add_argument('--data-dir', default=str(sample_data_dir), help="파티션 폴더")
+    args = parser.parse_args()
+
+    if args.split:
+        try:
+            counts = split_by_year(args.split, args.data_dir, overwrite=args.overwrite)
+        except FileExistsError as e:
+            print(f"[FAIL] {e}")
+            sys.exit(1)
+        for year, count in counts.items():
+            print(f"[OK] {partition_file(year, args.data_dir).name}: {count:,}행")
+
+    partitions = build_partitions(args.data_dir)
+    if not partitions:
+        print(f"[SKIP] 파티션 없음: {args.data_dir}")
+        return
+    for year, info in partitions.items():
+        print(f"{year}  {info['file']}  {info['start']} ~ {info['end']}  ({len(info['months'])}개월)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+"""파이프라인 단계별 실행 지표 (load, parse, aggregate, serialize, write)
+
+집계 코드의 각 단계를 stage(이름) 블록으로 감싸 두고, 기록기가 활성화된 실행에서만
+단계별 wall 시간, CPU 시간(스레드 기준), 처리 행 수/바이트 수, 최대 메모리(RSS)를 모은다.
+기록기가 없으면 stage()는 아무 것도 측정하지 않는다.
+
+단계가 중첩되면(노드 빌드 안의 CSV 파싱 등) 바깥 단계의 시간에서 안쪽 단계 시간을 빼므로
+단계별 시간의 합이 실제 실행 시간과 같다. 대상(target)을 지정하지 않은 단계는 바깥 단계의
+대상(산출 파일명)을 물려받는다.
+
+결과는 JSON 실행 리포트와 Prometheus 텍스트 형식(.prom, node_exporter textfile collector용)
+으로 저장한다. profile=True 이면 단계마다 cProfile 결과(.prof)도 저장하며,
+snakeviz 또는 flameprof(`flameprof parse.prof > parse.svg`)로 플레임그래프를 볼 수 있다.
+
+사용 예:
+    python scripts/re100_agg.py --force --metrics        # 실행 지표 저장
+    python scripts/re100_agg.py --force --profile        # 지표 + 단계별 cProfile
+    python scripts/pipeline_metrics.py                   # 마지막 리포트 출력
+"""
+import argparse
+import cProfile
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows: 최대 RSS는 측정하지 않음
+    resource = None
+
+project_root = Path(__file__).resolve().parent.parent
+metrics_dir = project_root / ".cache" / "metrics"
+
+STAGES = ['load', 'parse', 'aggregate', 'serialize', 'write']
+METRIC_PREFIX = "re100"
+
+_active = None
+_local = threading.local()
+
+
+def peak_rss_mb():
+    """프로세스 최대 RSS (MB, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def format_mb(value, digits=1):
+    """MB 값 표시 (측정하지 않았으면 '-')"""
+    return '-' if value is None else f"{value:.{digits}f}MB"
+
+
+class _Frame:
+    """진행 중인 단계 하나 (스레드별 스택 원소)"""
+
+    def __init__(self, key, profiler):
+        self.key = key
+        self.profiler = profiler
+        self.info = {'rows': None, 'bytes': None}
+        self.child_wall = 0.0
+        self.child_cpu = 0.0
+
+
+class StageRecorder:
+    """(단계, 대상)별 지표 누적 기록기"""
+
+    def __init__(self, run_name="re100_agg", profile=False):
+        self.run_name = run_name
+        self.profile = profile
+        self.started_at = datetime.now().isoformat(timespec='seconds')
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._profilers = {}
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        self._rss_start = peak_rss_mb()
+        self.wall_seconds = None
+        self.cpu_seconds = None
+
+    def _profiler(self, key):
+        if not self.profile:
+            return None
+        with self._lock:
+            # cProfile 객체는 스레드마다 따로 두고 저장할 때 합친다
+            return self._profilers.setdefault((key, threading.get_ident()), cProfile.Profile())
+
+    @contextmanager
+    def stage(self, name, target=None):
+        """단계 하나를 측정 (yield 된 dict에 rows/bytes를 채우면 함께 기록)"""
+        if not hasattr(_local, 'stack'):
+            _local.stack = []
+        stack = _local.stack
+        parent = stack[-1] if stack else None
+        if target is None and parent is not None:
+            target = parent.key[1]
+        frame = _Frame((name, target), self._profiler((name, target)))
+
+        # 프로파일러는 한 스레드에 하나만 켤 수 있으므로 바깥 단계 것을 잠시 끈다
+        if parent is not None and parent.profiler is not None:
+            parent.profiler.disable()
+        if frame.profiler is not None:
+            frame.profiler.enable()
+        stack.append(frame)
+        rss_before = peak_rss_mb()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            yield frame.info
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            stack.pop()
+            if frame.profiler is not None:
+                frame.profiler.disable()
+            if parent is not None:
+                parent.child_wall += wall
+                parent.child_cpu += cpu
+                if parent.profiler is not None:
+                    parent.profiler.enable()
+            self._add(frame, wall - frame.child_wall, cpu - frame.child_cpu, rss_before)
+
+    def _add(self, frame, wall, cpu, rss_before):
+        rss = peak_rss_mb()
+        with self._lock:
+            stats = self._stats.setdefault(frame.key, {
+                'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0,
+                'rows': None, 'bytes': None, 'peak_rss_mb': None, 'rss_growth_mb': None,
+            })
+            stats['calls'] += 1
+            stats['wall_seconds'] += wall
+            stats['cpu_seconds'] += cpu
+            for field in ['rows', 'bytes']:
+                if frame.info[field] is not None:
+                    stats[field] = (stats[field] or 0) + int(frame.info[field])
+            if rss is not None:
+                stats['peak_rss_mb'] = max(stats['peak_rss_mb'] or 0.0, rss)
+                stats['rss_growth_mb'] = (stats['rss_growth_mb'] or 0.0) + rss - rss_before
+
+    def finish(self):
+        """실행 전체 시간 확정"""
+        self.wall_seconds = time.perf_counter() - self._wall_start
+        self.cpu_seconds = time.process_time() - self._cpu_start
+        return self
+
+    def report(self):
+        """JSON 실행 리포트 구조"""
+        if self.wall_seconds is None:
+            self.finish()
+        with self._lock:
+            items = sorted(self._stats.items(), key=lambda item: (
+                STAGES.index(item[0][0]) if item[0][0] in STAGES else len(STAGES), str(item[0][1])))
+            stages = [{'stage': name, 'target': target, **stats} for (name, target), stats in items]
+
+        totals = {}
+        for record in stages:
+            total = totals.setdefault(record['stage'], {
+                'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'rows': None, 'bytes': None})
+            for field in ['calls', 'wall_seconds', 'cpu_seconds']:
+                total[field] += record[field]
+            for field in ['rows', 'bytes']:
+                if record[field] is not None:
+                    total[field] = (total[field] or 0) + record[field]
+        rss = peak_rss_mb()
+        return {
+            'run': self.run_name,
+            'started_at': self.started_at,
+            'wall_seconds': self.wall_seconds,
+            'cpu_seconds': self.cpu_seconds,
+            'peak_rss_mb': rss,
+            'rss_growth_mb': None if rss is None else rss - self._rss_start,
+            'totals': totals,
+            'stages': stages,
+        }
+
+    def write(self, output_dir=metrics_dir):
+        """JSON 리포트, Prometheus 텍스트, (profile 시) 단계별 .prof 저장 후 경로 목록 반환"""
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        report = self.report()
+
+        json_file = output_dir / f"{self.run_name}.json"
+        _write_text(json_file, json.dumps(report, ensure_ascii=False, indent=2))
+        prom_file = output_dir / f"{self.run_name}.prom"
+        _write_text(prom_file, prometheus_text(report))
+        return [json_file, prom_file] + self.write_profiles(output_dir / "profiles")
+
+    def write_profiles(self, profile_dir):
+        """(단계, 대상)별 cProfile 결과를 스레드를 합쳐 .prof로 저장"""
+        merged = {}
+        with self._lock:
+            for (key, _), profiler in self._profilers.items():
+                merged.setdefault(key, []).append(profiler)
+        written = []
+        for (name, target), profilers in sorted(merged.items(), key=lambda item: str(item[0])):
+            try:
+                stats = pstats.Stats(*profilers)
+            except TypeError:
+                # 한 번도 호출이 기록되지 않은 프로파일러
+                continue
+            profile_dir.mkdir(parents=True, exist_ok=True)
+            label = name if target is None else f"{name}-{Path(str(target)).stem}"
+            output_file = profile_dir / f"{label}.prof"
+            stats.dump_stats(output_file)
+            written.append(output_file)
+        return written
+
+
+def _write_text(path, text):
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# Prometheus 지표 이름 -> (리포트 필드, 배율, 설명)
+PROMETHEUS_STAGE_METRICS = {
+    'stage_wall_seconds': ('wall_seconds', 1, "Wall-clock seconds spent in the stage (nested stages excluded)"),
+    'stage_cpu_seconds': ('cpu_seconds', 1, "Thread CPU seconds spent in the stage (nested stages excluded)"),
+    'stage_calls': ('calls', 1, "Number of times the stage ran"),
+    'stage_rows': ('rows', 1, "Rows processed by the stage"),
+    'stage_bytes': ('bytes', 1, "Bytes produced by the stage"),
+    'stage_peak_rss_bytes': ('peak_rss_mb', 1024 * 1024, "Process peak RSS when the stage finished"),
+}
+
+
+def prometheus_text(report):
+    """실행 리포트를 Prometheus 텍스트 노출 형식으로 변환"""
+    run = _label(report['run'])
+    lines = []
+    for metric, (field, scale, description) in PROMETHEUS_STAGE_METRICS.items():
+        samples = [record for record in report['stages'] if record[field] is not None]
+        if not samples:
+            continue
+        name = f"{METRIC_PREFIX}_{metric}"
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} gauge"]
+        for record in samples:
+            labels = f'run="{run}",stage="{_label(record["stage"])}"'
+            if record['target'] is not None:
+                labels += f',target="{_label(record["target"])}"'
+            lines.append(f"{name}{{{labels}}} {record[field] * scale:.6g}")
+
+    started = datetime.fromisoformat(report['started_at']).timestamp()
+    for metric, value, description in [
+        ('run_wall_seconds', report['wall_seconds'], "Wall-clock seconds for the whole run"),
+        ('run_cpu_seconds', report['cpu_seconds'], "Process CPU seconds for the whole run"),
+        ('run_peak_rss_bytes', report['peak_rss_mb'] and report['peak_rss_mb'] * 1024 * 1024,
+         "Process peak RSS at the end of the run"),
+        ('run_start_time_seconds', started, "Unix time the run started"),
+    ]:
+        if value is None:
+            continue
+        name = f"{METRIC_PREFIX}_{metric}"
+        lines += [f"# HELP {name} {description}", f"# TYPE {name} gauge",
+                  f'{name}{{run="{run}"}} {value:.6f}']
+    return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def _no_stage():
+    yield {'rows': None, 'bytes': None}
+
+
+def stage(name, target=None):
+    """활성 기록기가 있으면 단계를 측정하는 컨텍스트 (없으면 측정하지 않음)"""
+    recorder = _active
+    if recorder is None:
+        return _no_stage()
+    return recorder.stage(name, target)
+
+
+@contextmanager
+def recording(recorder):
+    """블록 안에서 stage() 호출을 recorder에 기록"""
+    global _active
+    previous, _active = _active, recorder
+    try:
+        yield recorder
+    finally:
+        _active = previous
+        recorder.finish()
+
+
+def print_report(report):
+    """실행 리포트를 단계별 표로 출력"""
+    print(f"[{report['run']}] {report['started_at']}  wall {report['wall_seconds']:.2f}s, "
+          f"CPU {report['cpu_seconds']:.2f}s, 최대 RSS {format_mb(report['peak_rss_mb'], 0)}")
+    print(f"  {'단계':<10}{'호출':>6}{'wall(s)':>10}{'CPU(s)':>10}{'행 수':>14}{'바이트':>14}")
+    for name, total in report['totals'].items():
+        rows = f"{total['rows']:,}" if total['rows'] is not None else '-'
+        size = f"{total['bytes']:,}" if total['bytes'] is not None else '-'
+        print(f"  {name:<10}{total['calls']:>6}{total['wall_seconds']:>10.3f}"
+              f"{total['cpu_seconds']:>10.3f}{rows:>14}{size:>14}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="파이프라인 실행 리포트 출력")
+    parser.add_argument('report', nargs='?', default=str(metrics_dir / "re100_agg.json"),
+                        help="JSON 실행 리포트 경로")
+    parser.add_argument('--targets', action='store_true', help="대상(산출 파일)별 지표도 출력")
+    args = parser.parse_args()
+
+    try:
+        with open(args.report, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    except FileNotFoundError:
+        print(f"[FAIL] 리포트가 없습니다: {args.report} (re100_agg.py --metrics 로 생성)")
+        sys.exit(1)
+
+    print_report(report)
+    if args.targets:
+        print()
+        for record in report['stages']:
+            rows = f"{record['rows']:,}행" if record['rows'] is not None else ''
+            print(f"  {record['stage']:<10}{str(record['target'] or '-'):<45}"
+                  f"{record['wall_seconds']:>8.3f}s {rows}")
+
+
+if __name__ == "__main__":
+    main()
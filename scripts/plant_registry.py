@@ -0,0 +1,226 @@
+"""발전소 레지스트리 (plant_list.csv)와 설비용량 배율
+
+plant_list.csv에 발전소 엔티티 ID별 현재 설비용량(capacity_gw)과 원본 CSV 데이터가 나타내는
+설비용량(data_capacity_gw)을 함께 기록한다. 타입과 이름은 엔티티 레지스트리(entities.csv)에 있다. 용량을 바꿀 때는 capacity_gw만 고치고
+원본 CSV는 다시 쓰지 않는다. 셀 집계/시간 단위 행렬을 읽을 때 발전소별 배율
+capacity_gw / data_capacity_gw를 벡터로 곱하며, 이미 만들어진 선형 집계 파일은
+변경 비율만큼 다시 곱해(집계 크기에 비례하는 비용) 원본 데이터와 맞춘다.
+시간 단위 매칭처럼 비선형인 산출물은 re100_agg.py가 다시 만든다.
+
+사용 예:
+    python scripts/plant_registry.py                          # 레지스트리 출력
+    python scripts/plant_registry.py --set 육상태양광=0.5      # 용량 변경 + 기존 집계 반영
+"""
+import argparse
+import csv
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+from aggregation_engine import agg_data_dir, build_plant_capacity, build_summary_stats, write_json
+from entity_registry import display_names, load_entities, registry_file, resolve
+from parallel_plants import plant_list_file
+
+REGISTRY_FIELDS = ['id', 'filename', 'capacity_gw', 'data_capacity_gw']
+CAPACITY_FIELDS = ['capacity_gw', 'data_capacity_gw']
+
+# 용량 변경 비율을 곱해 제자리에서 갱신하는 agg_data 산출물
+RESCALED_OUTPUTS = [
+    "monthly_aggregated_original.json",
+    "plant_hourly_aggregated_original.json",
+    "plant_monthly_aggregated.json",
+    "summary_stats_original.json",
+    "plant_capacity.json",
+]
+
+
+def _float(value):
+    value = (value or '').strip()
+    return float(value) if value else None
+
+
+def load_registry(path=plant_list_file):
+    """plant_list.csv 전체 행 (용량 칸이 비어 있으면 None, 타입/이름은 같은 폴더의 엔티티 레지스트리에서)"""
+    entities = {e['id']: e for e in load_entities(Path(path).parent / registry_file.name)}
+    with open(path, 'r', encoding='utf-8-sig') as f:
+        entries = []
+        for row in csv.DictReader(f):
+            entry = {key: (row.get(key) or '').strip() for key in REGISTRY_FIELDS}
+            entry['id'] = int(entry['id'])
+            for key in CAPACITY_FIELDS:
+                entry[key] = _float(row.get(key))
+            entity = entities[entry['id']]
+            entry.update(type=entity['type'], plant_name=entity['data_name'], name=entity['name'])
+            entries.append(entry)
+        return entries
+
+
+def save_registry(entries, path=plant_list_file):
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=REGISTRY_FIELDS, lineterminator='\n')
+        writer.writeheader()
+        for entry in entries:
+            writer.writerow({key: ('' if entry.get(key) is None else entry[key]) for key in REGISTRY_FIELDS})
+    os.replace(tmp_path, path)
+
+
+def capacities(entries=None):
+    """발전소별 현재 설비용량 {엔티티 ID: GW}"""
+    entries = load_registry() if entries is None else entries
+    return {str(e['id']): e['capacity_gw'] for e in entries if e['capacity_gw']}
+
+
+def capacity_factors(entries=None):
+    """원본 데이터 대비 배율 {원본 이름: capacity_gw / data_capacity_gw} (1이 아닌 발전소만)
+
+    원본 행/셀 집계에 곱하므로 원본 CSV의 plant_name 값(data_name)을 키로 쓴다.
+    """
+    entries = load_registry() if entries is None else entries
+    factors = {}
+    for e in entries:
+        if e['capacity_gw'] is not None and e['data_capacity_gw']:
+            factor = e['capacity_gw'] / e['data_capacity_gw']
+            if factor != 1.0:
+                factors[e['plant_name']] = factor
+    return factors
+
+
+def set_capacities(changes, path=plant_list_file):
+    """설비용량 변경을 레지스트리에 기록하고 발전소별 변경 비율 {엔티티 ID: 새 용량 / 이전 용량} 반환
+
+    changes의 키는 엔티티 ID, 표시 이름, 원본 이름 중 하나. 처음 기록하는 발전소는 원본 데이터가
+    그 용량을 나타낸다고 보고 data_capacity_gw도 채운다.
+    """
+    entries = load_registry(path)
+    by_id = {e['id']: e for e in entries}
+    resolved = {}
+    for name, capacity in changes.items():
+        try:
+            entity_id = resolve(name)['id']
+        except KeyError:
+            entity_id = None
+        if entity_id not in by_id:
+            raise KeyError(f"레지스트리에 없는 발전소: {name}")
+        resolved[entity_id] = capacity
+
+    ratios = {}
+    for entity_id, capacity in resolved.items():
+        entry = by_id[entity_id]
+        previous = entry['capacity_gw']
+        if entry['data_capacity_gw'] is None:
+            entry['data_capacity_gw'] = previous or capacity
+        if previous and previous != capacity:
+            ratios[str(entity_id)] = capacity / previous
+        entry['capacity_gw'] = capacity
+    save_registry(entries, path)
+    return ratios
+
+
+def scale_cells(cells, factors=None):
+    """셀 집계의 발전소별 합계에 배율 적용 (배율이 없으면 그대로 반환)"""
+    factors = capacity_factors() if factors is None else factors
+    if not factors or len(cells) == 0:
+        return cells
+    cells = cells.copy()
+    cells['sum'] = cells['sum'] * cells['plant_name'].map(factors).fillna(1.0).to_numpy()
+    return cells
+
+
+def scale_matrix(matrix, factors=None):
+    """HourlyMatrix 행에 발전소별 배율 적용 (제자리)"""
+    factors = capacity_factors() if factors is None else factors
+    if factors:
+        matrix.values *= np.array([factors.get(name, 1.0) for name in matrix.names])[:, None]
+    return matrix
+
+
+def _read(name):
+    with open(agg_data_dir / name, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def rescale_aggregates(ratios, entries=None):
+    """기존 집계 파일에 발전소별 변경 비율 {엔티티 ID: 비율}을 곱해 저장하고 갱신한 파일명 목록 반환"""
+    from scenarios import apply_entities, apply_monthly
+
+    entries = load_registry() if entries is None else entries
+    definition = {'plants': ratios}
+    written = []
+
+    def save(name, data):
+        write_json(data, agg_data_dir / name)
+        written.append(name)
+
+    monthly = None
+    if (agg_data_dir / "monthly_aggregated_original.json").exists():
+        monthly = apply_monthly(_read("monthly_aggregated_original.json"), definition)
+        save("monthly_aggregated_original.json", monthly)
+        save("summary_stats_original.json", build_summary_stats(monthly))
+        save("plant_capacity.json", build_plant_capacity(monthly, capacities(entries)))
+    if (agg_data_dir / "plant_hourly_aggregated_original.json").exists():
+        save("plant_hourly_aggregated_original.json",
+             apply_entities(_read("plant_hourly_aggregated_original.json"), definition))
+    if (agg_data_dir / "plant_monthly_aggregated.json").exists():
+        save("plant_monthly_aggregated.json", apply_entities(_read("plant_monthly_aggregated.json"), definition))
+    return written
+
+
+def apply_capacity_change(changes):
+    """용량 변경을 기록하고 기존 집계에 반영 (변경 비율, 갱신한 파일, 재생성이 필요한 파일) 반환
+
+    변경 전에 최신이던 산출물은 갱신 후 DAG 상태도 최신으로 기록하여 re100_agg.py가
+    원본부터 다시 집계하지 않게 한다.
+    """
+    from re100_agg import NODES, DagState
+
+    state = DagState()
+    fresh = {
+        name for name in RESCALED_OUTPUTS
+        if NODES[name].path.exists() and state.nodes.get(name) == state.input_signatures(NODES[name])
+    }
+    ratios = set_capacities(changes)
+    if not ratios:
+        return ratios, [], []
+
+    written = rescale_aggregates(ratios)
+    for name in written:
+        if name in fresh:
+            state.record(NODES[name], state.input_signatures(NODES[name]))
+    state.save()
+    stale = [name for name in NODES if name not in written and plant_list_file in NODES[name].inputs()]
+    return ratios, written, stale
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발전소 레지스트리 조회/용량 기록")
+    parser.add_argument('--set', nargs='+', metavar='발전소=GW', help="설비용량 변경")
+    args = parser.parse_args()
+
+    if args.set:
+        changes = {}
+        for item in args.set:
+            name, _, value = item.partition('=')
+            changes[name.strip()] = float(value)
+        ratios, written, stale = apply_capacity_change(changes)
+        names = display_names()
+        for key, ratio in ratios.items():
+            print(f"[OK] {names[key]}: 용량 변경 비율 {ratio:.3f}")
+        for name in written:
+            print(f"[OK] 집계 반영: {name}")
+        if stale:
+            print(f"[WARNING] re100_agg.py로 재생성 필요: {', '.join(stale)}")
+
+    factors = capacity_factors()
+    print(f"{'ID':>4}  {'발전소':<12}{'타입':>8}{'용량 GW':>10}{'원본 GW':>10}{'배율':>8}")
+    for e in load_registry():
+        capacity = '' if e['capacity_gw'] is None else f"{e['capacity_gw']:.3f}"
+        data_capacity = '' if e['data_capacity_gw'] is None else f"{e['data_capacity_gw']:.3f}"
+        print(f"{e['id']:>4}  {e['name']:<12}{e['type']:>8}{capacity:>10}{data_capacity:>10}"
+              f"{factors.get(e['plant_name'], 1.0):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+"""로컬 asyncio 집계 조회 API
+
+데이터를 한 번 메모리에 올려 두고(롤업 큐브, 시간 단위 매칭, 기업 부분집합 서비스,
+agg_data 파일) 요청마다 필요한 구간만 JSON으로 돌려준다. 표준 라이브러리
+asyncio만 사용하는 최소 HTTP/1.1 서버이며, ETag/If-None-Match(304)와
+gzip 응답, keep-alive를 지원한다. 같은 질의 결과는 LRU 캐시에서 바로 응답한다.
+원본 파일(통합 CSV, plant_list.csv, entities.csv, agg_data 파일)의 서명(mtime, 크기)이
+바뀌면 다음 요청에서 다시 읽으므로, 재집계 후 서버를 다시 띄우지 않아도 된다.
+
+엔드포인트 (GET/HEAD):
+    /api/entities
+        발전소/기업 목록 (엔티티 ID, 타입, 표시 이름)
+    /api/scenarios
+        시나리오 정의 목록 (scenarios.py)
+    /api/series?entity=<이름>&type=<solar|wind|supply|demand>&start=&end=&freq=&metric=&scenario=
+        엔티티/타입 합계 시계열 (entity는 엔티티 ID 또는 이름, entity, type은 여러 번 지정 가능, freq: h/D/W/M/Y,
+        metric: sum(GWh 합계) 또는 mean(시간당 평균 GWh), scenario: 배율 시나리오)
+    /api/matching?start=&end=&freq=&scenario=
+        시간 단위 매칭 결과(공급/수요/매칭/외부 전력/잉여 GWh, 매칭 RE100 %)
+    /api/company-demand?company=<기업>&start=&end=&freq=
+        선택 기업 수요 합계 (company 생략 시 전체)
+    /agg_data/<파일>
+        public/agg_data 파일 (기존 정적 파일과 같은 내용)
+
+사용 예:
+    python scripts/query_api.py --port 8765
+    python scripts/query_api.py --year 2023      # 2023 파티션만 적재 (기본: 가장 최근 연도)
+    curl 'http://127.0.0.1:8765/api/series?type=solar&type=demand&freq=M'
+"""
+import argparse
+import asyncio
+import functools
+import gzip
+import hashlib
+import json
+import mimetypes
+import time
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import numpy as np
+
+from aggregation_engine import agg_data_dir, integrated_csv, SUPPLY_TYPES
+from company_subsets import CompanySubsetService
+from entity_registry import display_names, registry_file, resolve, row_keys
+from hourly_matching import load_hourly_matrix, match
+from parallel_plants import plant_list_file
+from partitions import integrated_partitions, NoPartitionError, partition_file
+from rollup_cube import FREQS, TOTAL, TOTAL_TYPES, RollupCube
+from scenarios import load_scenarios, multipliers, scaled_totals
+from warm_cache import file_signature
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+METRICS = ['sum', 'mean']
+MATCHING_METRICS = ['supply', 'demand', 'matched', 'external', 'surplus']
+
+# 이보다 작은 응답은 압축하지 않음
+GZIP_MIN_BYTES = 1024
+RESPONSE_CACHE_SIZE = 1024
+SCENARIO_CACHE_SIZE = 16
+STATIC_SUFFIXES = ('.json', '.bin', '.gz', '.br')
+
+PERIOD_FORMATS = {'h': '%Y-%m-%d %H:%M', 'D': '%Y-%m-%d', 'W': '%Y-%m-%d', 'M': '%Y-%m', 'Y': '%Y'}
+STATUS_TEXT = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found',
+               405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+class QueryError(Exception):
+    """잘못된 질의 파라미터 (400 응답)"""
+
+
+class Response:
+    """본문과 ETag, 필요할 때 만드는 gzip 본문"""
+
+    def __init__(self, status, body, content_type='application/json; charset=utf-8'):
+        self.status = status
+        self.body = body
+        self.content_type = content_type
+        self.etag = '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+        self._gzipped = None
+
+    @classmethod
+    def json(cls, payload, status=200):
+        return cls(status, json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+    def gzipped(self):
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, 6, mtime=0)
+        return self._gzipped
+
+
+def _content_type(name):
+    """정적 파일 Content-Type (.gz/.br 는 이미 압축된 파일로 그대로 전송)"""
+    if name.endswith('.gz'):
+        return 'application/gzip'
+    if name.endswith('.br'):
+        return 'application/x-brotli'
+    return mimetypes.guess_type(name)[0] or 'application/octet-stream'
+
+
+def _param(query, name, default=None, choices=None):
+    values = query.get(name)
+    value = values[-1] if values else default
+    if choices is not None and value not in choices:
+        raise QueryError(f"{name}은(는) {', '.join(choices)} 중 하나여야 합니다")
+    return value
+
+
+class QueryApp:
+    """메모리에 올린 집계 데이터로 질의에 응답"""
+
+    def __init__(self, csv_file=integrated_csv, static_dir=agg_data_dir, scenario_file=None):
+        self.csv_file = csv_file
+        self.static_dir = static_dir
+        self.scenario_file = scenario_file
+        # {파일명: (서명, 응답)}
+        self.static = {}
+        for path in sorted(static_dir.iterdir()):
+            if path.is_file():
+                self._static_file(path.name)
+        self.cached_query = functools.lru_cache(maxsize=RESPONSE_CACHE_SIZE)(self._query)
+        self.scenario_matching = functools.lru_cache(maxsize=SCENARIO_CACHE_SIZE)(self._scenario_matching)
+        self.signature = None
+        self._refresh()
+
+    def _refresh(self):
+        """원본 서명이 바뀌었으면 데이터를 다시 적재하고 응답 캐시를 비움"""
+        signature = file_signature(self.csv_file, plant_list_file, registry_file)
+        if signature == self.signature:
+            return
+        matrix = load_hourly_matrix(self.csv_file)
+        self.matrix = matrix
+        self.cube = RollupCube.from_matrix(matrix)
+        self.scenarios = load_scenarios(self.scenario_file)
+        self.matching = self._build_matching(matrix.total(SUPPLY_TYPES), matrix.total(['demand']))
+        demand = matrix.rows(['demand'])
+        self.companies = CompanySubsetService(
+            [n for n, row in zip(matrix.names, demand) if row], matrix.index, matrix.values[demand])
+        self.cached_query.cache_clear()
+        self.scenario_matching.cache_clear()
+        self.signature = signature
+
+    def _static_file(self, name):
+        """agg_data 파일 응답 (파일 서명이 바뀌었으면 다시 읽음, 없으면 None)"""
+        path = self.static_dir / name
+        if path.parent != self.static_dir or not name.endswith(STATIC_SUFFIXES):
+            return None
+        signature = file_signature(path)
+        entry = self.static.get(name)
+        if entry is None or entry[0] != signature:
+            if not path.is_file():
+                self.static.pop(name, None)
+                return None
+            entry = self.static[name] = (signature, Response(200, path.read_bytes(), _content_type(name)))
+        return entry[1]
+
+    def handle(self, path, query_string):
+        """경로와 질의 문자열로 응답 생성 (같은 질의는 원본이 바뀌기 전까지 캐시)"""
+        if path.startswith('/agg_data/'):
+            response = self._static_file(unquote(path[len('/agg_data/'):]))
+            return response or Response.json({'error': 'not found'}, 404)
+        self._refresh()
+        query = parse_qs(query_string, keep_blank_values=False)
+        key = (path, tuple(sorted((k, tuple(v)) for k, v in query.items())))
+        return self.cached_query(key)
+
+    def _query(self, key):
+        path, items = key
+        query = {k: list(v) for k, v in items}
+        handler = {
+            '/api/entities': self.entities,
+            '/api/scenarios': self.scenario_list,
+            '/api/series': self.series,
+            '/api/matching': self.matching_series,
+            '/api/company-demand': self.company_demand,
+        }.get(path)
+        if handler is None:
+            return Response.json({'error': 'not found'}, 404)
+        try:
+            return Response.json(handler(query))
+        except (QueryError, KeyError, ValueError) as e:
+            return Response.json({'error': str(e).strip("'")}, 400)
+
+    def _build_matching(self, supply, demand):
+        hourly = match(supply, demand)
+        return RollupCube.from_values(
+            self.matrix.index[0], ['matching'] * len(MATCHING_METRICS), MATCHING_METRICS,
+            np.vstack([hourly[m] for m in MATCHING_METRICS]))
+
+    def _scenario_matching(self, name):
+        """시나리오 배율을 적용한 시간별 매칭 큐브 (매칭은 비선형이라 시나리오별로 계산)"""
+        totals = scaled_totals(self.matrix, [self.scenarios[name]])
+        return self._build_matching(totals['solar'][0] + totals['wind'][0], totals['demand'][0])
+
+    def _scenario(self, query):
+        name = _param(query, 'scenario')
+        if name is not None and name not in self.scenarios:
+            raise QueryError(f"알 수 없는 시나리오: {name}")
+        return name
+
+    def _periods(self, cube, query):
+        freq = _param(query, 'freq', 'M', FREQS)
+        bounds = cube.period_bounds(freq, _param(query, 'start'), _param(query, 'end'))
+        labels = cube.index[bounds[:-1]].strftime(PERIOD_FORMATS[freq]).tolist()
+        return freq, bounds, labels
+
+    def _data_name(self, name, energy_type=None):
+        """엔티티 ID/표시 이름/원본 이름 -> 원본 이름 (레지스트리에 없으면 그대로)"""
+        try:
+            return resolve(name, energy_type)['data_name']
+        except KeyError:
+            return name
+
+    def entities(self, query):
+        cube = self.cube
+        names = display_names()
+        return {
+            'entities': [
+                {'id': key, 'type': t, 'name': names.get(key, n)}
+                for t, n, key in zip(cube.types, cube.names, row_keys(cube.types, cube.names, quiet=True))
+                if n != TOTAL
+            ],
+            'types': TOTAL_TYPES,
+            'start': str(self.cube.start),
+            'hours': self.cube.n_hours,
+        }
+
+    def scenario_list(self, query):
+        return {'scenarios': self.scenarios}
+
+    def _weights(self, entities, energy_types, scenario):
+        """출력 시계열별 큐브 행 가중치 [출력 x 행] (시나리오가 있으면 타입 합계를 엔티티 행으로 풀어 배율 적용)"""
+        cube = self.cube
+        n_rows = len(cube.names)
+        factors = np.ones(n_rows) if scenario is None else multipliers(self.scenarios[scenario], cube.types, cube.names)
+        entity_rows = np.array(cube.names) != TOTAL
+        weights = np.zeros((len(entities) + len(energy_types), n_rows))
+        for k, name in enumerate(entities):
+            i = cube.row(self._data_name(name))
+            weights[k, i] = factors[i]
+        for k, energy_type in enumerate(energy_types, start=len(entities)):
+            if scenario is None:
+                weights[k, cube.row(energy_type=energy_type)] = 1.0
+                continue
+            members = SUPPLY_TYPES if energy_type == 'supply' else [energy_type]
+            rows = entity_rows & np.isin(cube.types, members)
+            weights[k, rows] = factors[rows]
+        return weights
+
+    def series(self, query):
+        metric = _param(query, 'metric', 'sum', METRICS)
+        scenario = self._scenario(query)
+        entities = query.get('entity', [])
+        energy_types = query.get('type', [])
+        for energy_type in energy_types:
+            if energy_type not in TOTAL_TYPES:
+                raise QueryError(f"알 수 없는 타입: {energy_type}")
+        if not entities and not energy_types:
+            energy_types = TOTAL_TYPES
+        weights = self._weights(entities, energy_types, scenario)
+
+        freq, bounds, labels = self._periods(self.cube, query)
+        used = np.flatnonzero(weights.any(axis=0))
+        prefix = self.cube.prefix[used]
+        values = weights[:, used] @ (prefix[:, bounds[1:]] - prefix[:, bounds[:-1]])
+        if metric == 'mean':
+            values = values / np.maximum(np.diff(bounds), 1)
+        return {
+            'freq': freq, 'metric': metric, 'scenario': scenario, 'unit': 'GWh', 'periods': labels,
+            'series': {name: v.tolist() for name, v in zip(list(entities) + list(energy_types), values)},
+        }
+
+    def matching_series(self, query):
+        scenario = self._scenario(query)
+        cube = self.matching if scenario is None else self.scenario_matching(scenario)
+        freq, bounds, labels = self._periods(cube, query)
+        prefix = cube.prefix
+        values = dict(zip(MATCHING_METRICS, prefix[:, bounds[1:]] - prefix[:, bounds[:-1]]))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rate = np.where(values['demand'] > 0, values['matched'] / values['demand'] * 100, 0.0)
+        series = {name: v.tolist() for name, v in values.items()}
+        series['matched_re100_rate'] = rate.tolist()
+        return {'freq': freq, 'scenario': scenario, 'unit': 'GWh', 'periods': labels, 'series': series}
+
+    def company_demand(self, query):
+        companies = query.get('company')
+        if companies:
+            companies = [self._data_name(name, 'demand') for name in companies]
+        hourly = self.companies.hourly_total(companies)
+        freq, bounds, labels = self._periods(self.cube, query)
+        prefix = np.concatenate([[0.0], np.cumsum(hourly)])
+        return {
+            'freq': freq, 'unit': 'GWh', 'periods': labels,
+            'companies': list(self.companies.key(companies)) if companies else None,
+            'demand': (prefix[bounds[1:]] - prefix[bounds[:-1]]).tolist(),
+        }
+
+
+def _render(response, request_headers, head_only=False):
+    """상태줄/헤더/본문 바이트 (If-None-Match, Accept-Encoding 반영)"""
+    headers = {
+        'Content-Type': response.content_type,
+        'ETag': response.etag,
+        'Cache-Control': 'no-cache',
+        'Access-Control-Allow-Origin': '*',
+        'Vary': 'Accept-Encoding',
+    }
+    status = response.status
+    body = response.body
+    if status == 200 and response.etag in request_headers.get('if-none-match', ''):
+        status, body = 304, b''
+    elif len(body) >= GZIP_MIN_BYTES and 'gzip' in request_headers.get('accept-encoding', '') \
+            and response.content_type not in ('application/gzip', 'application/x-brotli'):
+        body = response.gzipped()
+        headers['Content-Encoding'] = 'gzip'
+    headers['Content-Length'] = str(len(body))
+
+    lines = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}"]
+    lines += [f"{k}: {v}" for k, v in headers.items()]
+    head = ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+    return head if head_only else head + body
+
+
+async def _read_request(reader):
+    """요청줄과 헤더 읽기 (연결 종료 시 None)"""
+    request_line = await reader.readline()
+    if not request_line.strip():
+        return None
+    method, target, version = request_line.decode('latin-1').split()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    length = int(headers.get('content-length', 0) or 0)
+    if length:
+        await reader.readexactly(length)
+    return method, target, version, headers
+
+
+def make_handler(app):
+    async def handle_connection(reader, writer):
+        try:
+            while True:
+                request = await _read_request(reader)
+                if request is None:
+                    break
+                method, target, version, headers = request
+                if method not in ('GET', 'HEAD'):
+                    response = Response.json({'error': 'method not allowed'}, 405)
+                else:
+                    url = urlsplit(target)
+                    try:
+                        response = app.handle(url.path, url.query)
+                    except Exception as e:
+                        response = Response.json({'error': str(e)}, 500)
+                writer.write(_render(response, headers, head_only=(method == 'HEAD')))
+                await writer.drain()
+                if version != 'HTTP/1.1' or headers.get('connection', '').lower() == 'close':
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    return handle_connection
+
+
+async def serve(app, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    server = await asyncio.start_server(make_handler(app), host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 집계 조회 API 서버")
+    parser.add_argument('--csv', default=None, help="통합 CSV 파일 (기본: 가장 최근 연도 파티션)")
+    parser.add_argument('--year', type=int, help="적재할 연도 파티션 (해당 연도 파일만 읽음)")
+    parser.add_argument('--scenario-file', help="추가 시나리오 JSON {이름: 정의}")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    if args.year is not None and args.year not in integrated_partitions():
+        parser.error(f"연도 파티션 없음: {partition_file(args.year).name}")
+    csv_file = args.csv or (partition_file(args.year) if args.year else integrated_csv)
+    if csv_file is None:
+        parser.error(str(NoPartitionError()))
+
+    started = time.perf_counter()
+    app = QueryApp(csv_file, scenario_file=args.scenario_file)
+    print(f"[OK] 데이터 적재: 엔티티 {len(app.cube.names)}행 x {app.cube.n_hours:,}시간, "
+          f"정적 파일 {len(app.static)}개 ({time.perf_counter() - started:.2f}s)")
+    print(f"조회 API: http://{args.host}:{args.port}/api/series?type=supply&type=demand&freq=M")
+    try:
+        asyncio.run(serve(app, args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n서버 종료")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,462 @@
+"""re100-agg: public/agg_data 산출물 통합 빌드 도구
+
+agg_data의 각 산출 파일을 입력(원본 CSV, 다른 산출 파일, 생성 코드)이 선언된 DAG 노드로
+보고, make처럼 입력이 바뀐 노드만 다시 만든다. 입력 변경은 mtime/크기로 먼저 확인하고
+달라졌을 때만 내용 해시를 비교하므로, 상위 노드가 다시 만들어져도 내용이 같으면
+하위 노드는 건너뛴다. 서로 의존하지 않는 노드는 스레드 풀에서 동시에 실행한다.
+
+agg_data 최상위 산출물은 가장 최근 연도 파티션 기준이고, 통합 CSV 연도 파티션마다
+agg_data/<연도>/ 아래에 엔진 산출물(월별, 기업별, 시간대별, 요약) 노드가 따로 있다.
+연도 노드는 그 연도 파티션만 입력으로 가지므로 --year 로 한 해만 다시 만들 수 있다.
+
+사용 예:
+    python scripts/re100_agg.py                 # 오래된 산출물만 재생성
+    python scripts/re100_agg.py --dry-run       # 재생성 대상만 출력
+    python scripts/re100_agg.py summary_stats_original.json --force
+    python scripts/re100_agg.py --year 2024     # 2024 파티션 산출물(agg_data/2024/)만 재생성
+    python scripts/re100_agg.py --metrics       # 단계별 실행 지표 저장 (.cache/metrics)
+    python scripts/re100_agg.py --watch         # 빌드 후 sample_data 변경 시 영향받는 산출물만 재생성
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+from aggregation_engine import (
+    project_root, agg_data_dir, sample_data_dir, integrated_csv,
+    build_monthly_aggregated, build_company_monthly, build_plant_hourly,
+    build_company_hourly, build_summary_stats, build_plant_capacity, write_json,
+    ORIGINAL_OUTPUT_FILES,
+)
+from csv_cache import file_hash
+from capacity_mix import build_capacity_mix_pareto
+from entity_registry import build_entities, registry_file
+from ess_simulation import build_ess_curve
+from hourly_matching import build_hourly_matching
+from parallel_plants import plant_list_file, load_plant_list
+from partitions import NoPartitionError, PARTITION_PATTERN, integrated_partitions, require_partition
+from pipeline_metrics import StageRecorder, print_report, recording, stage
+from plant_registry import capacities, scale_cells
+from warm_cache import cached, file_signature
+import data_watch
+import incremental_aggregation
+import warm_cache
+
+# 루트의 생성 스크립트(generate_*.py, update_*.py)를 모듈로 사용
+sys.path.insert(0, str(project_root))
+
+scripts_dir = Path(__file__).resolve().parent
+dag_state_file = project_root / ".cache" / "re100_agg_state.json"
+
+
+class BuildContext:
+    """한 번의 실행 동안 노드들이 공유하는 중간 결과"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cells = {}
+
+    def cells(self, csv_file=integrated_csv):
+        """통합 CSV(연도 파티션) 셀 집계 (증분 상태 사용, 설비용량 배율 적용, 파일별로 실행당 한 번만 계산)
+
+        장기 실행 프로세스(warm_cache 활성화)에서는 원본과 레지스트리가 바뀌지 않았으면
+        이전 실행의 셀 집계를 그대로 쓴다.
+        """
+        csv_file = require_partition(csv_file)
+        with self._lock:
+            if csv_file not in self._cells:
+                self._cells[csv_file] = cached(
+                    'cells', csv_file, file_signature(csv_file, plant_list_file, registry_file),
+                    lambda: scale_cells(incremental_aggregation.update(csv_file)[0]))
+            return self._cells[csv_file]
+
+
+class Node:
+    """agg_data 산출 파일 하나에 대한 빌드 규칙"""
+
+    def __init__(self, output, build, sources=(), deps=(), dynamic_sources=None):
+        self.output = output
+        self.build = build
+        # 통합 CSV 파티션이 없으면 integrated_csv는 None (빌드 시 NoPartitionError로 실패)
+        self.sources = [Path(p) for p in sources if p is not None]
+        self.deps = list(deps)
+        self.dynamic_sources = dynamic_sources
+
+    @property
+    def path(self):
+        return agg_data_dir / self.output
+
+    def inputs(self):
+        """선언된 입력 파일 전체 (원본, 상위 산출물, 코드)"""
+        paths = list(self.sources)
+        if self.dynamic_sources is not None:
+            paths.extend(self.dynamic_sources())
+        paths.extend(agg_data_dir / dep for dep in self.deps)
+        return paths
+
+
+def _plant_files():
+    """plant_list.csv에 등록된 발전소 CSV 목록"""
+    return [plant_list_file.parent / entry['filename'] for entry in load_plant_list()]
+
+
+def _year_nodes(year, csv_file):
+    """연도 파티션 하나의 엔진 산출물 노드 (agg_data/<연도>/, 입력은 해당 연도 파일만)"""
+    monthly = f"{year}/{ORIGINAL_OUTPUT_FILES['monthly_aggregated']}"
+    sources = [scripts_dir / "aggregation_engine.py", scripts_dir / "entity_registry.py", csv_file]
+    return [
+        Node(monthly, lambda ctx: build_monthly_aggregated(ctx.cells(csv_file)), sources + REGISTRY_SOURCES),
+        Node(f"{year}/{ORIGINAL_OUTPUT_FILES['company_monthly_aggregated']}",
+             lambda ctx: build_company_monthly(ctx.cells(csv_file)), sources),
+        Node(f"{year}/{ORIGINAL_OUTPUT_FILES['plant_hourly_aggregated']}",
+             lambda ctx: build_plant_hourly(ctx.cells(csv_file)), sources + REGISTRY_SOURCES),
+        Node(f"{year}/company_hourly_aggregated.json",
+             lambda ctx: build_company_hourly(ctx.cells(csv_file)), sources),
+        Node(f"{year}/{ORIGINAL_OUTPUT_FILES['summary_stats']}",
+             lambda ctx: build_summary_stats(_read_agg(monthly)),
+             [scripts_dir / "aggregation_engine.py"], deps=[monthly]),
+    ]
+
+
+def _read_agg(name):
+    with open(agg_data_dir / name, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _build_plant_monthly(ctx):
+    from regenerate_plant_monthly import build_plant_monthly
+    return build_plant_monthly()
+
+
+def _build_weekly(ctx):
+    from generate_real_company_aggregated import generate_weekly_data_full_year
+    return generate_weekly_data_full_year()
+
+
+def _build_plant_capacity(ctx):
+    return build_plant_capacity(_read_agg("monthly_aggregated_original.json"), capacities())
+
+
+ENGINE_SOURCES = [scripts_dir / "aggregation_engine.py", scripts_dir / "entity_registry.py", integrated_csv]
+# 발전소 설비용량 배율(plant_list.csv)이 반영되는 산출물의 추가 입력
+REGISTRY_SOURCES = [scripts_dir / "plant_registry.py", plant_list_file]
+
+NODES = {node.output: node for node in [
+    Node("monthly_aggregated_original.json",
+         lambda ctx: build_monthly_aggregated(ctx.cells()), ENGINE_SOURCES + REGISTRY_SOURCES),
+    Node("company_monthly_aggregated_original.json",
+         lambda ctx: build_company_monthly(ctx.cells()), ENGINE_SOURCES),
+    Node("plant_hourly_aggregated_original.json",
+         lambda ctx: build_plant_hourly(ctx.cells()), ENGINE_SOURCES + REGISTRY_SOURCES),
+    Node("company_hourly_aggregated.json",
+         lambda ctx: build_company_hourly(ctx.cells()), ENGINE_SOURCES),
+    Node("summary_stats_original.json",
+         lambda ctx: build_summary_stats(_read_agg("monthly_aggregated_original.json")),
+         [scripts_dir / "aggregation_engine.py"],
+         deps=["monthly_aggregated_original.json"]),
+    Node("hourly_matching.json",
+         lambda ctx: build_hourly_matching(integrated_csv),
+         [scripts_dir / "hourly_matching.py", integrated_csv] + REGISTRY_SOURCES),
+    Node("ess_capacity_curve.json",
+         lambda ctx: build_ess_curve(integrated_csv),
+         [scripts_dir / "ess_simulation.py", scripts_dir / "hourly_matching.py", integrated_csv]
+         + REGISTRY_SOURCES),
+    Node("capacity_mix_pareto.json",
+         lambda ctx: build_capacity_mix_pareto(integrated_csv),
+         [scripts_dir / "capacity_mix.py", scripts_dir / "hourly_matching.py", integrated_csv]
+         + REGISTRY_SOURCES),
+    Node("plant_monthly_aggregated.json", _build_plant_monthly,
+         [scripts_dir / "regenerate_plant_monthly.py", scripts_dir / "parallel_plants.py"] + REGISTRY_SOURCES,
+         dynamic_sources=_plant_files),
+    Node("weekly_data.json", _build_weekly,
+         [project_root / "generate_real_company_aggregated.py", scripts_dir / "rollup_cube.py", integrated_csv]
+         + REGISTRY_SOURCES),
+    Node("plant_capacity.json", _build_plant_capacity,
+         [scripts_dir / "aggregation_engine.py"] + REGISTRY_SOURCES,
+         deps=["monthly_aggregated_original.json"]),
+    # 표시 이름은 여기에만 있으므로 이름 변경 시 이 노드만 다시 만든다.
+    # 집계 중 새 엔티티가 등록될 수 있어 엔티티 키 산출물 뒤에 만든다.
+    Node("entities.json", lambda ctx: build_entities(),
+         [scripts_dir / "entity_registry.py", registry_file],
+         deps=["monthly_aggregated_original.json", "company_monthly_aggregated_original.json",
+               "company_hourly_aggregated.json"]),
+] + [node for year, csv_file in integrated_partitions().items() for node in _year_nodes(year, csv_file)]}
+
+
+def year_targets(year):
+    """연도 파티션 하나의 산출물 노드 이름 목록"""
+    return [name for name in NODES if name.startswith(f"{year}/")]
+
+
+class DagState:
+    """노드별 마지막 빌드 시점의 입력 해시와 파일 서명 캐시"""
+
+    def __init__(self, path=dag_state_file):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        self.files = data.get('files', {})
+        self.nodes = data.get('nodes', {})
+
+    def signature(self, path):
+        """파일 내용 해시 (mtime/크기가 같으면 이전 해시 재사용, 없으면 None)"""
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        key = str(path)
+        with self._lock:
+            cached = self.files.get(key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                return cached[2]
+        digest = file_hash(path)
+        with self._lock:
+            self.files[key] = [stat.st_mtime_ns, stat.st_size, digest]
+        return digest
+
+    def input_signatures(self, node):
+        return {str(path): self.signature(path) for path in node.inputs()}
+
+    def record(self, node, signatures):
+        with self._lock:
+            self.nodes[node.output] = signatures
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'files': self.files, 'nodes': self.nodes}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def _with_ancestors(targets):
+    """대상 노드와 그 상위 노드 전체"""
+    needed = set()
+    stack = list(targets)
+    while stack:
+        name = stack.pop()
+        if name not in needed:
+            needed.add(name)
+            stack.extend(NODES[name].deps)
+    return needed
+
+
+def affected_by(paths):
+    """변경된 파일을 직접 입력으로 가지는 노드와 그 하위 노드 전체"""
+    paths = {Path(p).resolve() for p in paths}
+    affected = {name for name, node in NODES.items() if any(Path(p).resolve() in paths for p in node.inputs())}
+    stack = list(affected)
+    while stack:
+        name = stack.pop()
+        for child, node in NODES.items():
+            if name in node.deps and child not in affected:
+                affected.add(child)
+                stack.append(child)
+    return affected
+
+
+def _add_partitions(paths):
+    """감시 중 새로 생긴 연도 파티션의 노드 추가"""
+    current_year = int(PARTITION_PATTERN.match(integrated_csv.name).group(1)) if integrated_csv else None
+    for path in map(Path, paths):
+        match = PARTITION_PATTERN.match(path.name)
+        if not match or year_targets(match.group(1)):
+            continue
+        year = int(match.group(1))
+        NODES.update((node.output, node) for node in _year_nodes(year, path))
+        print(f"[OK] 연도 파티션 추가: {path.name}")
+        if current_year is None or year > current_year:
+            print(f"[WARNING] 최상위 산출물은 다시 시작해야 {year}년 기준으로 바뀜")
+
+
+def watch(rebuild=None, debounce=data_watch.DEBOUNCE_SECONDS, polling=False):
+    """sample_data 변경을 감시하고 변경 묶음마다 영향받는 산출물만 재생성 (끝나지 않음)
+
+    rebuild(targets)를 주지 않으면 이 프로세스에서 run()을 실행한다. 파싱한 CSV와 셀 집계는
+    warm_cache로 메모리에 유지하므로 묶음마다 바뀐 파일만 다시 읽는다.
+    """
+    if rebuild is None:
+        warm_cache.enable()
+        state = DagState()
+        rebuild = lambda targets: run(targets, state=state)
+    print(f"[OK] 감시 중: {sample_data_dir.relative_to(project_root)}", flush=True)
+    for changed in data_watch.batches(sample_data_dir, debounce=debounce, polling=polling):
+        _add_partitions(changed)
+        names = ', '.join(sorted(Path(p).name for p in changed))
+        targets = affected_by(changed)
+        if not targets:
+            print(f"[SKIP] 영향받는 산출물 없음: {names}", flush=True)
+            continue
+        print(f"변경: {names} -> 산출물 {len(targets)}개 확인", flush=True)
+        started = time.perf_counter()
+        rebuild(sorted(targets))
+        print(f"[OK] 갱신 완료 ({time.perf_counter() - started:.2f}s)", flush=True)
+
+
+def run(targets=None, force=False, jobs=None, dry_run=False, state=None):
+    """오래된 노드만 의존 순서대로 재생성하고 노드별 상태를 반환
+
+    상태 값: 'built', 'fresh', 'stale'(dry-run), 'failed', 'blocked'(상위 실패)
+    """
+    state = state or DagState()
+    needed = _with_ancestors(targets or NODES.keys())
+    ctx = BuildContext()
+    status = {}
+    waiting = {name: set(NODES[name].deps) & needed for name in needed}
+    children = {name: [c for c in needed if name in NODES[c].deps] for name in needed}
+
+    def run_node(name):
+        node = NODES[name]
+        upstream = [status[dep] for dep in node.deps if dep in status]
+        if any(s in ('failed', 'blocked') for s in upstream):
+            return 'blocked', 0.0
+        signatures = state.input_signatures(node)
+        stale = (
+            force
+            or not node.path.exists()
+            or state.nodes.get(name) != signatures
+            or (dry_run and 'stale' in upstream)
+        )
+        if not stale:
+            return 'fresh', 0.0
+        if dry_run:
+            return 'stale', 0.0
+        started = time.perf_counter()
+        node.path.parent.mkdir(parents=True, exist_ok=True)
+        with stage('aggregate', name):
+            data = node.build(ctx)
+        write_json(data, node.path)
+        state.record(node, signatures)
+        return 'built', time.perf_counter() - started
+
+    with ThreadPoolExecutor(max_workers=jobs or min(len(needed), os.cpu_count() or 1)) as executor:
+        futures = {}
+
+        def submit(name):
+            futures[executor.submit(run_node, name)] = name
+
+        for name in sorted(n for n, deps in waiting.items() if not deps):
+            submit(name)
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = futures.pop(future)
+                try:
+                    status[name], elapsed = future.result()
+                except Exception as e:
+                    status[name], elapsed = 'failed', 0.0
+                    print(f"[FAIL] {name}: {e}")
+                _report(name, status[name], elapsed)
+                for child in sorted(children[name]):
+                    waiting[child].discard(name)
+                    if not waiting[child]:
+                        submit(child)
+
+    if not dry_run:
+        state.save()
+    return status
+
+
+def _report(name, node_status, elapsed):
+    if node_status == 'built':
+        print(f"[OK] 재생성: {name} ({elapsed:.2f}s)")
+    elif node_status == 'fresh':
+        print(f"[SKIP] 최신: {name}")
+    elif node_status == 'stale':
+        print(f"[STALE] 재생성 필요: {name}")
+    elif node_status == 'blocked':
+        print(f"[SKIP] 상위 노드 실패: {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="re100-agg", description="agg_data 산출물 DAG 빌드")
+    parser.add_argument('targets', nargs='*', help="재생성할 산출 파일명 (기본: 전체)")
+    parser.add_argument('--year', type=int, action='append',
+                        help="해당 연도 파티션 산출물(agg_data/<연도>/)만 재생성 (여러 번 지정 가능)")
+    parser.add_argument('--force', action='store_true', help="입력 변경 여부와 관계없이 재생성")
+    parser.add_argument('--dry-run', action='store_true', help="재생성 대상만 출력")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="동시 실행 노드 수")
+    parser.add_argument('--list', action='store_true', help="노드와 입력 목록 출력")
+    parser.add_argument('--validate', action='store_true', help="빌드 후 validate_data.py 일관성 검증 실행")
+    parser.add_argument('--metrics', action='store_true',
+                        help="단계별 실행 지표를 JSON/Prometheus 파일로 저장 (pipeline_metrics.py)")
+    parser.add_argument('--profile', action='store_true', help="--metrics + 단계별 cProfile(.prof) 저장")
+    parser.add_argument('--watch', action='store_true',
+                        help="빌드 후 sample_data 변경을 감시하며 영향받는 산출물만 재생성")
+    parser.add_argument('--poll', action='store_true', help="--watch에서 inotify 대신 폴링 사용")
+    parser.add_argument('--debounce', type=float, default=data_watch.DEBOUNCE_SECONDS,
+                        help="--watch에서 마지막 변경 뒤 기다리는 초")
+    args = parser.parse_args()
+
+    unknown = [t for t in args.targets if t not in NODES]
+    if unknown:
+        parser.error(f"알 수 없는 대상: {', '.join(unknown)}")
+    for year in args.year or []:
+        if not year_targets(year):
+            parser.error(f"연도 파티션 없음: {year}")
+        args.targets.extend(year_targets(year))
+
+    # 루트 생성 스크립트는 public/ 상대 경로를 사용
+    os.chdir(project_root)
+
+    if args.list:
+        for name, node in NODES.items():
+            print(name)
+            for path in node.inputs():
+                print(f"  <- {Path(path).relative_to(project_root)}")
+        return
+
+    if integrated_csv is None:
+        print(f"[FAIL] {NoPartitionError(sample_data_dir)}")
+        sys.exit(1)
+
+    if args.watch:
+        warm_cache.enable()
+        _build(args)
+        try:
+            watch(debounce=args.debounce, polling=args.poll)
+        except KeyboardInterrupt:
+            print("\n감시 종료")
+        return
+
+    if not (args.metrics or args.profile):
+        sys.exit(_build(args))
+
+    with recording(StageRecorder(profile=args.profile)) as recorder:
+        code = _build(args)
+    print_report(recorder.report())
+    written = recorder.write()
+    for path in written[:2]:
+        print(f"[OK] 실행 지표 저장: {Path(path).relative_to(project_root)}")
+    if len(written) > 2:
+        print(f"[OK] 단계별 cProfile {len(written) - 2}개 저장: {Path(written[2]).parent.relative_to(project_root)}")
+    sys.exit(code)
+
+
+def _build(args):
+    """빌드(+검증)를 실행하고 종료 코드 반환"""
+    status = run(args.targets, force=args.force, jobs=args.jobs, dry_run=args.dry_run)
+    if any(s in ('failed', 'blocked') for s in status.values()):
+        return 1
+
+    if args.validate and not args.dry_run:
+        from validate_data import print_report as print_validation, validate, write_report
+        report = validate(max_workers=args.jobs)
+        print_validation(report)
+        write_report(report)
+        if report['summary']['failed']:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,339 @@
+"""re100 상주 집계 프로세스 (Unix 소켓)
+
+스크립트를 실행할 때마다 인터프리터 시작, pandas import, CSV 파싱이 반복되어 작은 갱신도
+실제 계산보다 준비 시간이 훨씬 길다. 이 프로세스는 한 번 띄워 두고 파싱한 CSV, 시간 단위
+행렬, 셀 집계, DAG 상태를 메모리에 유지하면서 로컬 Unix 소켓으로 명령을 받는다.
+원본 파일 서명(경로, mtime, 크기)이 바뀐 항목만 다시 읽고(warm_cache.py), 통합 CSV에
+추가된 행은 증분 집계 상태로 반영하므로(incremental_aggregation.py) 반복 실행은 수 ms 단위로 끝난다.
+
+프로토콜: 요청/응답 모두 줄바꿈으로 끝나는 JSON 한 줄
+    {"command": "rebuild", "targets": [...], "years": [2024], "force": false}
+    {"command": "validate"}
+    {"command": "scenario", "names": [...], "definitions": {이름: 정의}}
+    {"command": "status"}
+    {"command": "stop"}
+응답: {"ok": true/false, "elapsed": 초, "output": 출력 텍스트, ...명령별 결과}
+
+명령은 한 번에 하나씩 실행한다 (status는 실행 중에도 바로 응답).
+NODES와 기본 통합 CSV는 시작 시점의 연도 파티션 기준이므로 새 연도 파티션을 추가하면 다시 시작한다.
+
+사용 예:
+    python scripts/re100_daemon.py serve &
+    python scripts/re100_daemon.py serve --watch &            # sample_data 변경 시 영향받는 산출물 자동 재생성
+    python scripts/re100_daemon.py rebuild                    # re100_agg.py와 같은 증분 빌드
+    python scripts/re100_daemon.py rebuild --year 2024
+    python scripts/re100_daemon.py scenario solar_x2
+    python scripts/re100_daemon.py validate
+    python scripts/re100_daemon.py status
+    python scripts/re100_daemon.py stop
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 클라이언트 명령이 pandas를 import하지 않도록 집계 모듈은 Daemon 메서드 안에서 불러온다
+project_root = Path(__file__).resolve().parent.parent
+socket_file = project_root / ".cache" / "re100_daemon.sock"
+COMMANDS = ('rebuild', 'validate', 'scenario', 'status', 'stop')
+
+
+def _json_default(value):
+    """numpy 스칼라/배열을 JSON 값으로 변환"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    return str(value)
+
+
+class CommandOutput:
+    """sys.stdout 대체: 명령을 실행 중인 스레드의 출력만 그 명령의 버퍼로 모으고
+    다른 스레드(asyncio 루프, 감시 스레드)의 출력은 원래 stdout으로 보낸다"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def _target(self):
+        buffer = getattr(self._local, 'buffer', None)
+        return self.stream if buffer is None else buffer
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    @contextlib.contextmanager
+    def capture(self):
+        """현재 스레드의 출력을 StringIO로 받기"""
+        self._local.buffer = io.StringIO()
+        try:
+            yield self._local.buffer
+        finally:
+            self._local.buffer = None
+
+
+class Daemon:
+    """메모리에 유지하는 빌드 상태와 명령 처리"""
+
+    def __init__(self):
+        import warm_cache
+        warm_cache.enable()
+        if not isinstance(sys.stdout, CommandOutput):
+            sys.stdout = CommandOutput(sys.stdout)
+        self.output = sys.stdout
+        self.started = time.time()
+        self.commands = 0
+        self.state = None
+        self._state_mtime = None
+
+    def _dag_state(self):
+        """DAG 상태 (다른 프로세스가 re100_agg.py로 상태 파일을 바꿨으면 다시 읽음)"""
+        from re100_agg import DagState, dag_state_file
+        mtime = dag_state_file.stat().st_mtime_ns if dag_state_file.exists() else None
+        if self.state is None or mtime != self._state_mtime:
+            self.state = DagState()
+        return self.state
+
+    def _saved_state(self):
+        from re100_agg import dag_state_file
+        self._state_mtime = dag_state_file.stat().st_mtime_ns if dag_state_file.exists() else None
+
+    def warm_up(self):
+        """시간 단위 행렬과 셀 집계 미리 적재"""
+        from aggregation_engine import integrated_csv
+        from hourly_matching import load_hourly_matrix
+        from re100_agg import BuildContext
+        load_hourly_matrix(integrated_csv)
+        BuildContext().cells()
+
+    def rebuild(self, targets=None, years=None, force=False, jobs=None):
+        from re100_agg import NODES, run, year_targets
+        targets = list(targets or [])
+        unknown = [t for t in targets if t not in NODES]
+        if unknown:
+            raise ValueError(f"알 수 없는 대상: {', '.join(unknown)}")
+        for year in years or []:
+            if not year_targets(year):
+                raise ValueError(f"연도 파티션 없음: {year}")
+            targets.extend(year_targets(year))
+        status = run(targets, force=force, jobs=jobs, state=self._dag_state())
+        self._saved_state()
+        return {'ok': not any(s in ('failed', 'blocked') for s in status.values()), 'status': status}
+
+    def validate(self):
+        # 검증은 집계 경로와 독립적이어야 하므로 셀 집계 캐시를 쓰지 않고 통합 CSV 원본을 다시 읽는다
+        from validate_data import print_report, validate, write_report
+        report = validate(max_workers=1)
+        print_report(report)
+        write_report(report)
+        return {'ok': not report['summary']['failed'], 'summary': report['summary']}
+
+    def scenario(self, names=None, definitions=None):
+        from aggregation_engine import integrated_csv
+        from hourly_matching import load_hourly_matrix
+        from scenarios import build_scenario_report, evaluate, load_scenarios, print_scenario_report
+        scenarios = load_scenarios(definitions=definitions)
+        if names:
+            unknown = [name for name in names if name not in scenarios]
+            if unknown:
+                raise ValueError(f"알 수 없는 시나리오: {', '.join(unknown)}")
+            scenarios = {name: scenarios[name] for name in names}
+        report = build_scenario_report(evaluate(load_hourly_matrix(integrated_csv), scenarios), scenarios)
+        print_scenario_report(report)
+        return {'ok': True, 'report': report}
+
+    def status(self):
+        from pipeline_metrics import peak_rss_mb
+        import warm_cache
+        return {
+            'ok': True,
+            'pid': os.getpid(),
+            'uptime': time.time() - self.started,
+            'commands': self.commands,
+            'peak_rss_mb': peak_rss_mb(),
+            'cache': warm_cache.stats(),
+        }
+
+    def handle(self, request):
+        """요청 하나 실행 (출력은 응답의 output으로 돌려줌)"""
+        command = request.get('command')
+        handlers = {
+            'rebuild': lambda: self.rebuild(request.get('targets'), request.get('years'),
+                                            request.get('force', False), request.get('jobs')),
+            'validate': self.validate,
+            'scenario': lambda: self.scenario(request.get('names'), request.get('definitions')),
+        }
+        if command not in handlers:
+            return {'ok': False, 'error': f"알 수 없는 명령: {command}"}
+        started = time.perf_counter()
+        with self.output.capture() as output:
+            try:
+                result = handlers[command]()
+            except Exception as e:
+                result = {'ok': False, 'error': str(e)}
+        self.commands += 1
+        result['elapsed'] = time.perf_counter() - started
+        result['output'] = output.getvalue()
+        return result
+
+
+def _watch(daemon, executor, polling=False):
+    """sample_data 변경 묶음마다 영향받는 산출물을 명령 실행 스레드에서 재생성"""
+    from re100_agg import watch
+
+    def rebuild(targets):
+        response = executor.submit(daemon.handle, {'command': 'rebuild', 'targets': targets}).result()
+        sys.stdout.write(response['output'])
+        if not response['ok']:
+            print(f"[FAIL] rebuild: {response.get('error', '실패')}")
+
+    watch(rebuild, polling=polling)
+
+
+async def serve(daemon, path=socket_file, watch=False, polling=False):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.exists():
+        # 다른 프로세스가 쓰고 있는 소켓이면 시작하지 않음
+        try:
+            request({'command': 'status'}, path)
+        except OSError:
+            path.unlink()
+        else:
+            raise RuntimeError(f"이미 실행 중: {path}")
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=1)
+    stopping = asyncio.Event()
+
+    async def handle_connection(reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                try:
+                    payload = json.loads(line)
+                except ValueError:
+                    response = {'ok': False, 'error': "JSON 요청이 아님"}
+                else:
+                    command = payload.get('command')
+                    if command == 'status':
+                        response = daemon.status()
+                    elif command == 'stop':
+                        response = {'ok': True}
+                        stopping.set()
+                    else:
+                        response = await loop.run_in_executor(executor, daemon.handle, payload)
+                        print(f"[OK] {command} ({response['elapsed']:.3f}s)" if response['ok']
+                              else f"[FAIL] {command}: {response.get('error', '실패')}", flush=True)
+                writer.write(json.dumps(response, ensure_ascii=False, default=_json_default).encode() + b'\n')
+                await writer.drain()
+                if stopping.is_set():
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_unix_server(handle_connection, path=str(path))
+    os.chmod(path, 0o600)
+    shown = path.relative_to(project_root) if path.is_relative_to(project_root) else path
+    print(f"[OK] 대기 중: {shown} (pid {os.getpid()})", flush=True)
+    if watch:
+        threading.Thread(target=_watch, args=(daemon, executor, polling), daemon=True).start()
+    try:
+        async with server:
+            await stopping.wait()
+    finally:
+        executor.shutdown(wait=True)
+        path.unlink(missing_ok=True)
+
+
+def request(payload, path=socket_file):
+    """요청 하나를 보내고 응답 반환 (연결 실패 시 OSError)"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(json.dumps(payload, ensure_ascii=False).encode() + b'\n')
+        with sock.makefile('rb') as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("응답 없이 연결이 끊김")
+    return json.loads(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="re100 상주 집계 프로세스 (Unix 소켓)")
+    parser.add_argument('command', choices=('serve',) + COMMANDS)
+    parser.add_argument('names', nargs='*', help="rebuild: 산출 파일명, scenario: 시나리오 이름")
+    parser.add_argument('--year', type=int, action='append', help="rebuild: 연도 파티션 산출물만 재생성")
+    parser.add_argument('--force', action='store_true', help="rebuild: 입력 변경 여부와 관계없이 재생성")
+    parser.add_argument('--jobs', '-j', type=int, default=None, help="rebuild: 동시 실행 노드 수")
+    parser.add_argument('--scenario-file', help="scenario: 추가 시나리오 JSON {이름: 정의}")
+    parser.add_argument('--no-warm-up', action='store_true', help="serve: 시작 시 데이터 미리 적재 안 함")
+    parser.add_argument('--watch', action='store_true', help="serve: sample_data 변경 시 영향받는 산출물 재생성")
+    parser.add_argument('--poll', action='store_true', help="serve --watch: inotify 대신 폴링 사용")
+    parser.add_argument('--socket', default=str(socket_file), help="Unix 소켓 경로")
+    args = parser.parse_intermixed_args()
+
+    if args.command == 'serve':
+        # 루트 생성 스크립트는 public/ 상대 경로를 사용
+        os.chdir(project_root)
+        daemon = Daemon()
+        if not args.no_warm_up:
+            started = time.perf_counter()
+            daemon.warm_up()
+            print(f"[OK] 데이터 적재 ({time.perf_counter() - started:.2f}s)", flush=True)
+        try:
+            asyncio.run(serve(daemon, args.socket, watch=args.watch, polling=args.poll))
+        except RuntimeError as e:
+            print(f"[FAIL] {e}")
+            sys.exit(1)
+        except KeyboardInterrupt:
+            pass
+        print("종료")
+        return
+
+    payload = {'command': args.command}
+    if args.command == 'rebuild':
+        payload.update(targets=args.names, years=args.year or [], force=args.force, jobs=args.jobs)
+    elif args.command == 'scenario':
+        payload['names'] = args.names
+        if args.scenario_file:
+            with open(args.scenario_file, 'r', encoding='utf-8') as f:
+                payload['definitions'] = json.load(f)
+    try:
+        response = request(payload, args.socket)
+    except OSError as e:
+        print(f"[FAIL] 상주 프로세스에 연결할 수 없음 ({e}): python scripts/re100_daemon.py serve")
+        sys.exit(1)
+
+    sys.stdout.write(response.get('output', ''))
+    if args.command == 'status':
+        from pipeline_metrics import format_mb
+        print(f"pid {response['pid']}, 가동 {response['uptime']:.0f}s, 명령 {response['commands']}개, "
+              f"최대 RSS {format_mb(response['peak_rss_mb'])}")
+        for entry in response['cache']:
+            print(f"  {entry['kind']:<8} {Path(entry['key']).name}  재사용 {entry['hits']}회 "
+                  f"(적재 {entry['load_seconds']:.2f}s)")
+    if not response['ok']:
+        print(f"[FAIL] {response.get('error', args.command + ' 실패')}")
+        sys.exit(1)
+    if 'elapsed' in response:
+        print(f"[OK] {args.command} ({response['elapsed'] * 1000:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
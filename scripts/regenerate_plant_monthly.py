@@ -1,59 +1,52 @@
-import pandas as pd
 import json
-from pathlib import Path
-
-# 프로젝트 루트 설정
-project_root = Path(r"D:\study\cltuto\re100_dashboard")
-sample_data_dir = project_root / "public" / "sample_data"
-agg_data_dir = project_root / "public" / "agg_data"
-
-# 발전소별 CSV 파일 로드 및 월별 집계
-plant_monthly = {
-    "solar": {},
-    "wind": {}
-}
-
-# 태양광 발전소 처리
-solar_plants = ['solar_plant1', 'solar_plant2', 'solar_plant3']
-for plant in solar_plants:
-    csv_path = sample_data_dir / f"{plant}.csv"
-    if csv_path.exists():
-        df = pd.read_csv(csv_path, parse_dates=['datetime'])
-        # 월별 집계 (kWh -> GWh 변환)
-        monthly = df.groupby(df['datetime'].dt.to_period('M'))['value'].sum() / 1000000
-        
-        plant_monthly['solar'][plant] = {}
-        for period, value in monthly.items():
-            month_key = str(period)  # "2024-01" 형식
-            plant_monthly['solar'][plant][month_key] = value
-
-# 풍력 발전소 처리  
-wind_plants = ['wind_plant1', 'wind_plant2', 'wind_plant3']
-for plant in wind_plants:
-    csv_path = sample_data_dir / f"{plant}.csv"
-    if csv_path.exists():
-        df = pd.read_csv(csv_path, parse_dates=['datetime'])
-        # 월별 집계 (kWh -> GWh 변환)
-        monthly = df.groupby(df['datetime'].dt.to_period('M'))['value'].sum() / 1000000
-        
-        plant_monthly['wind'][plant] = {}
-        for period, value in monthly.items():
-            month_key = str(period)  # "2024-01" 형식
-            plant_monthly['wind'][plant][month_key] = value
-
-# JSON 파일로 저장
-output_path = agg_data_dir / "plant_monthly_aggregated.json"
-with open(output_path, 'w', encoding='utf-8') as f:
-    json.dump(plant_monthly, f, ensure_ascii=False, indent=2)
-
-print(f"✅ plant_monthly_aggregated.json 재생성 완료")
-
-# 검증
-for plant_type in ['solar', 'wind']:
-    print(f"\n{plant_type.upper()} 발전소:")
-    for plant, data in plant_monthly[plant_type].items():
-        months = len(data)
-        total = sum(data.values())
-        print(f"  {plant}: {months}개월, 연간 총 {total:.2f} GWh")
-        if months < 12:
-            print(f"    ⚠️ 경고: {months}개월만 있음")
\ No newline at end of file
+
+from aggregation_engine import agg_data_dir
+from entity_registry import display_names
+from parallel_plants import load_plant_list, process_plants
+from plant_registry import capacity_factors
+
+
+def build_plant_monthly():
+    """발전소별 CSV 파일을 병렬로 로드 및 월별 집계 (레지스트리 설비용량 배율 적용)"""
+    plant_monthly = {
+        "solar": {},
+        "wind": {}
+    }
+
+    factors = capacity_factors()
+    entries = [entry for entry in load_plant_list() if entry['type'] in plant_monthly]
+    for result in process_plants(entries):
+        if result['exists']:
+            # 엔티티 ID 키, 월 키는 "2024-01" 형식
+            plant = str(result['id'])
+            factor = factors.get(result['plant_name'], 1.0)
+            plant_monthly[result['type']][plant] = {
+                month: value * factor for month, value in result['monthly'].items()
+            }
+    return plant_monthly
+
+
+def main():
+    plant_monthly = build_plant_monthly()
+
+    # JSON 파일로 저장
+    output_path = agg_data_dir / "plant_monthly_aggregated.json"
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(plant_monthly, f, ensure_ascii=False, indent=2)
+
+    print(f"✅ plant_monthly_aggregated.json 재생성 완료")
+
+    # 검증
+    names = display_names()
+    for plant_type in ['solar', 'wind']:
+        print(f"\n{plant_type.upper()} 발전소:")
+        for plant, data in plant_monthly[plant_type].items():
+            months = len(data)
+            total = sum(data.values())
+            print(f"  {names.get(plant, plant)}: {months}개월, 연간 총 {total:.2f} GWh")
+            if months < 12:
+                print(f"    ⚠️ 경고: {months}개월만 있음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""누적합(prefix sum) 기반 롤업 큐브
+
+[행 x 시간(시간 단위)] 행렬의 누적합을 한 번 만들어 두면 임의 기간의 합계는
+두 위치의 차이(prefix[end] - prefix[start])로 상수 시간에 구할 수 있다.
+행은 발전소/기업 각각과 타입별 합계(solar/wind/supply/demand의 'total')이다.
+시간/일/주/월/연 단위 집계와 weekly_data.json의 주차별 합계, 사용자 지정 기간
+조회가 모두 같은 구조에서 나온다.
+
+사용 예:
+    python scripts/rollup_cube.py --start 2024-03-01 --end 2024-04-01 --freq W
+    python scripts/rollup_cube.py --entity 육상태양광 --freq M
+"""
+import argparse
+import calendar
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from aggregation_engine import project_root, integrated_csv, SUPPLY_TYPES
+from hourly_matching import NS_PER_HOUR, load_hourly_matrix
+from partitions import latest_year, NoPartitionError
+
+cube_file = project_root / ".cache" / "rollup_cube.npz"
+
+TOTAL = 'total'
+TOTAL_TYPES = SUPPLY_TYPES + ['supply', 'demand']
+FREQS = ['h', 'D', 'W', 'M', 'Y']
+NS_PER_DAY = 24 * NS_PER_HOUR
+
+
+class RollupCube:
+    """행별 시간 누적합. prefix[:, i]는 처음 i개 시간의 합계 (GWh)"""
+
+    def __init__(self, start, types, names, prefix):
+        self.start = pd.Timestamp(start)
+        self.types = list(types)
+        self.names = list(names)
+        self.prefix = prefix
+        self.n_hours = prefix.shape[1] - 1
+        self.index = pd.date_range(self.start, periods=self.n_hours, freq='h')
+        self._rows = {(t, n): i for i, (t, n) in enumerate(zip(self.types, self.names))}
+
+    @classmethod
+    def from_values(cls, start, types, names, values):
+        """[행 x 시간] 값 행렬로 누적합 생성"""
+        values = np.atleast_2d(values)
+        prefix = np.zeros((values.shape[0], values.shape[1] + 1))
+        np.cumsum(values, axis=1, out=prefix[:, 1:])
+        return cls(start, types, names, prefix)
+
+    @classmethod
+    def from_matrix(cls, matrix):
+        """HourlyMatrix에 타입별 합계 행을 더해 누적합 생성"""
+        totals = {t: matrix.total([t]) for t in SUPPLY_TYPES + ['demand']}
+        totals['supply'] = matrix.total(SUPPLY_TYPES)
+        values = np.vstack([matrix.values] + [totals[t][None, :] for t in TOTAL_TYPES])
+        return cls.from_values(matrix.index[0], list(matrix.types) + TOTAL_TYPES,
+                               list(matrix.names) + [TOTAL] * len(TOTAL_TYPES), values)
+
+    @classmethod
+    def from_csv(cls, csv_file=integrated_csv):
+        return cls.from_matrix(load_hourly_matrix(csv_file))
+
+    def save(self, path=cube_file):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(path, start=np.datetime64(self.start, 'ns'), types=np.array(self.types),
+                 names=np.array(self.names), prefix=self.prefix)
+
+    @classmethod
+    def load(cls, path=cube_file):
+        with np.load(path) as data:
+            return cls(data['start'][()], data['types'].tolist(), data['names'].tolist(), data['prefix'])
+
+    def row(self, name=None, energy_type=None):
+        """행 번호 조회 (이름만 주면 전체 타입에서, 타입만 주면 타입 합계 행)"""
+        if name is None:
+            return self._rows[(energy_type, TOTAL)]
+        if energy_type is not None:
+            return self._rows[(energy_type, name)]
+        matches = [i for (t, n), i in self._rows.items() if n == name and n != TOTAL]
+        if len(matches) != 1:
+            raise KeyError(f"엔티티를 찾을 수 없거나 중복됨: {name}")
+        return matches[0]
+
+    def position(self, when):
+        """시각 -> 누적합 위치 (해당 시각이 속한 시간 이전까지, 범위 밖은 양 끝으로)"""
+        offset = (pd.Timestamp(when) - self.start) // pd.Timedelta(hours=1)
+        return int(min(max(offset, 0), self.n_hours))
+
+    def range_sum(self, start=None, end=None, rows=None):
+        """[start, end) 기간 합계. rows가 없으면 전체 행 배열, 정수면 스칼라"""
+        i = 0 if start is None else self.position(start)
+        j = self.n_hours if end is None else self.position(end)
+        j = max(i, j)
+        selected = self.prefix if rows is None else self.prefix[rows]
+        return selected[..., j] - selected[..., i]
+
+    def _period_codes(self, freq):
+        ns = np.asarray(self.index, dtype='datetime64[ns]').astype('int64')
+        if freq == 'h':
+            return np.arange(self.n_hours)
+        if freq == 'D':
+            return ns // NS_PER_DAY
+        if freq == 'W':
+            # 1970-01-01은 목요일이므로 +3일 하면 월요일 시작 주
+            return (ns // NS_PER_DAY + 3) // 7
+        if freq == 'M':
+            return self.index.year.to_numpy() * 100 + self.index.month.to_numpy()
+        if freq == 'Y':
+            return self.index.year.to_numpy()
+        raise ValueError(f"지원하지 않는 단위: {freq}")
+
+    def period_bounds(self, freq, start=None, end=None):
+        """[start, end) 안의 기간 경계 위치 (기간 k는 bounds[k] ~ bounds[k + 1])"""
+        i = 0 if start is None else self.position(start)
+        j = self.n_hours if end is None else max(i, self.position(end))
+        codes = self._period_codes(freq)[i:j]
+        if len(codes) == 0:
+            return np.array([i], dtype='int64')
+        return i + np.concatenate([[0], np.flatnonzero(np.diff(codes)) + 1, [len(codes)]])
+
+    def rollup(self, freq, start=None, end=None, rows=None):
+        """기간 단위 합계. (기간 시작 시각 목록, [행 x 기간] 합계) 반환"""
+        bounds = self.period_bounds(freq, start, end)
+        prefix = self.prefix if rows is None else self.prefix[np.atleast_1d(rows)]
+        sums = prefix[:, bounds[1:]] - prefix[:, bounds[:-1]]
+        return list(self.index[bounds[:-1]]), sums
+
+
+def week_ranges(year):
+    """월별 7일 단위 주차 (1일부터 7일씩, 마지막 주는 월말까지)"""
+    weeks = {}
+    for month in range(1, 13):
+        days = calendar.monthrange(year, month)[1]
+        month_name = f"{month}월"
+        weeks[month_name] = []
+        for week, start_day in enumerate(range(1, days + 1, 7), start=1):
+            end_day = min(start_day + 6, days)
+            weeks[month_name].append({
+                "week": week,
+                "label": f"{month_name} {week}주차",
+                "start": f"{year}-{month:02d}-{start_day:02d}",
+                "end": f"{year}-{month:02d}-{end_day:02d}",
+            })
+    return weeks
+
+
+def build_weekly_data(cube=None, year=None):
+    """weekly_data.json (주차 라벨 + 큐브가 있으면 주차별 타입 합계 GWh, RE100 %)"""
+    if year is None:
+        year = cube.start.year if cube is not None else latest_year()
+    if year is None:
+        raise NoPartitionError()
+    weekly = week_ranges(year)
+    if cube is None:
+        return weekly
+
+    rows = [cube.row(energy_type=t) for t in TOTAL_TYPES]
+    for weeks in weekly.values():
+        for week in weeks:
+            end = pd.Timestamp(week['end']) + pd.Timedelta(days=1)
+            totals = dict(zip(TOTAL_TYPES, cube.range_sum(week['start'], end, rows).tolist()))
+            week.update(totals)
+            week['re100_rate'] = (
+                min(totals['supply'] / totals['demand'] * 100, 100) if totals['demand'] > 0 else 0
+            )
+    return weekly
+
+
+def main():
+    parser = argparse.ArgumentParser(description="롤업 큐브 기간 조회")
+    parser.add_argument('--csv', default=integrated_csv, help="통합 CSV 파일")
+    parser.add_argument('--entity', help="발전소/기업 이름 (기본: 타입별 합계)")
+    parser.add_argument('--start', help="시작 시각 (포함)")
+    parser.add_argument('--end', help="끝 시각 (제외)")
+    parser.add_argument('--freq', choices=FREQS, default='M', help="집계 단위")
+    args = parser.parse_args()
+
+    cube = RollupCube.from_csv(args.csv)
+    if args.entity:
+        rows, labels = [cube.row(args.entity)], [args.entity]
+    else:
+        rows, labels = [cube.row(energy_type=t) for t in TOTAL_TYPES], TOTAL_TYPES
+
+    starts, sums = cube.rollup(args.freq, args.start, args.end, rows)
+    print(f"{'period':<16}" + "".join(f"{label:>14}" for label in labels))
+    for period, values in zip(starts, sums.T):
+        print(f"{period:%Y-%m-%d %H:%M}" + "".join(f"{v:>14,.3f}" for v in values))
+    total = cube.range_sum(args.start, args.end, rows)
+    print(f"{'합계':<14}" + "".join(f"{v:>14,.3f}" for v in total))
+
+
+if __name__ == "__main__":
+    main()
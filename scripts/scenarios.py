@@ -0,0 +1,230 @@
+"""시나리오 배율 (조회 시점 적용)
+
+시나리오는 기준 집계에 곱할 배율 정의일 뿐이며 파일로 복사하지 않는다.
+
+    {"scale": 전체 배율,
+     "types": {"solar": 배율, "wind": 배율, "demand": 배율},
+     "plants": {발전소: 배율},
+     "companies": {기업: 배율}}
+
+발전소/기업은 엔티티 ID, 표시 이름, 원본 이름 중 하나로 지정하며 읽을 때 ID로 바꾼다.
+
+엔티티 하나의 배율은 scale x 타입 배율 x 발전소(또는 기업) 배율이며, 지정하지 않은
+항목은 1이다. 집계 JSON(월별/기업별 월별/시간대별)에는 읽을 때 apply_* 로 적용하고,
+시간 단위 행렬에는 [시나리오 x 엔티티] 배율 행렬 곱 한 번으로 여러 시나리오의
+연간/월별 합계와 볼륨/매칭 RE100을 함께 계산한다.
+
+사용 예:
+    python scripts/scenarios.py                                  # 기본 제공 시나리오 비교
+    python scripts/scenarios.py --scenario-file my_scenarios.json --scenario wind_x2
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+
+from aggregation_engine import integrated_csv, SUPPLY_TYPES
+from entity_registry import resolve, row_keys
+from hourly_matching import load_hourly_matrix
+
+# 기본 제공 시나리오 (기존 *_10pct.json 은 '10pct' 시나리오로 대체)
+SCENARIOS = {
+    'baseline': {},
+    '10pct': {'scale': 0.10},
+}
+DEFINITION_KEYS = {'scale', 'types', 'plants', 'companies'}
+
+# 배치 평가 시 한 번에 계산할 시나리오 수 ([시나리오 x 시간] 배열 메모리 상한)
+SCENARIO_CHUNK = 256
+
+
+def _entity_ids(name, entities, energy_type=None):
+    """{발전소/기업 이름: 배율}의 키를 엔티티 ID 문자열로 변환"""
+    converted = {}
+    for entity, value in entities.items():
+        try:
+            converted[str(resolve(entity, energy_type)['id'])] = value
+        except KeyError:
+            raise ValueError(f"시나리오 {name}: 레지스트리에 없는 엔티티 {entity}") from None
+    return converted
+
+
+def load_scenarios(path=None, definitions=None):
+    """기본 시나리오 + JSON 파일 + definitions {이름: 정의} 병합 (발전소/기업 키는 엔티티 ID로 변환)"""
+    scenarios = dict(SCENARIOS)
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            scenarios.update(json.load(f))
+    scenarios.update(definitions or {})
+    for name, definition in list(scenarios.items()):
+        unknown = set(definition) - DEFINITION_KEYS
+        if unknown:
+            raise ValueError(f"시나리오 {name}: 알 수 없는 항목 {', '.join(sorted(unknown))}")
+        definition = scenarios[name] = dict(definition)
+        if definition.get('plants'):
+            definition['plants'] = _entity_ids(name, definition['plants'])
+        if definition.get('companies'):
+            definition['companies'] = _entity_ids(name, definition['companies'], 'demand')
+    return scenarios
+
+
+def factor(definition, energy_type, key):
+    """엔티티(ID 문자열) 하나의 배율"""
+    entities = definition.get('companies' if energy_type == 'demand' else 'plants', {})
+    return (definition.get('scale', 1.0)
+            * definition.get('types', {}).get(energy_type, 1.0)
+            * entities.get(key, 1.0))
+
+
+def _multipliers(definition, types, keys):
+    return np.array([factor(definition, t, k) for t, k in zip(types, keys)])
+
+
+def multipliers(definition, types, names):
+    """행별 배율 벡터 (names: 행렬 행의 원본 이름, 등록되지 않은 행은 엔티티 배율 없음)"""
+    return _multipliers(definition, types, row_keys(types, names, quiet=True))
+
+
+def multiplier_matrix(definitions, types, names):
+    """[시나리오 x 행] 배율 행렬"""
+    keys = row_keys(types, names, quiet=True)
+    return np.array([_multipliers(d, types, keys) for d in definitions]).reshape(len(definitions), len(names))
+
+
+def _scale_leaf(values, f):
+    return {key: value * f for key, value in values.items()}
+
+
+def _sum_leaves(leaves):
+    total = {}
+    for values in leaves:
+        for key, value in values.items():
+            total[key] = total.get(key, 0) + value
+    return total
+
+
+def apply_entities(data, definition):
+    """{타입: {발전소: {키: 값}}} 구조에 배율 적용 ('total'은 배율 적용 후 다시 합산)"""
+    adjusted = {}
+    for energy_type, entities in data.items():
+        adjusted[energy_type] = {
+            name: _scale_leaf(values, factor(definition, energy_type, name))
+            for name, values in entities.items() if name != 'total'
+        }
+        if 'total' in entities:
+            adjusted[energy_type]['total'] = _sum_leaves(adjusted[energy_type].values())
+    return adjusted
+
+
+def apply_company_monthly(company_monthly, definition):
+    """{기업: {월: 값}} 구조에 배율 적용"""
+    return {
+        company: _scale_leaf(values, factor(definition, 'demand', company))
+        for company, values in company_monthly.items()
+    }
+
+
+def apply_monthly(monthly_agg, definition, company_monthly=None):
+    """monthly_aggregated 구조에 배율 적용
+
+    수요는 기업 합계만 있으므로 기업별 배율이 있으면 company_monthly가 필요하다.
+    """
+    adjusted = apply_entities({t: monthly_agg[t] for t in SUPPLY_TYPES if t in monthly_agg}, definition)
+    if definition.get('companies'):
+        if company_monthly is None:
+            raise ValueError("기업별 배율에는 company_monthly 데이터가 필요합니다")
+        adjusted['demand'] = _sum_leaves(apply_company_monthly(company_monthly, definition).values())
+    else:
+        adjusted['demand'] = _scale_leaf(monthly_agg.get('demand', {}), factor(definition, 'demand', None))
+    return adjusted
+
+
+def scaled_totals(matrix, definitions):
+    """HourlyMatrix의 타입별 시간별 합계를 시나리오마다 계산 ({타입: [시나리오 x 시간]})"""
+    weights = multiplier_matrix(definitions, matrix.types, matrix.names)
+    totals = {}
+    for energy_type in SUPPLY_TYPES + ['demand']:
+        rows = matrix.rows([energy_type])
+        totals[energy_type] = weights[:, rows] @ matrix.values[rows]
+    return totals
+
+
+def evaluate(matrix, scenarios, chunk=SCENARIO_CHUNK):
+    """여러 시나리오를 한 번에 평가 (연간/월별 공급, 수요, 매칭량 GWh)"""
+    names = list(scenarios)
+    index = matrix.index
+    month_codes = index.year.to_numpy() * 100 + index.month.to_numpy()
+    month_starts = np.concatenate([[0], np.flatnonzero(np.diff(month_codes)) + 1])
+
+    parts = []
+    for i in range(0, len(names), chunk):
+        totals = scaled_totals(matrix, [scenarios[name] for name in names[i:i + chunk]])
+        totals['supply'] = totals['solar'] + totals['wind']
+        totals['matched'] = np.minimum(totals['supply'], totals['demand'])
+        parts.append({key: np.add.reduceat(values, month_starts, axis=1) for key, values in totals.items()})
+
+    monthly = {key: np.vstack([part[key] for part in parts]) for key in parts[0]}
+    return {
+        'names': names,
+        'months': index[month_starts].strftime('%Y-%m').tolist(),
+        'monthly': monthly,
+        'annual': {key: values.sum(axis=1) for key, values in monthly.items()},
+    }
+
+
+def _rate(numerator, denominator):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator > 0, numerator / denominator * 100, 0.0)
+
+
+def build_scenario_report(result, scenarios):
+    """evaluate 결과를 {시나리오: {정의, 연간 합계, 월별 RE100}} 로 변환"""
+    annual = result['annual']
+    monthly = result['monthly']
+    report = {}
+    for i, name in enumerate(result['names']):
+        totals = {key: float(values[i]) for key, values in annual.items()}
+        totals['re100_rate'] = float(_rate(totals['supply'], totals['demand']))
+        totals['matched_re100_rate'] = float(_rate(totals['matched'], totals['demand']))
+        report[name] = {
+            'definition': scenarios[name],
+            'annual_totals': totals,
+            'monthly_re100_rate': dict(zip(result['months'], _rate(monthly['supply'][i], monthly['demand'][i]).tolist())),
+            'monthly_matched_re100_rate': dict(zip(result['months'], _rate(monthly['matched'][i], monthly['demand'][i]).tolist())),
+        }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시나리오 배율 일괄 평가")
+    parser.add_argument('--csv', default=integrated_csv, help="통합 CSV 파일")
+    parser.add_argument('--scenario-file', help="추가 시나리오 JSON {이름: 정의}")
+    parser.add_argument('--scenario', nargs='+', help="평가할 시나리오 (기본: 전체)")
+    args = parser.parse_args()
+
+    scenarios = load_scenarios(args.scenario_file)
+    if args.scenario:
+        unknown = [name for name in args.scenario if name not in scenarios]
+        if unknown:
+            parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+        scenarios = {name: scenarios[name] for name in args.scenario}
+
+    matrix = load_hourly_matrix(args.csv)
+    started = time.perf_counter()
+    report = build_scenario_report(evaluate(matrix, scenarios), scenarios)
+    print(f"시나리오 {len(report)}개 평가 ({time.perf_counter() - started:.3f}s)")
+    print_scenario_report(report)
+
+
+def print_scenario_report(report):
+    """시나리오별 연간 공급/수요/RE100 표 출력"""
+    print(f"{'scenario':<20}{'supply':>12}{'demand':>12}{'RE100 %':>10}{'matched %':>11}")
+    for name, result in report.items():
+        totals = result['annual_totals']
+        print(f"{name:<20}{totals['supply']:>12,.2f}{totals['demand']:>12,.2f}"
+              f"{totals['re100_rate']:>10.2f}{totals['matched_re100_rate']:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
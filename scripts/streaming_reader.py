@@ -0,0 +1,140 @@
+"""통합 수요 CSV 스트리밍(청크) 읽기
+
+통합 CSV를 고정 크기 청크로 나누어 읽고 청크마다 누적 집계기에 넘긴다.
+누적 집계기는 (type, plant_name, month, hour) 셀 합계/개수와 기업 목록만 보관하므로
+파일의 연도 수나 행 수와 관계없이 최대 메모리가 청크 크기 + 셀 수로 제한된다.
+"""
+import os
+
+import pandas as pd
+
+from aggregation_engine import integrated_csv, aggregate_cells, merge_cells
+from csv_cache import CSV_DTYPES, DATETIME_FORMAT
+from partitions import require_partition
+from pipeline_metrics import stage
+
+# 청크당 행 수 (약 수십 MB)
+DEFAULT_CHUNK_ROWS = 200_000
+CSV_COLUMNS = ['datetime', 'type', 'plant_name', 'value']
+
+
+class BoundedReader:
+    """파일 객체에서 지정한 바이트 위치까지만 읽도록 제한하는 래퍼"""
+
+    def __init__(self, f, end):
+        self._f = f
+        self._end = end
+
+    def read(self, size=-1):
+        remaining = self._end - self._f.tell()
+        if remaining <= 0:
+            return b''
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        return self._f.read(size)
+
+    def __iter__(self):
+        # pandas가 파일 객체로 인식하도록 행 단위 이터레이터 제공
+        while True:
+            line = self._f.readline(max(0, self._end - self._f.tell()))
+            if not line:
+                return
+            yield line
+
+
+def _parse_datetime(chunk):
+    try:
+        chunk['datetime'] = pd.to_datetime(chunk['datetime'], format=DATETIME_FORMAT)
+    except ValueError:
+        chunk['datetime'] = pd.to_datetime(chunk['datetime'])
+    return chunk
+
+
+def iter_chunks(source, chunk_rows=DEFAULT_CHUNK_ROWS, usecols=None, header=True):
+    """CSV를 청크 단위 DataFrame으로 순회
+
+    source 는 경로 또는 파일 객체. header=False 이면 헤더 없는 본문으로 보고
+    표준 컬럼명(datetime, type, plant_name, value)을 사용한다.
+    """
+    options = {'chunksize': chunk_rows, 'usecols': usecols}
+    if not header:
+        options.update(header=None, names=CSV_COLUMNS)
+    columns = usecols or CSV_COLUMNS
+    options['dtype'] = {k: v for k, v in CSV_DTYPES.items() if k in columns}
+
+    with pd.read_csv(source, **options) as reader:
+        while True:
+            # 청크 읽기/파싱만 측정 (소비하는 쪽의 집계 시간 제외)
+            with stage('parse') as info:
+                chunk = next(reader, None)
+                if chunk is None:
+                    break
+                if 'datetime' in chunk.columns:
+                    chunk = _parse_datetime(chunk)
+                info['rows'] = len(chunk)
+            yield chunk
+
+
+class StreamingAggregator:
+    """청크를 받아 셀 합계/개수와 기업 목록을 누적하는 집계기"""
+
+    def __init__(self):
+        self.cells = None
+        self.companies = set()
+        self.rows = 0
+
+    def feed(self, chunk):
+        """청크 하나를 누적 (청크는 바로 버려도 됨)"""
+        self.rows += len(chunk)
+        self.cells = merge_cells(self.cells, aggregate_cells(chunk))
+        demand = chunk.loc[chunk['type'] == 'demand', 'plant_name'].dropna()
+        self.companies.update(str(name).strip() for name in demand.unique())
+        return self
+
+    def result(self):
+        """누적된 셀 집계 (빈 입력이면 빈 DataFrame)"""
+        return self.cells if self.cells is not None else merge_cells()
+
+
+def aggregate_stream(source, chunk_rows=DEFAULT_CHUNK_ROWS, header=True):
+    """CSV 전체를 청크로 읽어 누적 집계기 반환"""
+    aggregator = StreamingAggregator()
+    for chunk in iter_chunks(source, chunk_rows, header=header):
+        aggregator.feed(chunk)
+    return aggregator
+
+
+def aggregate_range(csv_file, start, end, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """헤더 없는 본문 구간 [start, end) 바이트만 청크로 집계 (증분 재집계용)"""
+    if end <= start:
+        return StreamingAggregator()
+    with open(csv_file, 'rb') as f:
+        f.seek(start)
+        return aggregate_stream(BoundedReader(f, end), chunk_rows, header=False)
+
+
+def collect_companies(csv_file=integrated_csv, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """type, plant_name 두 컬럼만 청크로 읽어 수요 기업명 집합 수집"""
+    companies = set()
+    for chunk in iter_chunks(require_partition(csv_file), chunk_rows, usecols=['type', 'plant_name']):
+        demand = chunk.loc[chunk['type'] == 'demand', 'plant_name'].dropna()
+        companies.update(str(name).strip() for name in demand.unique())
+    companies.discard('')
+    return companies
+
+
+def last_line_end(csv_file):
+    """파일에서 마지막 완결 행이 끝나는 바이트 위치 (미완성 마지막 행 제외)"""
+    size = os.path.getsize(csv_file)
+    block = 1 << 16
+    with open(csv_file, 'rb') as f:
+        position = size
+        while position > 0:
+            start = max(0, position - block)
+            f.seek(start)
+            data = f.read(position - start)
+            index = data.rfind(b'\n')
+            if index >= 0:
+                return start + index + 1
+            position = start
+    return 0
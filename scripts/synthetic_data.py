@@ -0,0 +1,160 @@
+"""벡터화된 샘플(합성) 데이터 생성
+
+시간 인덱스, 주야간(태양광) / 업무시간(수요) 프로파일을 NumPy 배열로 한 번에 만들고
+파일별로 한 번에 기록한다. 난수는 시드가 지정된 numpy Generator를 사용하므로
+같은 시드면 항상 같은 데이터가 생성된다.
+"""
+import numpy as np
+import pandas as pd
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M'
+CSV_HEADER = ['datetime', 'type', 'plant_name', 'value']
+DEFAULT_SEED = 42
+
+# 태양광 발전 시간대 (6시 ~ 18시)
+SOLAR_HOURS = (6, 18)
+# 수요 시간대별 범위 (업무/출퇴근/야간)
+DEMAND_RANGES = {
+    'business': (200, 500),
+    'commute': (150, 300),
+    'night': (50, 150),
+}
+
+
+def make_rng(seed=DEFAULT_SEED):
+    """시드가 지정된 난수 생성기"""
+    return np.random.default_rng(seed)
+
+
+def time_index(start, end, freq='h'):
+    """start ~ end (포함) 시간 인덱스"""
+    return pd.date_range(start, end, freq=freq)
+
+
+def solar_series(index, rng, low, high, scale=1_000_000):
+    """낮 시간대에만 low~high 균등분포 발전, 밤은 0 (기존 while 루프와 같은 분포)"""
+    hours = index.hour.to_numpy()
+    daytime = (hours >= SOLAR_HOURS[0]) & (hours <= SOLAR_HOURS[1])
+    values = rng.uniform(low, high, len(index)) * scale
+    return np.where(daytime, values, 0.0)
+
+
+def wind_series(index, rng, low, high, scale=1_000_000):
+    """24시간 low~high 균등분포 발전"""
+    return rng.uniform(low, high, len(index)) * scale
+
+
+def demand_matrix(index, rng, n_companies, ranges=DEMAND_RANGES, scale=1_000_000):
+    """시간 x 기업 수요 행렬 (업무시간/출퇴근/야간 범위별 균등분포)"""
+    hours = index.hour.to_numpy()[:, None]
+    business = (hours >= 9) & (hours <= 18)
+    commute = ((hours >= 6) & (hours < 9)) | ((hours > 18) & (hours <= 22))
+
+    low = np.where(business, ranges['business'][0],
+                   np.where(commute, ranges['commute'][0], ranges['night'][0]))
+    high = np.where(business, ranges['business'][1],
+                    np.where(commute, ranges['commute'][1], ranges['night'][1]))
+    unit = rng.random((len(index), n_companies))
+    return (low + (high - low) * unit) * scale
+
+
+def write_series_csv(path, index, energy_type, name, values):
+    """단일 발전소 시계열을 CSV로 일괄 기록"""
+    frame = pd.DataFrame({
+        'datetime': index.strftime(DATETIME_FORMAT),
+        'type': energy_type,
+        'plant_name': name,
+        'value': values,
+    }, columns=CSV_HEADER)
+    frame.to_csv(path, index=False)
+
+
+def write_long_csv(path, index, energy_type, names, matrix):
+    """시간 x 엔티티 행렬을 (datetime, type, plant_name, value) 긴 형식으로 일괄 기록
+
+    행 순서는 시간 순, 같은 시간 안에서는 names 순서 (기존 중첩 루프와 동일).
+    """
+    n_times, n_entities = matrix.shape
+    timestamps = index.strftime(DATETIME_FORMAT).to_numpy()
+    frame = pd.DataFrame({
+        'datetime': np.repeat(timestamps, n_entities),
+        'type': energy_type,
+        'plant_name': np.tile(np.asarray(names, dtype=object), n_times),
+        'value': matrix.reshape(-1),
+    }, columns=CSV_HEADER)
+    frame.to_csv(path, index=False)
+
+
+def entity_rngs(seed, n):
+    """엔티티별 독립 난수 생성기 (생성 순서와 관계없이 엔티티마다 같은 값)"""
+    return [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(n)]
+
+
+def step_hours(index):
+    """인덱스 간격(시간 단위, 1시간=1.0, 15분=0.25)"""
+    if len(index) < 2:
+        return 1.0
+    return (index[1] - index[0]) / pd.Timedelta(hours=1)
+
+
+def _day_of_year(index):
+    return index.dayofyear.to_numpy() + index.hour.to_numpy() / 24 + index.minute.to_numpy() / 1440
+
+
+def _hour_of_day(index):
+    return index.hour.to_numpy() + index.minute.to_numpy() / 60
+
+
+def solar_shape(index, rng, capacity_kw):
+    """태양광 발전량 (kWh/구간)
+
+    계절에 따라 일출/일몰과 최대 일사량이 변하는 종 모양 일변화에
+    일별 구름 계수(베타분포)를 곱한다.
+    """
+    doy = _day_of_year(index)
+    hour = _hour_of_day(index)
+    season = np.cos(2 * np.pi * (doy - 172) / 365.25)          # 하지 1, 동지 -1
+    day_length = 12 + 2.5 * season
+    sunrise = 12.5 - day_length / 2
+    phase = (hour - sunrise) / day_length
+    clear_sky = np.where((phase > 0) & (phase < 1), np.sin(np.pi * np.clip(phase, 0, 1)) ** 1.5, 0.0)
+    clear_sky *= 0.75 + 0.15 * season
+
+    days = index.normalize()
+    day_codes, unique_days = pd.factorize(days)
+    clouds = rng.beta(4, 1.6, len(unique_days))[day_codes]
+    jitter = rng.normal(1.0, 0.05, len(index)).clip(0.8, 1.2)
+    return capacity_kw * clear_sky * clouds * jitter * step_hours(index)
+
+
+def wind_shape(index, rng, capacity_kw, mean_speed=7.5):
+    """풍력 발전량 (kWh/구간)
+
+    이동평균으로 평활한 난수 풍속(겨울에 강함)을 표준 출력곡선
+    (cut-in 3m/s, 정격 12m/s, cut-out 25m/s)에 통과시킨다.
+    """
+    n = len(index)
+    steps_per_hour = max(1, int(round(1 / step_hours(index))))
+    window = 12 * steps_per_hour
+    walk = np.cumsum(rng.normal(0, 1, n + window))
+    smoothed = (walk[window:] - walk[:-window]) / np.sqrt(window)
+    season = np.cos(2 * np.pi * (_day_of_year(index) - 15) / 365.25)
+    speed = np.clip(mean_speed * (1 + 0.15 * season) + 2.5 * smoothed, 0, None)
+
+    cf = np.clip((speed - 3.0) / (12.0 - 3.0), 0, 1) ** 3
+    cf[speed > 25.0] = 0.0
+    return capacity_kw * cf * step_hours(index)
+
+
+def demand_shape(index, rng, base_kw):
+    """기업 수요 (kWh/구간)
+
+    업무시간 부하, 주말 감소, 여름/겨울 냉난방 부하와 잡음을 반영한다.
+    """
+    hour = _hour_of_day(index)
+    business = np.where((hour >= 9) & (hour < 18), 1.0,
+                        np.where(((hour >= 6) & (hour < 9)) | ((hour >= 18) & (hour < 22)), 0.75, 0.45))
+    weekend = np.where(index.dayofweek.to_numpy() >= 5, 0.6, 1.0)
+    hvac = 1 + 0.15 * np.abs(np.cos(2 * np.pi * (_day_of_year(index) - 15) / 365.25))
+    noise = rng.normal(1.0, 0.05, len(index)).clip(0.8, 1.2)
+    return base_kw * business * weekend * hvac * noise * step_hours(index)
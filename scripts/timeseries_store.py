@@ -0,0 +1,242 @@
+"""메모리 맵 시계열 저장소
+
+통합 CSV의 모든 발전소/기업 시계열을 [엔티티 x 시간 간격] float32(kWh) 행렬 하나로
+values.f32 파일에 저장하고, 엔티티 이름 -> 행 번호, 시각 -> 열 위치 정보를
+index.json에 둔다. 읽을 때는 np.memmap으로 열어 파싱 없이 바로 슬라이스하므로
+여러 프로세스가 OS 페이지 캐시 하나를 공유한다.
+
+원본 CSV의 mtime/크기(바뀌었으면 내용 해시)가 index.json과 같으면 다시 만들지 않는다.
+데이터가 없는 칸은 0으로 채운다. 저장소는 원본 파일마다 하나이므로 통합 CSV 연도
+파티션마다 따로 생기고, 기간 조회는 그 기간에 걸친 연도 저장소만 연다.
+
+사용 예:
+    python scripts/timeseries_store.py                 # 통합 CSV로 저장소 생성/확인
+    python scripts/timeseries_store.py --entity 육상태양광 --start 2024-03-01 --end 2024-03-02
+    python scripts/timeseries_store.py --entity 육상태양광 --start 2023-12-01 --end 2024-02-01   # 두 연도 파티션
+"""
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from aggregation_engine import project_root, integrated_csv, load_integrated
+from csv_cache import file_hash, path_lock, unique_tmp_path
+from partitions import partitions_for, require_partition
+
+store_root = project_root / ".cache" / "store"
+
+# 저장 구조가 바뀌면 올려서 기존 저장소를 무효화
+STORE_VERSION = 1
+VALUES_FILE = "values.f32"
+INDEX_FILE = "index.json"
+NS_PER_HOUR = 3_600_000_000_000
+
+
+def store_dir(csv_file):
+    """원본 경로별 저장소 폴더"""
+    csv_file = Path(csv_file).resolve()
+    key = hashlib.blake2b(str(csv_file).encode('utf-8'), digest_size=8).hexdigest()
+    return store_root / f"{csv_file.stem}-{key}"
+
+
+class TimeSeriesStore:
+    """읽기 전용 메모리 맵 [엔티티 x 시간 간격] 행렬과 사이드카 인덱스"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path / INDEX_FILE, 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.start = pd.Timestamp(self.meta['start'])
+        self.step = pd.Timedelta(self.meta['step_ns'], unit='ns')
+        self.types = [e['type'] for e in self.meta['entities']]
+        self.names = [e['name'] for e in self.meta['entities']]
+        self.values = np.memmap(self.path / VALUES_FILE, dtype='<f4', mode='r',
+                                shape=tuple(self.meta['shape']))
+        self._rows = {(t, n): i for i, (t, n) in enumerate(zip(self.types, self.names))}
+
+    @property
+    def n_steps(self):
+        return self.values.shape[1]
+
+    @property
+    def index(self):
+        return pd.date_range(self.start, periods=self.n_steps, freq=self.step)
+
+    def row(self, name, energy_type=None):
+        """엔티티 이름 -> 행 번호"""
+        if energy_type is not None:
+            return self._rows[(energy_type, name)]
+        matches = [i for (t, n), i in self._rows.items() if n == name]
+        if len(matches) != 1:
+            raise KeyError(f"엔티티를 찾을 수 없거나 중복됨: {name}")
+        return matches[0]
+
+    def rows(self, types):
+        """타입 목록에 속한 행 번호 배열"""
+        return np.flatnonzero(np.isin(self.types, types))
+
+    def column(self, when):
+        """시각 -> 열 위치 (범위 밖은 양 끝으로)"""
+        offset = (pd.Timestamp(when) - self.start) // self.step
+        return int(min(max(offset, 0), self.n_steps))
+
+    def series(self, name, start=None, end=None, energy_type=None):
+        """엔티티 하나의 [start, end) 구간 (복사 없는 memmap 뷰, kWh)"""
+        i = 0 if start is None else self.column(start)
+        j = self.n_steps if end is None else self.column(end)
+        return self.values[self.row(name, energy_type), i:j]
+
+    def hourly(self):
+        """시간 단위 (index, types, names, GWh float64 행렬). 세부 간격은 시간별 합계"""
+        if self.meta['step_ns'] > NS_PER_HOUR:
+            raise ValueError(f"시간보다 긴 간격은 시간 단위로 나눌 수 없습니다: {self.step}")
+        steps_per_hour = NS_PER_HOUR // self.meta['step_ns']
+        n_hours = -(-self.n_steps // steps_per_hour)
+        values = np.zeros((len(self.names), n_hours * steps_per_hour))
+        values[:, :self.n_steps] = self.values
+        values = values.reshape(len(self.names), n_hours, steps_per_hour).sum(axis=2) / 1_000_000
+        index = pd.date_range(self.start.floor('h'), periods=n_hours, freq='h')
+        return index, self.types, self.names, values
+
+
+def _source_signature(csv_file):
+    stat = csv_file.stat()
+    return {'source': str(csv_file), 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size}
+
+
+def _is_fresh(path, csv_file):
+    try:
+        with open(path / INDEX_FILE, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+    if meta.get('version') != STORE_VERSION or not (path / VALUES_FILE).exists():
+        return False
+    stat = csv_file.stat()
+    if meta['mtime_ns'] == stat.st_mtime_ns and meta['size'] == stat.st_size:
+        return True
+    if meta['size'] == stat.st_size and meta['hash'] == file_hash(csv_file):
+        meta['mtime_ns'] = stat.st_mtime_ns
+        _write_index(path, meta)
+        return True
+    return False
+
+
+def _write_index(path, meta):
+    tmp_path = unique_tmp_path(path / INDEX_FILE)
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path / INDEX_FILE)
+
+
+def build_store(csv_file=integrated_csv, path=None):
+    """통합 CSV를 파싱해 저장소 생성 후 열기"""
+    csv_file = require_partition(csv_file).resolve()
+    path = Path(path) if path else store_dir(csv_file)
+    df = load_integrated(csv_file)
+
+    stamps = np.asarray(df.index, dtype='datetime64[ns]').astype('int64')
+    unique_stamps = np.unique(stamps)
+    gaps = np.diff(unique_stamps)
+    step = int(gaps[gaps > 0].min()) if len(unique_stamps) > 1 else NS_PER_HOUR
+    start = int(unique_stamps[0])
+    column = (stamps - start) // step
+    n_steps = int(column.max()) + 1
+
+    # 행 번호는 (type, plant_name) 첫 등장 순서
+    entity = df.groupby(['type', 'plant_name'], observed=True, sort=False).ngroup().to_numpy()
+    valid = entity >= 0
+    n_entities = int(entity[valid].max()) + 1 if valid.any() else 0
+    _, first = np.unique(entity[valid], return_index=True)
+    first = np.flatnonzero(valid)[first]
+
+    path.mkdir(parents=True, exist_ok=True)
+    tmp_values = unique_tmp_path(path / VALUES_FILE)
+    values = np.memmap(tmp_values, dtype='<f4', mode='w+', shape=(n_entities, n_steps))
+    flat = np.bincount(entity[valid] * n_steps + column[valid],
+                       weights=df['value'].to_numpy(dtype='float64')[valid],
+                       minlength=n_entities * n_steps)
+    values[:] = flat.reshape(n_entities, n_steps)
+    values.flush()
+    del values
+    os.replace(tmp_values, path / VALUES_FILE)
+
+    meta = _source_signature(csv_file)
+    meta.update({
+        'version': STORE_VERSION,
+        'hash': file_hash(csv_file),
+        'dtype': 'float32',
+        'unit': 'kWh',
+        'shape': [n_entities, n_steps],
+        'start': str(pd.Timestamp(start)),
+        'step_ns': step,
+        'entities': [
+            {'row': row, 'type': str(t), 'name': str(n).strip()}
+            for row, (t, n) in enumerate(zip(df['type'].to_numpy()[first], df['plant_name'].to_numpy()[first]))
+        ],
+    })
+    _write_index(path, meta)
+    return TimeSeriesStore(path)
+
+
+def open_store(csv_file=integrated_csv, rebuild=False):
+    """최신 저장소를 열고, 없거나 원본이 바뀌었으면 새로 생성"""
+    csv_file = require_partition(csv_file).resolve()
+    path = store_dir(csv_file)
+    with path_lock(path):
+        if not rebuild and _is_fresh(path, csv_file):
+            return TimeSeriesStore(path)
+        return build_store(csv_file, path)
+
+
+def open_stores(start=None, end=None, years=None, rebuild=False):
+    """[start, end) 기간 또는 연도 목록에 걸친 연도 파티션 저장소만 열기 {연도: 저장소}"""
+    return {year: open_store(csv_file, rebuild=rebuild)
+            for year, csv_file in partitions_for(start, end, years).items()}
+
+
+def series_across(stores, name, start=None, end=None, energy_type=None):
+    """여러 연도 저장소에 걸친 엔티티 [start, end) 구간을 이어 붙인 배열 (kWh)"""
+    parts = []
+    for store in stores.values():
+        try:
+            parts.append(store.series(name, start, end, energy_type))
+        except KeyError:
+            # 해당 연도에 없는 엔티티
+            continue
+    return np.concatenate(parts) if parts else np.zeros(0, dtype='<f4')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="메모리 맵 시계열 저장소 생성/조회")
+    parser.add_argument('--csv', default=None, help="통합 CSV 파일 (기본: 조회 기간에 걸친 연도 파티션)")
+    parser.add_argument('--rebuild', action='store_true', help="원본이 같아도 다시 생성")
+    parser.add_argument('--entity', help="조회할 발전소/기업 이름")
+    parser.add_argument('--start', help="시작 시각 (포함)")
+    parser.add_argument('--end', help="끝 시각 (제외)")
+    args = parser.parse_args()
+
+    if args.csv:
+        stores = {None: open_store(Path(args.csv), rebuild=args.rebuild)}
+    else:
+        stores = open_stores(args.start, args.end, rebuild=args.rebuild)
+    if not stores:
+        print("[SKIP] 조회 기간에 해당하는 연도 파티션이 없습니다.")
+        return
+    for store in stores.values():
+        n_entities, n_steps = store.values.shape
+        print(f"[OK] 저장소: {store.path}")
+        print(f"  엔티티 {n_entities}개 x {n_steps:,}구간 ({store.step}), "
+              f"{(store.path / VALUES_FILE).stat().st_size / 1024 / 1024:.1f} MB")
+
+    if args.entity:
+        values = series_across(stores, args.entity, args.start, args.end)
+        print(f"  {args.entity}: {len(values):,}구간, 합계 {float(values.sum(dtype='float64')):,.1f} kWh")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,314 @@
+"""원본 CSV와 agg_data 집계의 일관성 검증
+
+통합 CSV(바이트 구간별)와 발전소별 CSV(파일별)를 프로세스 풀에서 한 번씩만 읽어
+(type, 엔티티 ID, 월) 합계를 만들고, agg_data JSON은 파일당 한 번 읽어 같은 키로 펼친 뒤
+아래 항목을 허용 오차 안에서 한 번에 비교한다. 원본 쪽 값에는 레지스트리
+설비용량 배율(plant_registry)을 적용한다.
+
+    monthly_total_vs_plants      monthly.<solar|wind>.total = 발전소 합계
+    monthly_demand_vs_companies  monthly.demand = 기업별 월별 합계
+    monthly_plants_vs_raw        monthly.<solar|wind>.<발전소> = 통합 CSV 합계
+    company_monthly_vs_raw       company_monthly.<기업> = 통합 CSV 합계
+    summary_vs_monthly           summary_stats 연간 합계 = 월별 합계 (소수 둘째 자리 반올림)
+    plant_capacity_vs_monthly    plant_capacity 발전량 = 발전소 연간 합계 (반올림)
+    plant_monthly_vs_plant_files plant_monthly_aggregated = 발전소 CSV 합계
+    plant_files_vs_integrated    발전소 CSV 연간 합계 = 통합 CSV 연간 합계 (경고)
+    hours_per_entity             엔티티별 행 수가 최대 행 수와 같음 (경고)
+
+결과는 JSON 보고서로 저장하고, 오류 수준 항목이 하나라도 틀리면 종료 코드 1을 반환한다.
+
+사용 예:
+    python scripts/validate_data.py
+    python scripts/validate_data.py --rtol 1e-4 --report validation.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from aggregation_engine import (
+    project_root, agg_data_dir, integrated_csv, ORIGINAL_OUTPUT_FILES, SUPPLY_TYPES, annual_totals,
+)
+from entity_registry import row_keys
+from parallel_plants import load_plant_list, process_plant_file
+from partitions import NoPartitionError, require_partition
+from plant_registry import capacity_factors
+from streaming_reader import aggregate_range, last_line_end
+
+report_file = project_root / ".cache" / "validation_report.json"
+
+DEFAULT_RTOL = 1e-6
+DEFAULT_ATOL = 1e-6
+# summary_stats / plant_capacity 값은 소수 둘째 자리로 반올림되어 저장됨
+ROUNDED_ATOL = 0.006
+# 보고서에 남길 항목별 최대 불일치 수
+MAX_FAILURES = 20
+
+
+def split_ranges(csv_file, parts):
+    """헤더 이후 본문을 행 경계에 맞춘 바이트 구간 parts개로 분할"""
+    end = last_line_end(csv_file)
+    with open(csv_file, 'rb') as f:
+        f.readline()
+        start = f.tell()
+        bounds = [start]
+        for k in range(1, parts):
+            f.seek(max(start + (end - start) * k // parts, bounds[-1]))
+            if f.tell() > start:
+                f.readline()
+            bounds.append(min(f.tell(), end))
+    bounds.append(end)
+    return [(a, b) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+
+
+def _raw_task(task):
+    """작업 프로세스: 통합 CSV 구간 또는 발전소 파일 하나의 월별 합계"""
+    kind, payload = task
+    if kind == 'range':
+        csv_file, start, end = payload
+        cells = aggregate_range(csv_file, start, end).result()
+        return kind, cells.groupby(['type', 'plant_name', 'month'], sort=False)[['sum', 'count']].sum()
+    return kind, process_plant_file(payload)
+
+
+def collect_raw(csv_file=integrated_csv, plant_entries=None, max_workers=None):
+    """원본 쪽 월별 합계 (통합 CSV 구간/발전소 파일별 병렬 1회 읽기)"""
+    max_workers = max_workers or os.cpu_count() or 1
+    plant_entries = load_plant_list() if plant_entries is None else plant_entries
+    tasks = [('range', (csv_file, a, b)) for a, b in split_ranges(csv_file, max_workers)]
+    tasks += [('plant', entry) for entry in plant_entries]
+
+    if max_workers <= 1 or len(tasks) <= 1:
+        results = [_raw_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_raw_task, tasks))
+
+    frames = [result for kind, result in results if kind == 'range']
+    integrated = pd.concat(frames).groupby(level=[0, 1, 2], sort=False).sum()
+    plants = [result for kind, result in results if kind == 'plant']
+    return integrated, plants
+
+
+def _read(name):
+    path = agg_data_dir / name
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare(check, expected, actual, rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL, level='error'):
+    """{키: 값} 두 묶음 비교 (한쪽에만 있는 키도 불일치)"""
+    keys = sorted(set(expected) | set(actual))
+    e = np.array([expected.get(k, np.nan) for k in keys], dtype='float64')
+    a = np.array([actual.get(k, np.nan) for k in keys], dtype='float64')
+    diff = np.abs(a - e)
+    bad = ~(diff <= atol + rtol * np.abs(e))
+    failures = [
+        {'key': '/'.join(map(str, keys[i])),
+         'expected': None if np.isnan(e[i]) else float(e[i]),
+         'actual': None if np.isnan(a[i]) else float(a[i])}
+        for i in np.flatnonzero(bad)[:MAX_FAILURES]
+    ]
+    finite = diff[~np.isnan(diff)]
+    return {
+        'check': check,
+        'level': level,
+        'status': ('fail' if level == 'error' else 'warn') if bad.any() else 'ok',
+        'compared': len(keys),
+        'failed': int(bad.sum()),
+        'max_abs_diff': float(finite.max()) if len(finite) else 0.0,
+        'rtol': rtol,
+        'atol': atol,
+        'failures': failures,
+    }
+
+
+def _skipped(check, reason):
+    return {'check': check, 'level': 'error', 'status': 'skipped', 'reason': reason,
+            'compared': 0, 'failed': 0, 'failures': []}
+
+
+def _leaves(data, prefix=()):
+    """중첩 dict를 {(경로..., 키): 값} 으로 펼침"""
+    flat = {}
+    for key, value in data.items():
+        if isinstance(value, dict):
+            flat.update(_leaves(value, prefix + (key,)))
+        else:
+            flat[prefix + (key,)] = value
+    return flat
+
+
+def run_checks(integrated, plants, factors=None, rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL):
+    """원본 월별 합계와 agg_data 파일을 비교한 항목 목록"""
+    factors = capacity_factors() if factors is None else factors
+    monthly = _read(ORIGINAL_OUTPUT_FILES['monthly_aggregated'])
+    company = _read(ORIGINAL_OUTPUT_FILES['company_monthly_aggregated'])
+    summary = _read(ORIGINAL_OUTPUT_FILES['summary_stats'])
+    plant_monthly = _read("plant_monthly_aggregated.json")
+    plant_capacity = _read("plant_capacity.json")
+
+    # 원본 쪽 (type, 엔티티 ID, 월) 합계, 발전소는 설비용량 배율 적용
+    types = integrated.index.get_level_values('type').tolist()
+    names = integrated.index.get_level_values('plant_name').tolist()
+    scale = np.array([factors.get(name, 1.0) for name in names])
+    # 검증은 레지스트리를 고치지 않고, 등록되지 않은 엔티티는 실패 항목으로 보고
+    ids = row_keys(types, names, quiet=True)
+    registered = {(t, name): float(key is not None) for t, name, key in zip(types, names, ids)}
+    keys = zip(types, ids, integrated.index.get_level_values('month'))
+    raw = {key: value for key, value in zip(keys, integrated['sum'].to_numpy() * scale) if key[1] is not None}
+    raw_counts = integrated['count'].groupby(level=[0, 1], sort=False).sum()
+    raw_annual = {}
+    for (t, name, _), value in raw.items():
+        raw_annual[(t, name)] = raw_annual.get((t, name), 0.0) + value
+
+    checks = [compare('entities_registered', {k: 1.0 for k in registered}, registered, 0.0, 0.0)]
+    if monthly is None:
+        for check in ['monthly_total_vs_plants', 'monthly_demand_vs_companies', 'monthly_plants_vs_raw',
+                      'summary_vs_monthly', 'plant_capacity_vs_monthly']:
+            checks.append(_skipped(check, f"{ORIGINAL_OUTPUT_FILES['monthly_aggregated']} 없음"))
+    else:
+        plant_sums, totals, plant_values = {}, {}, {}
+        for t in SUPPLY_TYPES:
+            for name, values in monthly.get(t, {}).items():
+                for month, value in values.items():
+                    if name == 'total':
+                        totals[(t, month)] = value
+                    else:
+                        plant_sums[(t, month)] = plant_sums.get((t, month), 0.0) + value
+                        plant_values[(t, name, month)] = value
+        checks.append(compare('monthly_total_vs_plants', plant_sums, totals, rtol, atol))
+        checks.append(compare('monthly_plants_vs_raw',
+                              {k: v for k, v in raw.items() if k[0] in SUPPLY_TYPES}, plant_values, rtol, atol))
+
+        if company is None:
+            checks.append(_skipped('monthly_demand_vs_companies',
+                                   f"{ORIGINAL_OUTPUT_FILES['company_monthly_aggregated']} 없음"))
+        else:
+            company_sums = {}
+            for values in company.values():
+                for month, value in values.items():
+                    company_sums[(month,)] = company_sums.get((month,), 0.0) + value
+            demand = {(month,): value for month, value in monthly.get('demand', {}).items()}
+            checks.append(compare('monthly_demand_vs_companies', company_sums, demand, rtol, atol))
+
+        if summary is None:
+            checks.append(_skipped('summary_vs_monthly', f"{ORIGINAL_OUTPUT_FILES['summary_stats']} 없음"))
+        else:
+            solar, wind, demand_total = annual_totals(monthly)
+            expected = {('solar',): solar, ('wind',): wind, ('supply',): solar + wind, ('demand',): demand_total,
+                        ('re100_rate',): (solar + wind) / demand_total * 100 if demand_total > 0 else 0}
+            actual = {(k,): v for k, v in summary.get('annual_totals', {}).items()}
+            checks.append(compare('summary_vs_monthly', expected, actual, 0.0, ROUNDED_ATOL))
+
+        if plant_capacity is None:
+            checks.append(_skipped('plant_capacity_vs_monthly', "plant_capacity.json 없음"))
+        else:
+            expected = {(t, name, 'generation_gwh'): sum(values.values())
+                        for t in SUPPLY_TYPES for name, values in monthly.get(t, {}).items() if name != 'total'}
+            actual = {k: v for k, v in _leaves(plant_capacity).items() if k[-1] == 'generation_gwh'}
+            checks.append(compare('plant_capacity_vs_monthly', expected, actual, 0.0, ROUNDED_ATOL))
+
+    if company is None:
+        checks.append(_skipped('company_monthly_vs_raw', f"{ORIGINAL_OUTPUT_FILES['company_monthly_aggregated']} 없음"))
+    else:
+        checks.append(compare('company_monthly_vs_raw',
+                              {k: v for k, v in raw.items() if k[0] == 'demand'},
+                              {('demand',) + k: v for k, v in _leaves(company).items()}, rtol, atol))
+
+    # 발전소별 CSV
+    file_monthly, file_annual = {}, {}
+    for result in plants:
+        if not result.get('exists'):
+            continue
+        factor = factors.get(result['plant_name'], 1.0)
+        key = str(result['id'])
+        for month, value in result['monthly'].items():
+            file_monthly[(result['type'], key, month)] = value * factor
+        file_annual[(result['type'], key)] = result['total_gwh'] * factor
+    if plant_monthly is None:
+        checks.append(_skipped('plant_monthly_vs_plant_files', "plant_monthly_aggregated.json 없음"))
+    else:
+        checks.append(compare('plant_monthly_vs_plant_files', file_monthly, _leaves(plant_monthly), rtol, atol))
+    checks.append(compare('plant_files_vs_integrated', file_annual,
+                          {k: v for k, v in raw_annual.items() if k in file_annual}, rtol, atol, level='warning'))
+
+    max_count = raw_counts.max() if len(raw_counts) else 0
+    checks.append(compare('hours_per_entity', {k: float(max_count) for k in raw_counts.index},
+                          raw_counts.astype('float64').to_dict(), 0.0, 0.0, level='warning'))
+    return checks
+
+
+def validate(csv_file=integrated_csv, rtol=DEFAULT_RTOL, atol=DEFAULT_ATOL, max_workers=None):
+    """원본/집계 검증 보고서 생성"""
+    started = time.perf_counter()
+    csv_file = require_partition(csv_file)
+    integrated, plants = collect_raw(csv_file, max_workers=max_workers)
+    checks = run_checks(integrated, plants, rtol=rtol, atol=atol)
+    return {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'source': str(csv_file),
+        'elapsed_s': time.perf_counter() - started,
+        'summary': {
+            'checks': len(checks),
+            'failed': sum(c['status'] == 'fail' for c in checks),
+            'warnings': sum(c['status'] == 'warn' for c in checks),
+            'skipped': sum(c['status'] == 'skipped' for c in checks),
+        },
+        'checks': checks,
+    }
+
+
+def write_report(report, path=report_file):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def print_report(report):
+    labels = {'ok': '[OK]', 'fail': '[FAIL]', 'warn': '[WARNING]', 'skipped': '[SKIP]'}
+    for check in report['checks']:
+        line = f"{labels[check['status']]} {check['check']}: {check['compared']}개 비교"
+        if check['status'] == 'skipped':
+            line += f" ({check['reason']})"
+        elif check['failed']:
+            line += f", 불일치 {check['failed']}개 (최대 차이 {check['max_abs_diff']:.6g})"
+        print(line)
+    summary = report['summary']
+    print(f"검증 {summary['checks']}개: 실패 {summary['failed']}, 경고 {summary['warnings']}, "
+          f"건너뜀 {summary['skipped']} ({report['elapsed_s']:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="원본 CSV와 agg_data 집계 일관성 검증")
+    parser.add_argument('--csv', default=integrated_csv, help="통합 CSV 파일")
+    parser.add_argument('--rtol', type=float, default=DEFAULT_RTOL, help="상대 허용 오차")
+    parser.add_argument('--atol', type=float, default=DEFAULT_ATOL, help="절대 허용 오차 (GWh)")
+    parser.add_argument('--workers', type=int, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument('--report', default=str(report_file), help="JSON 보고서 경로")
+    args = parser.parse_args()
+
+    try:
+        report = validate(args.csv, args.rtol, args.atol, args.workers)
+    except NoPartitionError as e:
+        print(f"[FAIL] {e}")
+        sys.exit(1)
+    print_report(report)
+    print(f"보고서: {write_report(report, args.report)}")
+    if report['summary']['failed']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
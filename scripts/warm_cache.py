@@ -0,0 +1,73 @@
+"""장기 실행 프로세스용 파일 서명 기반 메모리 캐시
+
+re100_daemon.py처럼 한 프로세스가 여러 번 빌드/조회를 처리할 때, 파싱한 CSV와
+시간 단위 행렬 같은 중간 결과를 원본 파일 서명(경로, mtime, 크기)과 함께 메모리에 둔다.
+서명이 같으면 다시 읽지 않고, 파일이 바뀐 항목만 다시 만든다.
+
+enable() 하지 않은 일반 스크립트에서는 cached()가 매번 load()를 그대로 호출하므로
+한 번 실행하고 끝나는 스크립트의 메모리 사용량은 달라지지 않는다.
+"""
+import os
+import threading
+import time
+
+_enabled = False
+_lock = threading.Lock()
+_entries = {}
+
+
+def enable(flag=True):
+    global _enabled
+    _enabled = flag
+    if not flag:
+        clear()
+
+
+def enabled():
+    return _enabled
+
+
+def file_signature(*paths):
+    """파일 목록의 (경로, mtime_ns, 크기) 튜플 (없는 파일은 None)"""
+    signature = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            signature.append((str(path), stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            signature.append((str(path), None))
+    return tuple(signature)
+
+
+def cached(kind, key, signature, load):
+    """(종류, 키) 항목을 서명이 같으면 재사용하고 다르면 load()로 다시 만들기"""
+    if not _enabled:
+        return load()
+    with _lock:
+        entry = _entries.get((kind, key))
+        if entry is not None and entry['signature'] == signature:
+            entry['hits'] += 1
+            return entry['value']
+    started = time.perf_counter()
+    value = load()
+    with _lock:
+        _entries[(kind, key)] = {
+            'signature': signature, 'value': value, 'hits': 0,
+            'load_seconds': time.perf_counter() - started,
+        }
+    return value
+
+
+def clear(kind=None):
+    with _lock:
+        for entry_key in [k for k in _entries if kind is None or k[0] == kind]:
+            del _entries[entry_key]
+
+
+def stats():
+    """캐시 항목 목록 (종류, 키, 재사용 횟수, 적재 시간)"""
+    with _lock:
+        return [
+            {'kind': kind, 'key': str(key), 'hits': entry['hits'], 'load_seconds': entry['load_seconds']}
+            for (kind, key), entry in _entries.items()
+        ]
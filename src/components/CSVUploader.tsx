@@ -4,6 +4,8 @@ import CloudUploadIcon from '@mui/icons-material/CloudUpload';
 import PlayCircleOutlineIcon from '@mui/icons-material/PlayCircleOutline';
 import Papa from 'papaparse';
 import { CSVRow } from '../types';
+import { dataNameLookup, fetchEntityRegistry, withEntityNames } from '../utils/entityRegistry';
+import { latestYear, monthKeysOf, partitionFileName, yearMonthKeys } from '../utils/dataCalendar';
 
 interface CSVUploaderProps {
   onDataLoaded: (data: CSVRow[], aggregated?: any, append?: boolean) => void;
@@ -80,6 +82,15 @@ const CSVUploader: React.FC<CSVUploaderProps> = ({ onDataLoaded }) => {
     setError('');
     
     try {
+      // 0. 엔티티 레지스트리 (집계 키 ID, 원본 행 이름 -> 표시 이름)
+      const registry = await fetchEntityRegistry();
+      const displayName = dataNameLookup(registry);
+
+      // 0-1. 데이터 연도/월 (월별 집계의 월 키에서 도출, 가장 최근 연도 파티션 사용)
+      const calendarResponse = await fetch('/agg_data/monthly_aggregated_original.json');
+      const monthKeys = calendarResponse.ok ? monthKeysOf(await calendarResponse.json()) : [];
+      const dataYear = latestYear(monthKeys) ?? new Date().getFullYear();
+
       // 1. plant_list.csv 읽기
       const plantListResponse = await fetch('/sample_data/plant_list.csv');
       if (!plantListResponse.ok) {
@@ -99,6 +110,11 @@ const CSVUploader: React.FC<CSVUploaderProps> = ({ onDataLoaded }) => {
         if (!plant.filename) continue;
         
         console.log(`Loading ${plant.filename}...`);
+
+        // 레지스트리 설비용량이 원본 데이터와 다르면 용량 비율만큼 조정
+        const capacity = parseFloat(plant.capacity_gw);
+        const dataCapacity = parseFloat(plant.data_capacity_gw);
+        const capacityScale = capacity > 0 && dataCapacity > 0 ? capacity / dataCapacity : 1;
         
         try {
           const supplyResponse = await fetch(`/sample_data/${plant.filename}`);
@@ -114,8 +130,8 @@ const CSVUploader: React.FC<CSVUploaderProps> = ({ onDataLoaded }) => {
               .map(row => ({
                 datetime: row.datetime,
                 type: row.type as 'solar' | 'wind',
-                plant_name: row.plant_name,
-                value: parseFloat(row.value) / 1000000 // kWh to GWh conversion (원본 값 사용)
+                plant_name: displayName[row.plant_name] ?? row.plant_name,
+                value: parseFloat(row.value) * capacityScale / 1000000 // kWh to GWh conversion
               }));
             
             allSupplyData = [...allSupplyData, ...validSupplyData];
@@ -130,7 +146,7 @@ const CSVUploader: React.FC<CSVUploaderProps> = ({ onDataLoaded }) => {
       
       // 3. 수요 데이터 읽기
       console.log('Loading demand data...');
-      const demandResponse = await fetch('/sample_data/sample_data_integrated_2024_integrated.csv');
+      const demandResponse = await fetch(`/sample_data/${partitionFileName(dataYear)}`);
       if (!demandResponse.ok) {
         throw new Error('수요 데이터를 불러올 수 없습니다.');
       }
@@ -149,7 +165,7 @@ const CSVUploader: React.FC<CSVUploaderProps> = ({ onDataLoaded }) => {
         .map(row => ({
           datetime: row.datetime,
           type: 'demand' as const,
-          plant_name: row.plant_name,
+          plant_name: displayName[row.plant_name] ?? row.plant_name,
           value: parseFloat(row.value) / 1000000 // kWh to GWh conversion (원본 값 사용)
         }));
       
@@ -172,12 +188,13 @@ const CSVUploader: React.FC<CSVUploaderProps> = ({ onDataLoaded }) => {
         
         if (monthlyResponse.ok) {
           const monthlyAggregated = await monthlyResponse.json();
+          monthlyAggregated.solar = withEntityNames(monthlyAggregated.solar, registry);
+          monthlyAggregated.wind = withEntityNames(monthlyAggregated.wind, registry);
           
           // 월별 차트용 데이터 생성
           const monthlyData = [];
-          for (let month = 1; month <= 12; month++) {
-            const monthKey = `2024-${month.toString().padStart(2, '0')}`;
-            const monthLabel = `${month}월`;
+          for (const monthKey of yearMonthKeys(monthKeys, dataYear)) {
+            const monthLabel = `${parseInt(monthKey.split('-')[1])}월`;
             
             const totalSolar = monthlyAggregated.solar?.total?.[monthKey] || 0; // 이미 10% 적용됨
             const totalWind = monthlyAggregated.wind?.total?.[monthKey] || 0; // 이미 10% 적용됨
@@ -206,7 +223,7 @@ const CSVUploader: React.FC<CSVUploaderProps> = ({ onDataLoaded }) => {
           try {
             const companyMonthlyResponse = await fetch('/agg_data/company_monthly_aggregated_original.json');
             if (companyMonthlyResponse.ok) {
-              const companyMonthly = await companyMonthlyResponse.json();
+              const companyMonthly = withEntityNames(await companyMonthlyResponse.json(), registry) || {};
               // 플랫 형식으로 변환 (원본 값 사용)
               for (const [company, monthData] of Object.entries(companyMonthly)) {
                 if (company === 'total') continue; // total 제외
@@ -264,6 +281,7 @@ const CSVUploader: React.FC<CSVUploaderProps> = ({ onDataLoaded }) => {
             .map(([name, value]) => ({ name, value }));
           
           aggregatedData = {
+            year: dataYear,
             monthlyData: monthlyData,
             hourlyData: [], // 빈 배열로 설정 (실제 데이터는 allData에서 처리)
             essCapacity: essCapacity,
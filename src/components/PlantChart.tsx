@@ -2,6 +2,8 @@ import React, { useState, useEffect } from 'react';
 import { LineChart, Line, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts';
 import { Paper, Typography, ToggleButton, ToggleButtonGroup, Box, Collapse, IconButton, Table, TableBody, TableCell, TableContainer, TableHead, TableRow } from '@mui/material';
 import { CSVRow } from '../types';
+import { fetchEntityRegistry, withEntityNames } from '../utils/entityRegistry';
+import { denseToNested, fetchDenseArtifact } from '../utils/denseArtifact';
 import { format, parseISO } from 'date-fns';
 import ExpandMoreIcon from '@mui/icons-material/ExpandMore';
 import ExpandLessIcon from '@mui/icons-material/ExpandLess';
@@ -20,12 +22,17 @@ const PlantChart: React.FC<PlantChartProps> = ({ rawData, aggregatedData }) => {
   useEffect(() => {
     // monthly_aggregated_original.json에서 개별 발전소 데이터 로드
     console.log('PlantChart - Starting to fetch monthly data...');
-    fetch('/agg_data/monthly_aggregated_original.json')
-      .then(res => {
+    Promise.all([
+      fetch('/agg_data/monthly_aggregated_original.json').then(res => {
         console.log('PlantChart - Fetch response status:', res.status);
         return res.json();
-      })
-      .then(monthlyAggregated => {
+      }),
+      fetchEntityRegistry(),
+    ])
+      .then(([monthlyAggregated, registry]) => {
+        // 발전소 키는 엔티티 ID이므로 표시 이름으로 변경
+        monthlyAggregated.solar = withEntityNames(monthlyAggregated.solar, registry);
+        monthlyAggregated.wind = withEntityNames(monthlyAggregated.wind, registry);
         console.log('PlantChart - Monthly aggregated data received:', monthlyAggregated);
         // 월별 데이터 재구성 (평균값 계산)
         const monthlyData: { [key: string]: { [key: string]: { total: number; days: number } } } = {};
@@ -119,14 +126,20 @@ const PlantChart: React.FC<PlantChartProps> = ({ rawData, aggregatedData }) => {
   }, []); // 컴포넌트 마운트 시 한 번만 실행
 
   useEffect(() => {
-    // plant_hourly_aggregated_original.json에서 시간대별 개별 발전소 데이터 로드
+    // plant_hourly_aggregated_original의 dense 바이너리(없으면 JSON)에서 시간대별 개별 발전소 데이터 로드
     console.log('PlantChart - Starting to fetch hourly data...');
-    fetch('/agg_data/plant_hourly_aggregated_original.json') // 원본 값 사용
-      .then(res => {
-        console.log('PlantChart - Hourly fetch response status:', res.status);
-        return res.json();
-      })
-      .then(plantHourly => {
+    Promise.all([
+      fetchDenseArtifact('plant_hourly_aggregated_original') // 원본 값 사용
+        .then(denseToNested)
+        .catch(err => {
+          console.warn('PlantChart - dense 파일 로드 실패, JSON 사용:', err);
+          return fetch('/agg_data/plant_hourly_aggregated_original.json').then(res => res.json());
+        }),
+      fetchEntityRegistry(),
+    ])
+      .then(([plantHourly, registry]) => {
+        plantHourly.solar = withEntityNames(plantHourly.solar, registry);
+        plantHourly.wind = withEntityNames(plantHourly.wind, registry);
         console.log('PlantChart - Hourly data received:', plantHourly);
         const chartData = [];
         
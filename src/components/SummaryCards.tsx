@@ -1,6 +1,7 @@
 import React, { useState, useEffect } from 'react';
 import { Card, CardContent, Typography, Box, LinearProgress, Tooltip } from '@mui/material';
 import { ProcessedData } from '../types';
+import { fetchEntityRegistry, withEntityNames } from '../utils/entityRegistry';
 import BatteryChargingFullIcon from '@mui/icons-material/BatteryChargingFull';
 import SolarPowerIcon from '@mui/icons-material/SolarPower';
 import AirIcon from '@mui/icons-material/Air';
@@ -23,6 +24,10 @@ const SummaryCards: React.FC<SummaryCardsProps> = ({ processedData, essCapacity,
         const response = await fetch('/agg_data/plant_capacity.json');
         if (response.ok) {
           const data = await response.json();
+          // 발전소 키는 엔티티 ID이므로 표시 이름으로 변경
+          const registry = await fetchEntityRegistry();
+          data.solar = withEntityNames(data.solar, registry);
+          data.wind = withEntityNames(data.wind, registry);
           setPlantCapacity(data);
         }
       } catch (error) {
@@ -91,7 +96,7 @@ const SummaryCards: React.FC<SummaryCardsProps> = ({ processedData, essCapacity,
   return (
     <Box sx={{ mb: 3 }}>
       <Typography variant="h5" gutterBottom sx={{ fontWeight: 'bold', mb: 2 }}>
-        2024년 RE100 달성 현황 요약
+        {aggregatedData?.year ? `${aggregatedData.year}년 ` : ''}RE100 달성 현황 요약
       </Typography>
       <Box sx={{ display: 'flex', flexWrap: 'wrap', gap: 2 }}>
         <Box sx={{ flex: '1 1 calc(25% - 16px)', minWidth: 200 }}>
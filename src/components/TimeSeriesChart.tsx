@@ -11,6 +11,12 @@ interface TimeSeriesChartProps {
   aggregatedData?: any;
 }
 
+// weekly_data.json 주차 항목 라벨 (롤업 큐브 합계가 있으면 주간 RE100 표시)
+const weekOptionLabel = (week: any): string => {
+  const label = `${week.week}주차 (${week.start} ~ ${week.end})`;
+  return typeof week.re100_rate === 'number' ? `${label} · RE100 ${week.re100_rate.toFixed(1)}%` : label;
+};
+
 const TimeSeriesChart: React.FC<TimeSeriesChartProps> = ({ data, aggregatedData }) => {
   const [showTable, setShowTable] = useState(false);
   const [fullYearData, setFullYearData] = useState<any[]>([]);
@@ -33,7 +39,7 @@ const TimeSeriesChart: React.FC<TimeSeriesChartProps> = ({ data, aggregatedData
           setSelectedWeek('1');
           const weekOptions = month01Data.map((week: any) => ({
             value: week.week.toString(),
-            label: `${week.week}주차 (${week.start} ~ ${week.end})`
+            label: weekOptionLabel(week)
           }));
           setWeekOptions(weekOptions);
         }
@@ -78,7 +84,7 @@ const TimeSeriesChart: React.FC<TimeSeriesChartProps> = ({ data, aggregatedData
       if (Array.isArray(monthData)) {
         const weekOptions = monthData.map((week: any) => ({
           value: week.week.toString(),
-          label: `${week.week}주차 (${week.start} ~ ${week.end})`
+          label: weekOptionLabel(week)
         }));
         setWeekOptions(weekOptions);
         
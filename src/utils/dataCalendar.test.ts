@@ -0,0 +1,32 @@
+import * as fs from 'fs';
+import * as path from 'path';
+import { latestYear, monthKeysOf, partitionFileName, yearMonthKeys } from './dataCalendar';
+
+const aggDataDir = path.join(__dirname, '..', '..', 'public', 'agg_data');
+
+describe('dataCalendar', () => {
+  it('derives the year and months from monthly_aggregated_original.json', () => {
+    const monthly = JSON.parse(
+      fs.readFileSync(path.join(aggDataDir, 'monthly_aggregated_original.json'), 'utf-8')
+    );
+    const monthKeys = monthKeysOf(monthly);
+    const year = latestYear(monthKeys) as number;
+
+    expect(monthKeys.length).toBeGreaterThan(0);
+    expect(yearMonthKeys(monthKeys, year)).toEqual(monthKeys.filter(key => key.startsWith(`${year}-`)));
+    expect(Object.keys(monthly.solar.total).every(key => monthKeys.includes(key))).toBe(true);
+  });
+
+  it('orders month keys across years and picks the latest partition', () => {
+    const monthKeys = monthKeysOf({
+      solar: { '1': { '2024-01': 1, '2023-12': 2 }, total: { '2024-01': 1, '2023-12': 2 } },
+      demand: { '2024-02': 3 },
+    });
+
+    expect(monthKeys).toEqual(['2023-12', '2024-01', '2024-02']);
+    expect(latestYear(monthKeys)).toBe(2024);
+    expect(yearMonthKeys(monthKeys, 2024)).toEqual(['2024-01', '2024-02']);
+    expect(latestYear([])).toBeUndefined();
+    expect(partitionFileName(2024)).toBe('sample_data_integrated_2024_integrated.csv');
+  });
+});
@@ -0,0 +1,32 @@
+// 데이터 달력: 연도/월은 코드에 고정하지 않고 집계 산출물의 월 키("YYYY-MM")에서 구한다
+// 통합 수요 CSV는 연도별 파티션 파일이다 (scripts/partitions.py와 같은 이름 규칙)
+
+const MONTH_KEY = /^\d{4}-\d{2}$/;
+
+export const partitionFileName = (year: number): string =>
+  `sample_data_integrated_${year}_integrated.csv`;
+
+// 중첩 월별 집계({solar: {total: {...}}, demand: {...}} 등)에 나오는 월 키 정렬 목록
+export const monthKeysOf = (monthly: any): string[] => {
+  const keys = new Set<string>();
+  const visit = (node: any) => {
+    if (!node || typeof node !== 'object') {
+      return;
+    }
+    Object.entries(node).forEach(([key, value]) => {
+      if (MONTH_KEY.test(key)) {
+        keys.add(key);
+      } else {
+        visit(value);
+      }
+    });
+  };
+  visit(monthly);
+  return Array.from(keys).sort();
+};
+
+export const latestYear = (monthKeys: string[]): number | undefined =>
+  monthKeys.length > 0 ? parseInt(monthKeys[monthKeys.length - 1].slice(0, 4)) : undefined;
+
+export const yearMonthKeys = (monthKeys: string[], year: number): string[] =>
+  monthKeys.filter(key => key.startsWith(`${year}-`));
@@ -196,11 +196,18 @@ export const updateAggregatedData = (existingAggregated: any, rawData: CSVRow[])
     return key;
   };
   
+  // 월별 데이터 연도 (하드코딩하지 않고 기존 집계 또는 원본 행의 datetime에서 도출)
+  const monthYear: { [key: string]: number } = {};
+
   // 기존 월별 데이터 먼저 복사
   if (existingAggregated.monthlyData) {
     existingAggregated.monthlyData.forEach((month: any) => {
       const originalKey = month.monthLabel || month.month;
       const monthKey = normalizeMonthKey(originalKey);
+      const year = /^\d{4}-/.test(month.month) ? parseInt(month.month) : existingAggregated.year;
+      if (year) {
+        monthYear[monthKey] = year;
+      }
       monthlyMap[monthKey] = {
         solar: month.totalSolar || 0,
         wind: month.totalWind || 0,
@@ -213,6 +220,7 @@ export const updateAggregatedData = (existingAggregated: any, rawData: CSVRow[])
   rawData.forEach(row => {
     const date = new Date(row.datetime);
     const monthKey = `${date.getMonth() + 1}월`;
+    monthYear[monthKey] = monthYear[monthKey] ?? date.getFullYear();
     
     if (!monthlyMap[monthKey]) {
       monthlyMap[monthKey] = { solar: 0, wind: 0, demand: 0 };
@@ -231,7 +239,7 @@ export const updateAggregatedData = (existingAggregated: any, rawData: CSVRow[])
   updated.monthlyData = Object.entries(monthlyMap).map(([month, data]) => {
     const totalSupply = data.solar + data.wind;
     return {
-      month: `2024-${month.replace('월', '').padStart(2, '0')}`,
+      month: `${monthYear[month]}-${month.replace('월', '').padStart(2, '0')}`,
       monthLabel: month,
       totalSolar: Math.round(data.solar * 100) / 100,
       totalWind: Math.round(data.wind * 100) / 100,
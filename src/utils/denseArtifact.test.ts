@@ -0,0 +1,47 @@
+import * as fs from 'fs';
+import * as path from 'path';
+import { decodeDenseArtifact, denseToNested, DenseNested } from './denseArtifact';
+
+const aggDataDir = path.join(__dirname, '..', '..', 'public', 'agg_data');
+
+const readArrayBuffer = (fileName: string): ArrayBuffer => {
+  const buffer = fs.readFileSync(path.join(aggDataDir, fileName));
+  return buffer.buffer.slice(buffer.byteOffset, buffer.byteOffset + buffer.byteLength);
+};
+
+const expectClose = (actual: DenseNested | number, expected: any) => {
+  if (typeof expected === 'number') {
+    expect(typeof actual).toBe('number');
+    expect(Math.abs((actual as number) - expected)).toBeLessThanOrEqual(1e-6 * Math.max(1, Math.abs(expected)));
+    return;
+  }
+  expect(Object.keys(actual as DenseNested)).toEqual(Object.keys(expected));
+  Object.keys(expected).forEach(key => expectClose((actual as DenseNested)[key], expected[key]));
+};
+
+describe('denseArtifact', () => {
+  it.each([
+    'monthly_aggregated_original',
+    'company_monthly_aggregated_original',
+    'plant_hourly_aggregated_original',
+    'company_hourly_aggregated',
+  ])('decodes %s to the same values as the JSON file', name => {
+    const expected = JSON.parse(fs.readFileSync(path.join(aggDataDir, `${name}.json`), 'utf-8'));
+    const artifact = decodeDenseArtifact(readArrayBuffer(`${name}.dense.bin`));
+
+    expect(artifact.values).toHaveLength(artifact.rows.length * artifact.axis.length);
+    expectClose(denseToNested(artifact), expected);
+  });
+
+  it('keeps row paths and axis keys from the JSON structure', () => {
+    const artifact = decodeDenseArtifact(readArrayBuffer('monthly_aggregated_original.dense.bin'));
+
+    expect(artifact.axis[0]).toBe('2024-01');
+    expect(artifact.rows).toContainEqual(['solar', 'total']);
+    expect(artifact.rows).toContainEqual(['demand']);
+  });
+
+  it('rejects buffers without the dense header', () => {
+    expect(() => decodeDenseArtifact(new ArrayBuffer(16))).toThrow();
+  });
+});
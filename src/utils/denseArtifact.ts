@@ -0,0 +1,90 @@
+// agg_data dense 바이너리 (scripts/dense_format.py) 디코더
+// 구조: "R1DA" | 헤더 길이(uint32 LE) | JSON 헤더 | 패딩 | float32 행렬 (rows x axis)
+
+export interface DenseArtifact {
+  axis: string[];
+  rows: string[][];
+  values: Float32Array;
+}
+
+export type DenseNested = { [key: string]: DenseNested | number };
+
+const MAGIC = 'R1DA';
+
+const decodeUtf8 = (bytes: Uint8Array): string => {
+  if (typeof TextDecoder !== 'undefined') {
+    return new TextDecoder('utf-8').decode(bytes);
+  }
+  let binary = '';
+  for (let i = 0; i < bytes.length; i++) {
+    binary += String.fromCharCode(bytes[i]);
+  }
+  return decodeURIComponent(escape(binary));
+};
+
+export const decodeDenseArtifact = (buffer: ArrayBuffer): DenseArtifact => {
+  const view = new DataView(buffer);
+  const magic = String.fromCharCode(view.getUint8(0), view.getUint8(1), view.getUint8(2), view.getUint8(3));
+  if (magic !== MAGIC) {
+    throw new Error('dense 형식이 아닙니다');
+  }
+  const headerLength = view.getUint32(4, true);
+  const header = JSON.parse(decodeUtf8(new Uint8Array(buffer, 8, headerLength)));
+  const [rowCount, columnCount] = header.shape;
+  return {
+    axis: header.axis,
+    rows: header.rows,
+    values: new Float32Array(buffer, 8 + headerLength, rowCount * columnCount),
+  };
+};
+
+// 원래 JSON과 같은 중첩 객체로 복원 (값이 없는 셀(NaN)은 생략)
+export const denseToNested = (artifact: DenseArtifact): DenseNested => {
+  const { axis, rows, values } = artifact;
+  const result: DenseNested = {};
+
+  for (let r = 0; r < rows.length; r++) {
+    const leaf: DenseNested = {};
+    for (let c = 0; c < axis.length; c++) {
+      const value = values[r * axis.length + c];
+      if (!isNaN(value)) {
+        leaf[axis[c]] = value;
+      }
+    }
+    const path = rows[r];
+    if (path.length === 0) {
+      return leaf;
+    }
+    let node = result;
+    for (let i = 0; i < path.length - 1; i++) {
+      if (!node[path[i]]) {
+        node[path[i]] = {};
+      }
+      node = node[path[i]] as DenseNested;
+    }
+    node[path[path.length - 1]] = leaf;
+  }
+
+  return result;
+};
+
+// name: JSON 파일명에서 .json을 뺀 이름 (예: 'company_hourly_aggregated')
+// 브라우저가 DecompressionStream을 지원하면 미리 압축된 .gz 파일을 받는다
+export const fetchDenseArtifact = async (name: string): Promise<DenseArtifact> => {
+  const url = `/agg_data/${name}.dense.bin`;
+  const Decompression = (globalThis as any).DecompressionStream;
+
+  if (Decompression) {
+    const response = await fetch(`${url}.gz`);
+    if (response.ok && response.body) {
+      const stream = response.body.pipeThrough(new Decompression('gzip'));
+      return decodeDenseArtifact(await new Response(stream).arrayBuffer());
+    }
+  }
+
+  const response = await fetch(url);
+  if (!response.ok) {
+    throw new Error(`${url} 로드 실패: ${response.status}`);
+  }
+  return decodeDenseArtifact(await response.arrayBuffer());
+};
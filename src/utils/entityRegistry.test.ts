@@ -0,0 +1,41 @@
+import * as fs from 'fs';
+import * as path from 'path';
+import { dataNameLookup, EntityRegistry, withEntityNames } from './entityRegistry';
+
+const aggDataDir = path.join(__dirname, '..', '..', 'public', 'agg_data');
+
+const readJson = (fileName: string) =>
+  JSON.parse(fs.readFileSync(path.join(aggDataDir, fileName), 'utf-8'));
+
+describe('entityRegistry', () => {
+  const registry: EntityRegistry = readJson('entities.json');
+
+  it.each([
+    ['monthly_aggregated_original.json', ['solar', 'wind']],
+    ['plant_hourly_aggregated_original.json', ['solar', 'wind']],
+    ['plant_capacity.json', ['solar', 'wind']],
+  ])('resolves every plant key in %s', (fileName, types) => {
+    const data = readJson(fileName);
+    (types as string[]).forEach(type => {
+      Object.keys(data[type])
+        .filter(key => key !== 'total')
+        .forEach(key => expect(registry[key]?.type).toBe(type));
+    });
+  });
+
+  it('resolves every company key in company_monthly_aggregated_original.json', () => {
+    const data = readJson('company_monthly_aggregated_original.json');
+    Object.keys(data).forEach(key => expect(registry[key]?.type).toBe('demand'));
+  });
+
+  it('renames one level of ID keys and keeps reserved keys', () => {
+    const sample: EntityRegistry = {
+      '1': { type: 'solar', name: '육상태양광', data_name: 'solar_plant1' },
+    };
+    const named = withEntityNames({ '1': { '2024-01': 1.5 }, total: { '2024-01': 1.5 } }, sample);
+
+    expect(named).toEqual({ '육상태양광': { '2024-01': 1.5 }, total: { '2024-01': 1.5 } });
+    expect(withEntityNames(undefined, sample)).toBeUndefined();
+    expect(dataNameLookup(sample)).toEqual({ solar_plant1: '육상태양광' });
+  });
+});
@@ -0,0 +1,42 @@
+// agg_data/entities.json (scripts/entity_registry.py) 엔티티 ID -> 표시 이름
+// agg_data 산출물의 발전소/기업 키는 엔티티 ID 문자열("1", "2", ...)이다
+
+export interface EntityInfo {
+  type: 'solar' | 'wind' | 'demand';
+  name: string;
+  data_name: string;
+}
+
+export type EntityRegistry = { [id: string]: EntityInfo };
+
+export const fetchEntityRegistry = async (): Promise<EntityRegistry> => {
+  const response = await fetch('/agg_data/entities.json');
+  if (!response.ok) {
+    throw new Error('entities.json을 불러올 수 없습니다.');
+  }
+  return response.json();
+};
+
+// 한 단계의 엔티티 ID 키를 표시 이름으로 변경 ('total' 등 등록되지 않은 키는 그대로)
+export const withEntityNames = <T>(
+  entities: { [key: string]: T } | undefined,
+  registry: EntityRegistry
+): { [key: string]: T } | undefined => {
+  if (!entities) {
+    return entities;
+  }
+  const named: { [key: string]: T } = {};
+  Object.entries(entities).forEach(([key, value]) => {
+    named[registry[key]?.name ?? key] = value;
+  });
+  return named;
+};
+
+// 원본 CSV 행의 plant_name(data_name) -> 표시 이름
+export const dataNameLookup = (registry: EntityRegistry): { [dataName: string]: string } => {
+  const lookup: { [dataName: string]: string } = {};
+  Object.values(registry).forEach(entity => {
+    lookup[entity.data_name] = entity.name;
+  });
+  return lookup;
+};
@@ -7,32 +7,37 @@ const monthlyData = JSON.parse(fs.readFileSync(path.join(__dirname, 'public/agg_
 const hourlyData = JSON.parse(fs.readFileSync(path.join(__dirname, 'public/agg_data/plant_hourly_aggregated_original.json'), 'utf8'));
 const companyData = JSON.parse(fs.readFileSync(path.join(__dirname, 'public/agg_data/company_monthly_aggregated_original.json'), 'utf8'));
 
+// 발전소/기업 키는 엔티티 ID이므로 표시 이름은 entities.json에서 찾는다
+const entities = JSON.parse(fs.readFileSync(path.join(__dirname, 'public/agg_data/entities.json'), 'utf8'));
+const nameOf = id => (entities[id] ? entities[id].name : id);
+
 console.log('=== PlantChart Monthly Data Structure ===');
-console.log('Solar plants:', Object.keys(monthlyData.solar));
-console.log('Wind plants:', Object.keys(monthlyData.wind));
+console.log('Solar plants:', Object.keys(monthlyData.solar).map(nameOf));
+console.log('Wind plants:', Object.keys(monthlyData.wind).map(nameOf));
 
 // Check if data exists for each month
-const solarPlant1 = monthlyData.solar['육상태양광'];
+const solarPlant1Id = Object.keys(monthlyData.solar).find(key => key !== 'total');
+const solarPlant1 = monthlyData.solar[solarPlant1Id];
 if (solarPlant1) {
-  console.log('\n육상태양광 monthly data:', Object.keys(solarPlant1).length, 'months');
+  console.log(`\n${nameOf(solarPlant1Id)} monthly data:`, Object.keys(solarPlant1).length, 'months');
   console.log('Sample:', Object.entries(solarPlant1).slice(0, 3));
 }
 
 console.log('\n=== PlantChart Hourly Data Structure ===');
-console.log('Solar plants:', Object.keys(hourlyData.solar));
-console.log('Wind plants:', Object.keys(hourlyData.wind));
+console.log('Solar plants:', Object.keys(hourlyData.solar).map(nameOf));
+console.log('Wind plants:', Object.keys(hourlyData.wind).map(nameOf));
 
 // Check if data exists for each hour
-const solarPlant1Hourly = hourlyData.solar['육상태양광'];
+const solarPlant1Hourly = hourlyData.solar[solarPlant1Id];
 if (solarPlant1Hourly) {
-  console.log('\n육상태양광 hourly data:', Object.keys(solarPlant1Hourly).length, 'hours');
+  console.log(`\n${nameOf(solarPlant1Id)} hourly data:`, Object.keys(solarPlant1Hourly).length, 'hours');
   console.log('Sample hours 6-12:', Object.entries(solarPlant1Hourly).slice(6, 13));
 }
 
 console.log('\n=== CompanyDemandChart Data Structure ===');
 const companies = Object.keys(companyData).filter(k => k !== 'total');
 console.log('Number of companies:', companies.length);
-console.log('First 5 companies:', companies.slice(0, 5));
+console.log('First 5 companies:', companies.slice(0, 5).map(nameOf));
 
 // Check company data structure
 if (companies.length > 0) {
@@ -43,25 +48,21 @@ if (companies.length > 0) {
 
 // Verify data transformation for PlantChart
 console.log('\n=== Simulating PlantChart Data Transformation ===');
-const daysInMonth = {
-  '1월': 31, '2월': 29, '3월': 31, '4월': 30, '5월': 31, '6월': 30,
-  '7월': 31, '8월': 31, '9월': 30, '10월': 31, '11월': 30, '12월': 31
-};
-
+// 월 키("YYYY-MM")는 데이터에서 구한다
+const monthKeys = Object.keys(monthlyData.solar.total).sort();
 const monthlyChartData = [];
-const monthLabels = ['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월'];
 
-for (const monthNum of ['01', '02', '03', '04', '05', '06', '07', '08', '09', '10', '11', '12']) {
-  const monthLabel = parseInt(monthNum) + '월';
-  const monthKey = '2024-' + monthNum;
+for (const monthKey of monthKeys) {
+  const [year, month] = monthKey.split('-').map(Number);
+  const monthLabel = month + '월';
+  const days = new Date(year, month, 0).getDate();
   const monthData = { period: monthLabel };
   
   // Add solar plants
   if (monthlyData.solar) {
     Object.entries(monthlyData.solar).forEach(([plantName, plantData]) => {
       if (plantName !== 'total' && plantData[monthKey] !== undefined) {
-        const days = daysInMonth[monthLabel] || 30;
-        monthData[plantName] = plantData[monthKey] / (days * 24); // Average GW
+        monthData[nameOf(plantName)] = plantData[monthKey] / (days * 24); // Average GW
       }
     });
   }
@@ -70,8 +71,7 @@ for (const monthNum of ['01', '02', '03', '04', '05', '06', '07', '08', '09', '1
   if (monthlyData.wind) {
     Object.entries(monthlyData.wind).forEach(([plantName, plantData]) => {
       if (plantName !== 'total' && plantData[monthKey] !== undefined) {
-        const days = daysInMonth[monthLabel] || 30;
-        monthData[plantName] = plantData[monthKey] / (days * 24); // Average GW
+        monthData[nameOf(plantName)] = plantData[monthKey] / (days * 24); // Average GW
       }
     });
   }
@@ -96,14 +96,14 @@ for (let hour = 0; hour < 24; hour++) {
   // Add solar plants
   if (hourlyData.solar) {
     Object.entries(hourlyData.solar).forEach(([plantName, plantData]) => {
-      hourData[plantName] = (plantData[hourKey] || 0) / 1000; // GWh to GW
+      hourData[nameOf(plantName)] = (plantData[hourKey] || 0) / 1000; // GWh to GW
     });
   }
   
   // Add wind plants
   if (hourlyData.wind) {
     Object.entries(hourlyData.wind).forEach(([plantName, plantData]) => {
-      hourData[plantName] = (plantData[hourKey] || 0) / 1000; // GWh to GW
+      hourData[nameOf(plantName)] = (plantData[hourKey] || 0) / 1000; // GWh to GW
     });
   }
   
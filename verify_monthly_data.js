@@ -5,6 +5,10 @@ const path = require('path');
 // Load the aggregated JSON data
 const monthlyData = JSON.parse(fs.readFileSync(path.join(__dirname, 'public/agg_data/monthly_aggregated_original.json'), 'utf8'));
 
+// 발전소/기업 키는 엔티티 ID이므로 표시 이름은 entities.json에서 찾는다
+const entities = JSON.parse(fs.readFileSync(path.join(__dirname, 'public/agg_data/entities.json'), 'utf8'));
+const nameOf = id => (entities[id] ? entities[id].name : id);
+
 console.log('=== 월별 데이터 검증 ===\n');
 
 // 태양광 발전소 검증
@@ -12,7 +16,7 @@ console.log('태양광 발전소:');
 for (const [plantName, plantData] of Object.entries(monthlyData.solar)) {
   if (plantName === 'total') continue;
   const months = Object.keys(plantData);
-  console.log(`  ${plantName}: ${months.length}개월 데이터`);
+  console.log(`  ${nameOf(plantName)}: ${months.length}개월 데이터`);
   if (months.length !== 12) {
     console.log(`    ⚠️ 경고: 12개월이 아닌 ${months.length}개월만 있음`);
     console.log(`    존재하는 월: ${months.join(', ')}`);
@@ -26,7 +30,7 @@ console.log('\n풍력 발전소:');
 for (const [plantName, plantData] of Object.entries(monthlyData.wind)) {
   if (plantName === 'total') continue;
   const months = Object.keys(plantData);
-  console.log(`  ${plantName}: ${months.length}개월 데이터`);
+  console.log(`  ${nameOf(plantName)}: ${months.length}개월 데이터`);
   if (months.length !== 12) {
     console.log(`    ⚠️ 경고: 12개월이 아닌 ${months.length}개월만 있음`);
     console.log(`    존재하는 월: ${months.join(', ')}`);
@@ -38,8 +42,7 @@ for (const [plantName, plantData] of Object.entries(monthlyData.wind)) {
 
 // 월별 합계 검증
 console.log('\n월별 합계 데이터:');
-const allMonths = ['2024-01', '2024-02', '2024-03', '2024-04', '2024-05', '2024-06', 
-                   '2024-07', '2024-08', '2024-09', '2024-10', '2024-11', '2024-12'];
+const allMonths = Object.keys(monthlyData.demand).sort();
 
 for (const month of allMonths) {
   const solarTotal = monthlyData.solar.total[month] || 0;